@@ -0,0 +1,48 @@
+"""Benchmark Object truthiness and diffs."""
+
+import sys
+import timeit
+import typing
+
+import fgr
+
+
+class Record(fgr.Object):
+    """A record with many fields."""
+
+    __annotations__ = {
+        f'field_{chr(97 + i)}': fgr.Field[int]  # type: ignore[valid-type]
+        for i
+        in range(20)
+        }
+    locals().update({f'field_{chr(97 + i)}': i for i in range(20)})
+    tags: fgr.Field[list[str]] = []
+    created_at: fgr.Field[str] = 'today'
+
+
+def previous_sub(a: Record, b: Record) -> dict[str, typing.Any]:
+    """Diff as previously computed (by key)."""
+
+    diff = {}
+    for field in a.__fields__:
+        if a[field] != b[field]:
+            diff[field] = b[field]
+    return diff
+
+
+if __name__ == '__main__':
+    n = 50_000
+    default = Record()
+    changed_first = Record(field_a=-1)
+    changed_last = Record(created_at='tomorrow')
+    for label, fn in (
+        ('bool (previous)', lambda: bool(previous_sub(default, Record()))),
+        ('bool (default)', lambda: bool(default)),
+        ('bool (first)', lambda: bool(changed_first)),
+        ('bool (last)', lambda: bool(changed_last)),
+        ('sub (previous)', lambda: previous_sub(default, changed_last)),
+        ('sub', lambda: default - changed_last),
+        ('iter_diff (next)', lambda: next(default.iter_diff(changed_first))),
+        ):
+        seconds = min(timeit.repeat(fn, number=n, repeat=5))
+        sys.stdout.write(f'{label:<18} {seconds / n * 1e9:8.1f} ns\n')
@@ -0,0 +1,71 @@
+"""Benchmark casing conversions over realistic API field names."""
+
+import sys
+import timeit
+
+import fgr
+
+SNAKE_CASE_NAMES = (
+    'id',
+    'account_id',
+    'created_at',
+    'updated_at',
+    'first_name',
+    'last_name',
+    'email_address',
+    'phone_number',
+    'is_active',
+    'is_email_verified',
+    'billing_address_line_1',
+    'billing_address_line_2',
+    'postal_code',
+    'country_code',
+    'default_payment_method_id',
+    'http_status_code',
+    'api_version',
+    'x_request_id',
+    'total_amount_cents',
+    'last_login_ip_address',
+    )
+CAMEL_CASE_NAMES = tuple(
+    fgr.core.utils.to_camel_case(name)
+    for name
+    in SNAKE_CASE_NAMES
+    )
+
+
+if __name__ == '__main__':
+    n = 5_000
+    utils = fgr.core.utils
+    for label, names, functions in (
+        (
+            'to_camel_case',
+            SNAKE_CASE_NAMES,
+            (
+                ('per-character loop', utils._to_camel_case),
+                ('uncached', utils.to_camel_case.__wrapped__),
+                ('memoized', utils.to_camel_case),
+                ),
+            ),
+        (
+            'camel_case_to_snake_case',
+            CAMEL_CASE_NAMES,
+            (
+                ('per-character loop', utils._camel_case_to_snake_case),
+                ('uncached', utils.camel_case_to_snake_case.__wrapped__),
+                ('memoized', utils.camel_case_to_snake_case),
+                ),
+            ),
+        ):
+        for name, fn in functions:
+            seconds = min(
+                timeit.repeat(
+                    lambda: [fn(s) for s in names],  # noqa: B023
+                    number=n,
+                    repeat=5
+                    )
+                )
+            sys.stdout.write(
+                f'{label:<26} {name:<20} '
+                f'{seconds / n / len(names) * 1e9:8.1f} ns / name\n'
+                )
@@ -0,0 +1,48 @@
+"""Benchmark class and instance attribute access on derivatives."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    tags: fgr.Field[list[str]] = []
+
+
+class SlottedPet:
+    """A plain slotted pet, for reference."""
+
+    __slots__ = (
+        'age',
+        )
+
+    reference = 'pet'
+
+
+if __name__ == '__main__':
+    n = 500_000
+    pet = Pet(id='a1', name='fido', age=3)
+    slotted = SlottedPet()
+    slotted.age = 3
+    records = [{'id': f'a{i}', 'name': 'fido', 'age': i} for i in range(1_000)]
+    for label, stmt, number in (
+        ('Pet.age (Field)', lambda: Pet.age, n),
+        ('Pet.__fields__', lambda: Pet.__fields__, n),
+        ('Pet.__cache__', lambda: Pet.__cache__, n),
+        ('Pet.to_dict (method)', lambda: Pet.to_dict, n),
+        ('Pet.reference', lambda: Pet.reference, n),
+        ('SlottedPet.reference', lambda: SlottedPet.reference, n),
+        ('pet.age (value)', lambda: pet.age, n),
+        ('slotted.age (value)', lambda: slotted.age, n),
+        ('Pet.age > 1', lambda: Pet.age > 1, n // 10),
+        ('Pet.from_records (1k)', lambda: Pet.from_records(records), 100),
+        ('Pet.to_dict()', pet.to_dict, n // 10),
+        ):
+        seconds = min(timeit.repeat(stmt, number=number, repeat=5))
+        sys.stdout.write(f'{label:<24} {seconds / number * 1e9:10.1f} ns\n')
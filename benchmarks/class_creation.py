@@ -0,0 +1,106 @@
+"""Benchmark defining many Object derivatives (as from schemas)."""
+
+import datetime
+import enum
+import sys
+import time
+import typing
+
+import fgr
+
+
+class Status(enum.Enum):
+    """A status."""
+
+    active = 'active'
+    inactive = 'inactive'
+
+
+class Mixin(fgr.Object):
+    """A mixin shared by some of the generated classes."""
+
+    created_at: fgr.Field[datetime.datetime] = None
+    updated_at: fgr.Field[datetime.datetime] = None
+
+
+def letters(n: int) -> str:
+    """Return `n` spelled in lowercase letters (field names avoid digits)."""
+
+    chars = ''
+    while True:
+        n, r = divmod(n, 26)
+        chars = chr(ord('a') + r) + chars
+        if not n:
+            return chars
+
+
+TYPES = (
+    (str, 'abc'),
+    (int, 0),
+    (bool, False),
+    (float, 0.0),
+    (list[str], []),
+    (dict[str, int], {}),
+    (typing.Optional[str], None),
+    (datetime.date, None),
+    )
+
+
+def namespace(i: int, n_fields: int) -> dict[str, typing.Any]:
+    """Return a class namespace with `n_fields` fields."""
+
+    annotations: dict[str, typing.Any] = {}
+    values: dict[str, typing.Any] = {}
+    for j in range(n_fields):
+        tp, default = TYPES[j % len(TYPES)]
+        name = f'schema_{letters(i)}_field_{letters(j)}'
+        annotations[name] = fgr.Field[tp]  # type: ignore[valid-type]
+        if j % 5 == 4:
+            values[name] = fgr.Field(default='active', enum=Status)
+        elif j % 3:
+            values[name] = default
+    return {
+        '__annotations__': annotations,
+        '__module__': __name__,
+        '__qualname__': f'Schema{i}',
+        '__doc__': f'Generated schema {i}.',
+        **values,
+        }
+
+
+def define(n_classes: int, n_fields: int) -> list[type[fgr.Object]]:
+    """Define `n_classes` derivatives, one in ten also with `Mixin`."""
+
+    return [
+        fgr.core.meta.Meta(
+            f'Schema{i}',
+            (fgr.Object, Mixin) if i % 10 == 0 else (fgr.Object, ),
+            namespace(i, n_fields)
+            )
+        for i
+        in range(n_classes)
+        ]
+
+
+if __name__ == '__main__':
+    n_classes, n_fields = 500, 30
+    timings: dict[str, float] = {}
+
+    def hook(cls: fgr.core.meta.Meta, phases: dict[str, float]) -> None:
+        for phase, seconds in phases.items():
+            timings[phase] = timings.get(phase, 0.0) + seconds
+
+    best = float('inf')
+    for _ in range(3):
+        timings.clear()
+        fgr.core.meta.add_class_creation_hook(hook)
+        start = time.perf_counter()
+        define(n_classes, n_fields)
+        best = min(best, time.perf_counter() - start)
+        fgr.core.meta.remove_class_creation_hook(hook)
+    sys.stdout.write(
+        f'{n_classes} classes x {n_fields} fields: {best * 1e3:8.1f} ms '
+        f'({best / n_classes * 1e6:.0f} us / class)\n'
+        )
+    for phase, seconds in sorted(timings.items(), key=lambda kv: -kv[1]):
+        sys.stdout.write(f'  {phase:<20} {seconds * 1e3:8.1f} ms\n')
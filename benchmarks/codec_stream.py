@@ -0,0 +1,85 @@
+"""Benchmark peak memory of streaming vs. materialized JSON encoding."""
+
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+import fgr
+
+
+class Toy(fgr.Object):
+    """A toy."""
+
+    name: fgr.Field[str]
+    tags: fgr.Field[list[str]] = []
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    toys: fgr.Field[list[Toy]] = []
+
+
+class Shelter(fgr.Object):
+    """A shelter."""
+
+    name: fgr.Field[str]
+    pets: fgr.Field[list[Pet]] = []
+
+
+def peak(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    start = timeit.default_timer()
+    fn()
+    seconds = timeit.default_timer() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_bytes / 2 ** 20, seconds
+
+
+if __name__ == '__main__':
+    shelter = Shelter(
+        name='shelter',
+        pets=[
+            Pet(
+                id=str(i),
+                name=f'pet {i}',
+                toys=[
+                    Toy(name=f'toy {j}', tags=['chewy', 'squeaky'])
+                    for j
+                    in range(5)
+                    ]
+                )
+            for i
+            in range(20_000)
+            ]
+        )
+    with open(os.devnull, 'w') as devnull:
+        for label, fn in (
+            (
+                'json.dump(to_dict())',
+                lambda: json.dump(
+                    shelter.to_dict(),
+                    devnull,
+                    default=fgr.core.codec.encode
+                    )
+                ),
+            (
+                'json.dumps(to_dict())',
+                lambda: devnull.write(
+                    json.dumps(
+                        shelter.to_dict(),
+                        default=fgr.core.codec.encode
+                        )
+                    )
+                ),
+            ('codec.dump', lambda: fgr.core.codec.dump(shelter, devnull)),
+            ):
+            mib, seconds = peak(fn)
+            sys.stdout.write(
+                f'{label:<24} peak {mib:8.2f} MiB {seconds:7.3f} s\n'
+                )
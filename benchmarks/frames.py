@@ -0,0 +1,51 @@
+"""Benchmark ObjectFrame memory footprint against a list of Objects."""
+
+import sys
+import timeit
+import tracemalloc
+
+import fgr
+
+
+class Reading(fgr.Object):
+    """A sensor reading."""
+
+    sensor_name: fgr.Field[str]
+    sequence_id: fgr.Field[int] = 0
+    value: fgr.Field[float] = 0.0
+    is_valid: fgr.Field[bool] = True
+
+
+def measure(fn):
+    tracemalloc.start()
+    result = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+if __name__ == '__main__':
+    n = 200_000
+    objects, objects_size = measure(
+        lambda: [
+            Reading(
+                sensor_name=f'sensor-{i % 16}',
+                sequence_id=i,
+                value=i / 3,
+                is_valid=bool(i % 2),
+                )
+            for i
+            in range(n)
+            ]
+        )
+    frame, frame_size = measure(
+        lambda: fgr.core.frames.ObjectFrame(Reading, objects)
+        )
+    sys.stdout.write(
+        f'list[Reading]        {objects_size / n:7.1f} bytes / object\n'
+        f'ObjectFrame[Reading] {frame_size / n:7.1f} bytes / object\n'
+        )
+    seconds = min(timeit.repeat(lambda: list(frame), number=1, repeat=3))
+    sys.stdout.write(
+        f'materialize          {seconds / n * 1e6:7.3f} us / object\n'
+        )
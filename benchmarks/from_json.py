@@ -0,0 +1,59 @@
+"""Benchmark hydrating objects from JSON."""
+
+import json
+import sys
+import timeit
+
+import fgr
+
+
+class Toy(fgr.Object):
+    """A toy."""
+
+    name: fgr.Field[str]
+    price: fgr.Field[float] = 0.0
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    toys: fgr.Field[list[Toy]] = []
+
+
+def parse_dtype(data: str) -> Pet:
+    """Hydrate as `json.loads` -> dict -> per field `Field.parse_dtype`."""
+
+    return Pet(
+        {
+            k: Pet[k].parse_dtype(v)
+            for k, v
+            in json.loads(data).items()
+            }
+        )
+
+
+if __name__ == '__main__':
+    n = 20_000
+    lines = [
+        json.dumps(
+            {
+                'id': f'a{i}',
+                'name': 'fido',
+                'age': i % 15,
+                'toys': [{'name': f'toy {j}', 'price': j} for j in range(3)],
+                }
+            )
+        for i
+        in range(n)
+        ]
+    assert [parse_dtype(line) for line in lines] == Pet.from_json_lines(lines)
+    for label, fn in (
+        ('Pet(json.loads) (no coercion)', lambda: [Pet(json.loads(line)) for line in lines]),
+        ('Field.parse_dtype', lambda: [parse_dtype(line) for line in lines]),
+        ('Pet.from_json_lines', lambda: Pet.from_json_lines(lines)),
+        ):
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        sys.stdout.write(f'{label:<30} {seconds / n * 1e6:7.3f} us / object\n')
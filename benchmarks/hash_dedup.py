@@ -0,0 +1,44 @@
+"""Benchmark set-based dedup of Objects (by their hash_fields)."""
+
+import sys
+import time
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    tags: fgr.Field[list[str]] = []
+
+
+class StrHashPet(Pet):
+    """A pet, hashed by its string form (as previously)."""
+
+
+class CachedPet(Pet, cache_hash=True):
+    """A pet, with its hash cached."""
+
+
+StrHashPet.__hash__ = fgr.core.meta._hash_str  # type: ignore[assignment, method-assign]
+
+
+if __name__ == '__main__':
+    n = 1_000_000
+    for cls in (StrHashPet, Pet, CachedPet):
+        pets = [
+            cls(id=f'pet-{i % (n // 4)}', name='fido', age=i % 20)
+            for i
+            in range(n)
+            ]
+        for label in ('set', 'set (again)'):
+            start = time.perf_counter()
+            unique = len(set(pets))
+            seconds = time.perf_counter() - start
+            sys.stdout.write(
+                f'{cls.__name__:<10} {label:<12} {seconds * 1e3:8.1f} ms '
+                f'({unique} unique of {n})\n'
+                )
@@ -0,0 +1,56 @@
+"""Benchmark indexed query execution against full scans."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int]
+    tags: fgr.Field[list] = []
+
+
+if __name__ == '__main__':
+    n = 100_000
+    pets = [
+        Pet(id=f'a{i}', name=f'pet{i % 1000}', age=i % 20, tags=[f't{i % 50}'])
+        for i
+        in range(n)
+        ]
+    collection = fgr.core.indexes.IndexedCollection(
+        Pet,
+        pets,
+        hash_fields=('id', 'name', 'tags'),
+        sorted_fields=('age', )
+        )
+    for label, q in (
+        ('id ==', Pet.id_ == 'a500'),
+        ('name ==', Pet.name == 'pet7'),
+        ('tags <<', Pet.tags << 't3'),
+        ('age >', Pet.age > 18),
+        ('name == & age >=', (Pet.name == 'pet7') & (Pet.age >= 5)),
+        ):
+        scan = min(
+            timeit.repeat(
+                lambda q=q: fgr.core.engine.execute(q, pets),
+                number=1,
+                repeat=3
+                )
+            )
+        indexed = min(
+            timeit.repeat(
+                lambda q=q: collection.query(q),
+                number=1,
+                repeat=3
+                )
+            )
+        sys.stdout.write(
+            f'{label:<18} scan {scan * 1e3:8.3f} ms'
+            f' | {collection.explain(q):<34} {indexed * 1e3:8.3f} ms'
+            f' ({scan / indexed:7.1f}x)\n'
+            )
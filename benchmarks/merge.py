@@ -0,0 +1,73 @@
+"""Benchmark merging partial records into an indexed collection."""
+
+import sys
+import time
+import timeit
+
+import fgr
+
+
+class Account(fgr.Object):
+    """An account."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str] = None
+    balance: fgr.Field[int] = 0
+    tags: fgr.Field[list] = []
+
+
+def accounts(n: int) -> list[Account]:
+    return [Account(id=str(i), name=f'acct {i}') for i in range(n)]
+
+
+def updates(n: int) -> list[dict]:
+    return [
+        {'id': str(i * 7 % (n + n // 10)), 'balance': i}
+        for i
+        in range(n)
+        ]
+
+
+def previous_merge(
+    collection: fgr.core.indexes.IndexedCollection[Account],
+    records: list[dict]
+    ) -> None:
+    """Merge as previously required (new object per record and match)."""
+
+    for record in records:
+        partial = Account(record)
+        matches = collection.query(Account.id_ == partial.id_)
+        if matches:
+            collection.remove(matches[0])
+            collection.add(matches[0] >> partial)
+        else:
+            collection.add(partial)
+
+
+if __name__ == '__main__':
+    n = 100_000
+    records = updates(n)
+    for label, fn in (
+        ('previous', previous_merge),
+        ('merge', lambda c, r: c.merge(r)),
+        ):
+        collection = fgr.core.indexes.IndexedCollection(
+            Account,
+            accounts(n),
+            sorted_fields=('balance', )
+            )
+        start = time.perf_counter()
+        fn(collection, records)
+        seconds = time.perf_counter() - start
+        sys.stdout.write(f'{label:<18} {seconds:8.3f} s ({len(collection)})\n')
+
+    a, b = Account(id='1'), Account(id='1', balance=5)
+    for label, fn in (
+        ('>>', lambda: a >> b),
+        ('>>=', lambda: a.__irshift__(b)),
+        ('<<', lambda: a << b),
+        ('<<=', lambda: a.__ilshift__(b)),
+        ):
+        number = 100_000
+        seconds = min(timeit.repeat(fn, number=number, repeat=5))
+        sys.stdout.write(f'{label:<18} {seconds / number * 1e9:8.1f} ns\n')
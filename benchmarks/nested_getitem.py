@@ -0,0 +1,67 @@
+"""Benchmark dict style reads of nested Objects."""
+
+import inspect
+import sys
+import timeit
+
+import fgr
+
+
+class Flea(fgr.Object):
+    """A nuisance."""
+
+    name: fgr.Field[str] = 'FLEA'
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    name: fgr.Field[str] = 'Fido'
+    best_flea: fgr.Field[Flea] = Flea
+    fleas: fgr.Field[list[Flea]] = lambda: [Flea(), Flea()]
+
+
+def frame_getitem(self, key):
+    """Reference: previous, frame inspecting, Base.__getitem__."""
+
+    if (k := fgr.core.utils.key_for(self, key)):
+        value = getattr(self, k)
+        if (
+            (
+                (is_obj := isinstance(value, fgr.core.meta.Base))
+                or fgr.core.utils.is_obj_array_type(value)
+                )
+            and (callers := inspect.currentframe().f_back.f_code.co_names)
+            and 'dict' in callers
+            and (
+                callers[0] == 'dict'
+                or callers[callers.index('dict') - 1] != 'to_dict'
+                )
+            ):
+            if is_obj:
+                return value.to_dict()
+            else:
+                return value.__class__(obj.to_dict() for obj in value)
+        else:
+            return value
+    else:
+        raise KeyError(key)
+
+
+if __name__ == '__main__':
+    n = 200_000
+    pet = Pet()
+    for label, fn in (
+        ('frame inspecting: primitive', lambda: frame_getitem(pet, 'name')),
+        ('frame inspecting: nested', lambda: frame_getitem(pet, 'best_flea')),
+        ('frame inspecting: array', lambda: frame_getitem(pet, 'fleas')),
+        ('frame free: primitive', lambda: pet['name']),
+        ('frame free: nested', lambda: pet['best_flea']),
+        ('frame free: array', lambda: pet['fleas']),
+        ):
+        seconds = min(timeit.repeat(fn, number=n, repeat=3))
+        sys.stdout.write(f'{label:<30} {seconds / n * 1e9:8.1f} ns / read\n')
+    seconds = min(timeit.repeat(lambda: dict(pet), number=n // 10, repeat=3))
+    sys.stdout.write(
+        f'{"dict(Pet)":<30} {seconds / n * 1e7:8.3f} us / object\n'
+        )
@@ -0,0 +1,75 @@
+"""Benchmark Object instantiation."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    _alternate_id: fgr.Field[str]
+
+    name: fgr.Field[str]
+    type: fgr.Field[str]
+    in_: fgr.Field[str]
+    is_tail_wagging: fgr.Field[bool] = True
+    tags: fgr.Field[list[str]] = []
+
+
+class SlottedPet:
+    """A plain slotted pet, for reference."""
+
+    __slots__ = (
+        'id_',
+        '_alternate_id',
+        'name',
+        'type',
+        'in_',
+        'is_tail_wagging',
+        'tags',
+        )
+
+    def __init__(
+        self,
+        id_=None,
+        _alternate_id=None,
+        name=None,
+        type=None,
+        in_=None,
+        is_tail_wagging=True,
+        tags=None,
+        ):
+        self.id_ = id_
+        self._alternate_id = _alternate_id
+        self.name = name
+        self.type = type
+        self.in_ = in_
+        self.is_tail_wagging = is_tail_wagging
+        self.tags = [] if tags is None else tags
+
+
+def generic(**kwargs):
+    object_ = Pet.__new__(Pet)
+    fgr.core.meta.Base.__init__(object_, **kwargs)
+    return object_
+
+
+if __name__ == '__main__':
+    n = 100_000
+    row = {'id': 'a1', 'name': 'fido', 'type': 'dog'}
+    for label, fn in (
+        ('generic Base.__init__', lambda: generic(**row)),
+        ('compiled __init__', lambda: Pet(**row)),
+        ('compiled __init__ (dict)', lambda: Pet(row)),
+        (
+            'plain __slots__ class',
+            lambda: SlottedPet(id_='a1', name='fido', type='dog')
+            ),
+        ):
+        seconds = min(timeit.repeat(fn, number=n, repeat=3))
+        sys.stdout.write(
+            f'{label:<28} {seconds / n * 1e6:8.3f} us / object\n'
+            )
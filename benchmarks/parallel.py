@@ -0,0 +1,72 @@
+"""Benchmark mapping a function over Objects in a process pool."""
+
+import concurrent.futures
+import pickle
+import sys
+import time
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    weight: fgr.Field[float] = 1.0
+    is_good: fgr.Field[bool] = True
+
+
+def birthday(pet: Pet) -> Pet:
+    pet.age += 1
+    return pet
+
+
+if __name__ == '__main__':
+    n = 200_000
+    chunk_size = 1024
+    pets = [
+        Pet(id=f'pet-{i}', name='fido', age=i % 20, weight=i / 7)
+        for i
+        in range(n)
+        ]
+    chunk = pets[:chunk_size]
+    for label, payload in (
+        ('list', chunk),
+        ('frame', fgr.core.frames.ObjectFrame(Pet, chunk)),
+        ):
+        size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        sys.stdout.write(f'{label:<18} {size / chunk_size:6.1f} B/object\n')
+
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        list(executor.map(birthday, pets[:1000]))  # Warm up workers.
+        for label, fn in (
+            (
+                'executor.map',
+                lambda: executor.map(birthday, pets, chunksize=chunk_size)
+                ),
+            (
+                'map_objects',
+                lambda: fgr.core.parallel.map_objects(
+                    birthday,
+                    pets,
+                    chunk_size=chunk_size,
+                    executor=executor
+                    )
+                ),
+            (
+                'map_objects (any)',
+                lambda: fgr.core.parallel.map_objects(
+                    birthday,
+                    pets,
+                    chunk_size=chunk_size,
+                    ordered=False,
+                    executor=executor
+                    )
+                ),
+            ):
+            start = time.perf_counter()
+            count = sum(1 for _ in fn())
+            seconds = time.perf_counter() - start
+            sys.stdout.write(f'{label:<18} {seconds:8.3f} s ({count})\n')
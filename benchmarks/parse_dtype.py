@@ -0,0 +1,41 @@
+"""Benchmark coercing batches of values to a Field type."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Toy(fgr.Object):
+    """A toy."""
+
+    name: fgr.Field[str]
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    age: fgr.Field[int] = None
+    toys: fgr.Field[list[Toy]] = []
+    weight: fgr.Field[float | int] = None
+
+
+if __name__ == '__main__':
+    n = 100_000
+    batches = {
+        'age': [str(i % 15) if i % 2 else i % 15 for i in range(n)],
+        'toys': [[{'name': 'ball'}, {'name': 'rope'}]] * n,
+        'weight': [str(i / 4) if i % 2 else i / 4 for i in range(1, n + 1)],
+        }
+    for name, values in batches.items():
+        field = Pet[name]
+        coerce = field.coercer()
+        assert [field.parse_dtype(v) for v in values] == [coerce(v) for v in values]
+        for label, fn in (
+            ('Field.parse_dtype', lambda: [field.parse_dtype(v) for v in values]),  # noqa: B023
+            ('Field.coercer', lambda: [coerce(v) for v in values]),  # noqa: B023
+            ):
+            seconds = min(timeit.repeat(fn, number=1, repeat=3))
+            sys.stdout.write(
+                f'{name:<8} {label:<20} {seconds / n * 1e9:8.1f} ns / value\n'
+                )
@@ -0,0 +1,51 @@
+"""Benchmark pickle size and round-trip time of Objects."""
+
+import copy
+import pickle
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    tags: fgr.Field[list[str]] = []
+
+
+class StatePet(Pet):
+    """A pet, pickled by its state dict (as previously)."""
+
+
+StatePet.__reduce__ = object.__reduce__  # type: ignore[assignment, method-assign]
+
+
+if __name__ == '__main__':
+    n = 100_000
+    protocol = pickle.HIGHEST_PROTOCOL
+    for cls in (StatePet, Pet):
+        pets = [
+            cls(id=f'pet-{i}', name='fido', age=i % 20, tags=['good'])
+            for i
+            in range(n)
+            ]
+        dump = pickle.dumps(pets, protocol=protocol)
+        assert pickle.loads(dump) == pets
+        single = len(pickle.dumps(pets[0], protocol=protocol))
+        sys.stdout.write(
+            f'{cls.__name__:<10} {len(dump) / n:6.1f} B/object '
+            f'({single} B single)\n'
+            )
+        # timeit disables garbage collection, which otherwise
+        # dominates (and blurs) the time to load many objects.
+        for label, fn in (
+            ('dumps', lambda: pickle.dumps(pets, protocol=protocol)),  # noqa: B023
+            ('loads', lambda: pickle.loads(dump)),  # noqa: B023
+            ('deepcopy', lambda: copy.deepcopy(pets)),  # noqa: B023
+            ):
+            seconds = min(timeit.repeat(fn, number=1, repeat=3))
+            sys.stdout.write(f'{"":<10} {label:<8} {seconds:6.3f} s\n')
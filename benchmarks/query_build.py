@@ -0,0 +1,52 @@
+"""Benchmark construction of Query trees."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int]
+
+
+def chained(names: list[str]) -> fgr.core.query.Query:
+    q = Pet.name == names[0]
+    for name in names[1:]:
+        q = q | (Pet.name == name)
+    return q
+
+
+def built(names: list[str]) -> fgr.core.query.Query:
+    return fgr.core.query.or_(*(Pet.name == name for name in names))
+
+
+if __name__ == '__main__':
+    n = 100_000
+    for label, fn in (
+        ("Pet.name == 'x'", lambda: Pet.name == 'x'),
+        (
+            "(Pet.age > 1) & (Pet.name == 'x')",
+            lambda: (Pet.age > 1) & (Pet.name == 'x')
+            ),
+        ):
+        seconds = min(timeit.repeat(fn, number=n, repeat=3))
+        sys.stdout.write(f'{label:<36} {seconds / n * 1e6:7.3f} us\n')
+    for k in (1_000, 10_000):
+        names = [f'pet{i}' for i in range(k)]
+        for label, build in (('a | b | ...', chained), ('query.or_(...)', built)):
+            seconds = min(
+                timeit.repeat(
+                    lambda build=build, names=names: build(names),
+                    number=1,
+                    repeat=3
+                    )
+                )
+            sys.stdout.write(
+                f'{label:<16} {k:>6,} terms {seconds * 1e3:10.3f} ms'
+                f' ({len(build(names).or_):,} operands)\n'
+                )
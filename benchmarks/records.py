@@ -0,0 +1,43 @@
+"""Benchmark batch record hydration and serialization."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    _alternate_id: fgr.Field[str]
+
+    name: fgr.Field[str]
+    type: fgr.Field[str]
+    in_: fgr.Field[str]
+    is_tail_wagging: fgr.Field[bool] = True
+    tags: fgr.Field[list[str]] = []
+
+
+if __name__ == '__main__':
+    n = 100_000
+    records = [
+        {
+            'id': f'a{i}',
+            'alternateId': f'b{i}',
+            'name': 'fido',
+            'type': 'dog',
+            'isTailWagging': bool(i % 2),
+            }
+        for i
+        in range(n)
+        ]
+    pets = Pet.from_records(records)
+    for label, fn in (
+        ('per object: Pet(record)', lambda: [Pet(r) for r in records]),
+        ('batch: Pet.from_records', lambda: Pet.from_records(records)),
+        ('per object: to_dict', lambda: [p.to_dict(True) for p in pets]),
+        ('batch: Pet.to_records', lambda: Pet.to_records(pets, True)),
+        ):
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        sys.stdout.write(f'{label:<26} {seconds / n * 1e6:7.3f} us / object\n')
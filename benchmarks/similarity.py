@@ -0,0 +1,62 @@
+"""Benchmark indexed similarity search against full scans at 1M rows."""
+
+import random
+import sys
+import timeit
+
+import fgr
+
+
+if __name__ == '__main__':
+    n = 1_000_000
+    rng = random.Random(0)
+    syllables = ['ba', 'ko', 'ri', 'ne', 'tu', 'ma', 'lo', 'shi', 'van', 'der']
+    values = [
+        ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        + ' '
+        + ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 5)))
+        for _
+        in range(n)
+        ]
+    start = timeit.default_timer()
+    index = fgr.core.similarity.TrigramIndex()
+    index.extend(enumerate(values))
+    sys.stdout.write(
+        f'index {n:,} rows ({len(index.values):,} distinct)'
+        f' in {timeit.default_timer() - start:.1f} s\n'
+        )
+    score = fgr.core.similarity.score
+    for like, threshold in (
+        (values[123], 0.85),
+        (values[456], 0.6),
+        ('bakori nemashi', 0.5),
+        ):
+        scan = min(
+            timeit.repeat(
+                lambda like=like, threshold=threshold: [
+                    i
+                    for i, value
+                    in enumerate(values)
+                    if score(value, like) >= threshold
+                    ],
+                number=1,
+                repeat=1
+                )
+            )
+        indexed = min(
+            timeit.repeat(
+                lambda like=like, threshold=threshold: index.search(
+                    like,
+                    threshold
+                    ),
+                number=1,
+                repeat=3
+                )
+            )
+        sys.stdout.write(
+            f'{like!r:<26} >= {threshold:<4}'
+            f' {len(index.search(like, threshold)):>7,} matches'
+            f' | scan {scan:7.3f} s'
+            f' | index {indexed * 1e3:9.3f} ms'
+            f' ({scan / indexed:7.1f}x)\n'
+            )
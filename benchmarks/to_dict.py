@@ -0,0 +1,132 @@
+"""Benchmark Object.to_dict on a 20 field object with two nested objects."""
+
+import sys
+import timeit
+import typing
+
+import fgr
+
+
+class Address(fgr.Object):
+    """An address."""
+
+    street_name: fgr.Field[str] = '1 Main St'
+    city_name: fgr.Field[str] = 'Springfield'
+    postal_code: fgr.Field[str] = '12345'
+    unit_number: fgr.Field[typing.Optional[int]] = None
+
+
+class Owner(fgr.Object):
+    """An owner."""
+
+    owner_id: fgr.Field[str] = 'o1'
+    first_name: fgr.Field[str] = 'Jon'
+    last_name: fgr.Field[str] = 'Arbuckle'
+    home_address: fgr.Field[Address] = Address
+
+
+class Pet(fgr.Object):
+    """A pet with 20 fields."""
+
+    id_: fgr.Field[str] = 'a1'
+    _alternate_id: fgr.Field[str] = 'b1'
+    name: fgr.Field[str] = 'Garfield'
+    type_: fgr.Field[str] = 'cat'
+    in_: fgr.Field[str] = None
+    age_years: fgr.Field[int] = 7
+    weight_kg: fgr.Field[float] = 8.5
+    is_indoor: fgr.Field[bool] = True
+    is_tail_wagging: fgr.Field[bool] = False
+    color_name: fgr.Field[str] = 'orange'
+    breed_name: fgr.Field[str] = 'tabby'
+    favorite_food: fgr.Field[str] = 'lasagna'
+    microchip_id: fgr.Field[str] = 'mc123'
+    license_key: fgr.Field[str] = None
+    vet_name: fgr.Field[str] = 'Liz'
+    visits_count: fgr.Field[int] = 12
+    tags: fgr.Field[list[str]] = ['lazy', 'orange']
+    attributes: fgr.Field[dict[str, str]] = {'mood_level': 'grumpy'}
+    owner: fgr.Field[Owner] = Owner
+    best_friend_address: fgr.Field[Address] = Address
+
+
+def legacy_to_dict(self, camel_case=False, include_null=True):
+    """Reference: previous Base.to_dict."""
+
+    utils = fgr.core.utils
+    d = {
+        k: v
+        for k
+        in self.__fields__
+        if (v := self[k]) is not None
+        or (include_null and v is None)
+        }
+    dbo = {}
+    for k, v in d.items():
+        if isinstance(v, fgr.core.meta.Base):
+            dbo[k] = legacy_to_dict(v, camel_case, include_null)
+        elif isinstance(v, dict):
+            dbo[k] = {
+                (
+                    utils.to_camel_case(_k.strip('_'))
+                    if (camel_case and isinstance(_k, str))
+                    else _k
+                    ): (
+                        legacy_to_dict(_v, camel_case, include_null)
+                        if isinstance(_v, fgr.core.meta.Base)
+                        else _v
+                        )
+                for _k, _v
+                in v.items()
+                if utils.is_public_field(_k)
+                and (_v is not None if not include_null else True)
+                }
+        elif isinstance(v, typing.get_args(fgr.core.dtypes.Array)):
+            dbo[k] = v.__class__(
+                legacy_to_dict(_v, camel_case, include_null)
+                if isinstance(_v, fgr.core.meta.Base)
+                else _v
+                for _v
+                in v
+                if (_v is not None if not include_null else True)
+                )
+        else:
+            dbo[k] = v
+    if camel_case:
+        return {utils.to_camel_case(k.strip('_')): v for k, v in dbo.items()}
+    else:
+        return {k.rstrip('_'): v for k, v in dbo.items()}
+
+
+if __name__ == '__main__':
+    n = 20_000
+    pet = Pet()
+    for options in (
+        {'camel_case': False, 'include_null': True},
+        {'camel_case': True, 'include_null': False},
+        ):
+        assert legacy_to_dict(pet, **options) == pet.to_dict(**options)
+        legacy = min(
+            timeit.repeat(
+                lambda options=options: legacy_to_dict(pet, **options),
+                number=n,
+                repeat=3
+                )
+            )
+        compiled = min(
+            timeit.repeat(
+                lambda options=options: pet.to_dict(**options),
+                number=n,
+                repeat=3
+                )
+            )
+        sys.stdout.write(
+            ' '.join(
+                (
+                    f'{options!s:<44}',
+                    f'legacy {legacy / n * 1e6:7.2f} us,',
+                    f'compiled {compiled / n * 1e6:6.2f} us,',
+                    f'{legacy / compiled:5.1f}x\n',
+                    )
+                )
+            )
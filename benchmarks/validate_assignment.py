@@ -0,0 +1,44 @@
+"""Benchmark Object assignment with and without validation."""
+
+import sys
+import timeit
+
+import fgr
+
+
+class Pet(fgr.Object):
+    """A pet."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    is_tail_wagging: fgr.Field[bool] = True
+    tags: fgr.Field[list[str]] = []
+
+
+class ValidatedPet(fgr.Object, validate_assignment=True):
+    """A pet, validated on assignment."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    is_tail_wagging: fgr.Field[bool] = True
+    tags: fgr.Field[list[str]] = []
+
+
+if __name__ == '__main__':
+    n = 200_000
+    for cls in (Pet, ValidatedPet):
+        pet = cls(id='a1', name='fido')
+
+        def assign() -> None:
+            pet.age = 3  # noqa: B023
+
+        def init() -> None:
+            cls(id='a1', name='fido', age=3, tags=['good'])  # noqa: B023
+
+        for label, fn in (('assign', assign), ('init', init)):
+            seconds = min(timeit.repeat(fn, number=n, repeat=5))
+            sys.stdout.write(
+                f'{cls.__name__:<14} {label:<8} {seconds / n * 1e9:8.1f} ns\n'
+                )
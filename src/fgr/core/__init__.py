@@ -18,35 +18,51 @@ import fgr
 """
 
 __all__ = (
+    'caching',
     'codec',
     'constants',
     'dtypes',
+    'engine',
     'enums',
     'exceptions',
     '_fields',
     'fields',
+    'frames',
+    'indexes',
     'log',
     'meta',
     'modules',
     'objects',
+    'optimizer',
+    'parallel',
     'patterns',
     'query',
+    'similarity',
+    'sql',
     'utils',
     )
 
+from . import caching
 from . import codec
 from . import constants
 from . import dtypes
+from . import engine
 from . import enums
 from . import exceptions
 from . import _fields
 from . import fields
+from . import frames
+from . import indexes
 from . import log
 from . import meta
 from . import modules
 from . import objects
+from . import optimizer
+from . import parallel
 from . import patterns
 from . import query
+from . import similarity
+from . import sql
 from . import utils
 
 utils._resolve_remaining_type_refs()
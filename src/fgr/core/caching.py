@@ -0,0 +1,226 @@
+"""Query result caching."""
+
+__all__ = (
+    'CacheStats',
+    'QueryCache',
+    )
+
+import collections
+import threading
+import time
+import typing
+
+from . import constants
+from . import dtypes
+from . import meta
+from . import query
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    CACHE_MAXSIZE = 1024
+
+
+ResultType = typing.TypeVar('ResultType')
+
+
+class CacheStats:
+    """Hit / miss statistics for a `QueryCache`."""
+
+    __slots__ = (
+        'evictions',
+        'expirations',
+        'hits',
+        'misses',
+        )
+
+    def __init__(self) -> None:
+        self.evictions = 0
+        self.expirations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return ''.join(
+            (
+                f'{self.__class__.__name__}(',
+                f'hits={self.hits}, ',
+                f'misses={self.misses}, ',
+                f'evictions={self.evictions}, ',
+                f'expirations={self.expirations})',
+                )
+            )
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to lookups (`0.0` if none)."""
+
+        if (lookups := self.hits + self.misses):
+            return self.hits / lookups
+        return 0.0
+
+
+class QueryCache(typing.Generic[ResultType]):
+    """
+    Thread-safe LRU / TTL cache of `Query` results.
+
+    ---
+
+    Results are keyed on `query.canonical`, so equivalent \
+    queries (for example, `a & b` and `b & a`) share an entry.
+
+    * At most `maxsize` results are kept, evicting the least \
+    recently used.
+
+    * If `ttl` is specified, results expire `ttl` seconds \
+    (measured by `timer`) after being stored.
+
+    The cache is backend agnostic: `fetch` calls any function \
+    executing a `Query` (for example, `engine.execute` over an \
+    in-memory store, `IndexedCollection.query` or a database \
+    adapter) on a miss. Results are returned as stored, so \
+    should not be mutated, and the cache should be `clear`ed \
+    when the underlying data changes.
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        id_: fgr.Field[str]
+        age: fgr.Field[int]
+
+
+    pets = [Pet(id='a1', age=3), Pet(id='a2', age=5)]
+    cache = fgr.core.caching.QueryCache(maxsize=128, ttl=60, dtype=Pet)
+
+    def execute(q):
+        return fgr.core.engine.execute(q, pets)
+
+    q1 = (Pet.age > 4) & (Pet.id_ != 'a3')
+    q2 = (Pet.id_ != 'a3') & (Pet.age > 4)
+
+    assert cache.fetch(q1, execute) == [pets[1]]
+    assert cache.fetch(q2, execute) == [pets[1]]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    ```
+
+    """
+
+    __slots__ = (
+        'dtype',
+        'maxsize',
+        'stats',
+        'timer',
+        'ttl',
+        '_entries',
+        '_lock',
+        )
+
+    def __init__(
+        self,
+        maxsize: int = Constants.CACHE_MAXSIZE,
+        ttl: typing.Optional[float] = None,
+        dtype: typing.Optional[type[meta.Base]] = None,
+        timer: typing.Callable[[], float] = time.monotonic,
+        ):
+        self.dtype = dtype
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self.timer = timer
+        self.ttl = ttl
+        self._entries: collections.OrderedDict[
+            typing.Hashable,
+            tuple[typing.Optional[float], ResultType]
+            ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, q: dtypes.Query) -> bool:
+        key = self.key(q)
+        with self._lock:
+            return (
+                (entry := self._entries.get(key)) is not None
+                and not self._is_expired(entry[0])
+                )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)}/{self.maxsize})'
+
+    def _is_expired(self, expires_at: typing.Optional[float]) -> bool:
+        return expires_at is not None and self.timer() >= expires_at
+
+    def key(self, q: dtypes.Query) -> typing.Hashable:
+        """Return cache key for `Query`."""
+
+        return query.canonical(q, self.dtype)
+
+    def _get(self, key: typing.Hashable) -> tuple[bool, typing.Any]:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.stats.misses += 1
+                return False, None
+            elif self._is_expired(entry[0]):
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[1]
+
+    def _put(self, key: typing.Hashable, results: ResultType) -> None:
+        expires_at = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get(
+        self,
+        q: dtypes.Query,
+        default: typing.Optional[ResultType] = None
+        ) -> typing.Optional[ResultType]:
+        """Return cached results for `Query`, or default."""
+
+        found, results = self._get(self.key(q))
+        return results if found else default
+
+    def put(self, q: dtypes.Query, results: ResultType) -> None:
+        """Store results for `Query`."""
+
+        self._put(self.key(q), results)
+
+    def fetch(
+        self,
+        q: dtypes.Query,
+        execute: typing.Callable[[dtypes.Query], ResultType]
+        ) -> ResultType:
+        """
+        Return cached results for `Query`, storing \
+        `execute(q)` first on a miss.
+
+        """
+
+        key = self.key(q)
+        found, results = self._get(key)
+        if not found:
+            results = execute(q)
+            self._put(key, results)
+        return typing.cast(ResultType, results)
+
+    def clear(self) -> None:
+        """Remove all results (statistics are kept)."""
+
+        with self._lock:
+            self._entries.clear()
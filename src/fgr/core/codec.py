@@ -1,7 +1,10 @@
 """Core serialization module."""
 
 __all__ = (
+    'decoder',
+    'dump',
     'encode',
+    'iterencode',
     )
 
 import collections
@@ -9,6 +12,8 @@ import datetime
 import decimal
 import enum
 import ipaddress
+import json
+import json.encoder
 import pathlib
 import re
 import types
@@ -17,11 +22,13 @@ import uuid
 
 from . import constants
 from . import dtypes
+from . import modules
+from . import utils
 
 
 class Constants(constants.PackageConstants):  # noqa
 
-    pass
+    CHUNK_SIZE = 65536
 
 
 def _isoformat_encoder(o: typing.Union[datetime.date, datetime.time]) -> str:
@@ -55,6 +62,26 @@ ENCODERS: dict[
         }
 
 
+DECODERS: dict[type[typing.Any], typing.Callable[[typing.Any], typing.Any]] = {
+    bytes: lambda o: o.encode() if isinstance(o, str) else o,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+    datetime.timedelta: lambda o: datetime.timedelta(seconds=o),
+    decimal.Decimal: lambda o: decimal.Decimal(str(o)),
+    ipaddress.IPv4Address: ipaddress.IPv4Address,
+    ipaddress.IPv4Interface: ipaddress.IPv4Interface,
+    ipaddress.IPv4Network: ipaddress.IPv4Network,
+    ipaddress.IPv6Address: ipaddress.IPv6Address,
+    ipaddress.IPv6Interface: ipaddress.IPv6Interface,
+    ipaddress.IPv6Network: ipaddress.IPv6Network,
+    pathlib.Path: pathlib.Path,
+    re.Pattern: re.compile,
+    uuid.UUID: uuid.UUID,
+    }
+"""Inverse of `ENCODERS` (enumerations are decoded by value)."""
+
+
 def encode(object_: typing.Any) -> dtypes.Serial:
     """JSON encode object using corresponding encoder, else repr."""
 
@@ -67,3 +94,532 @@ def encode(object_: typing.Any) -> dtypes.Serial:
             return encoder(object_)
     else:
         return repr(object_)
+
+
+Decoder = typing.Callable[[typing.Any], typing.Any]
+
+
+def decoder(
+    tp: typing.Any,
+    globalns: typing.Optional[dict[str, typing.Any]] = None
+    ) -> typing.Optional[Decoder]:
+    """
+    Return function converting a decoded JSON value (as returned \
+    by `json.loads`) to type `tp`, or None if no conversion is needed.
+
+    ---
+
+    Nested `Base` objects (hydrated via their compiled `from_record` \
+    constructors), typed containers, unions and the types in \
+    `ENCODERS` are converted; strings are parsed for numbers, \
+    booleans and nested JSON as by `Field.parse_dtype`.
+
+    Conversion is best effort: values that cannot be converted \
+    are returned as is (as they would be assigned by the \
+    constructor), and `None` is never passed to a decoder.
+
+    String and `ForwardRef` annotations are resolved in `globalns`.
+
+    """
+
+    if isinstance(tp, (str, typing.ForwardRef)):
+        tp = dtypes.utils.parse_type(tp, globalns)
+    if tp is bool:
+        return _decode_bool
+    elif tp in (int, float):
+        return _number_decoder(tp)
+
+    origin = typing.get_origin(tp) or tp
+    args = typing.get_args(tp)
+    if origin in (typing.Union, types.UnionType):
+        return _union_decoder(
+            tuple(
+                (
+                    typing.get_origin(arg) or arg,
+                    decoder(arg, globalns)
+                    )
+                for arg
+                in args
+                if arg is not dtypes.NoneType
+                )
+            )
+    elif not isinstance(origin, type) or origin is str:
+        return None
+    elif issubclass(origin, modules.Modules().meta.Base):  # type: ignore[attr-defined]
+        return _object_decoder(origin)
+    elif issubclass(origin, dict):
+        return _mapping_decoder(
+            origin,
+            *(
+                (decoder(args[0], globalns), decoder(args[1], globalns))
+                if len(args) == 2
+                else (None, None)
+                )
+            )
+    elif issubclass(origin, (list, tuple, set, frozenset, collections.deque)):
+        if origin is tuple and args and args[-1] is not Ellipsis:
+            return _tuple_decoder(tuple(decoder(arg, globalns) for arg in args))
+        return _array_decoder(origin, decoder(args[0], globalns) if args else None)
+
+    elif issubclass(origin, enum.Enum):
+        return _scalar_decoder(origin)
+
+    for base in origin.__mro__[:-1]:
+        if base in DECODERS:
+            return _scalar_decoder(DECODERS[base])
+    return None
+
+
+def _loads(value: typing.Any) -> typing.Any:
+    """Return nested JSON string decoded (else value as is)."""
+
+    if value.__class__ is str:
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _decode_bool(value: typing.Any) -> typing.Any:
+    if value.__class__ is str and value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    return value
+
+
+def _number_decoder(tp: type) -> Decoder:
+    def _decode(value: typing.Any) -> typing.Any:
+        if value.__class__ is tp or value.__class__ is bool:
+            return value
+        elif value.__class__ is str or (tp is float and value.__class__ is int):
+            try:
+                return tp(value)
+            except ValueError:
+                pass
+        return value
+    return _decode
+
+
+def _scalar_decoder(tp: Decoder) -> Decoder:
+    def _decode(value: typing.Any) -> typing.Any:
+        try:
+            return tp(value)
+        except (TypeError, ValueError):
+            return value
+    return _decode
+
+
+def _object_decoder(tp: type) -> Decoder:
+    from_json_record = modules.Modules().meta._from_json_record  # type: ignore[attr-defined]
+
+    def _decode(value: typing.Any) -> typing.Any:
+        if (value := _loads(value)).__class__ is dict:
+            return from_json_record(tp, value)
+        return value
+    return _decode
+
+
+def _mapping_decoder(
+    tp: type,
+    decode_key: typing.Optional[Decoder],
+    decode_value: typing.Optional[Decoder]
+    ) -> typing.Optional[Decoder]:
+    if tp is dict and decode_key is None and decode_value is None:
+        return None
+
+    def _decode(value: typing.Any) -> typing.Any:
+        if not isinstance(value := _loads(value), dict):
+            return value
+        return tp(
+            (
+                k if (decode_key is None or k is None) else decode_key(k),
+                v if (decode_value is None or v is None) else decode_value(v)
+                )
+            for k, v
+            in value.items()
+            )
+    return _decode
+
+
+def _array_decoder(
+    tp: type,
+    decode: typing.Optional[Decoder]
+    ) -> typing.Optional[Decoder]:
+    if tp is list and decode is None:
+        return None
+
+    def _decode(value: typing.Any) -> typing.Any:
+        if not isinstance(value := _loads(value), list):
+            return value
+        elif decode is None:
+            return tp(value)
+        return tp([v if v is None else decode(v) for v in value])
+    return _decode
+
+
+def _tuple_decoder(decoders: tuple[typing.Optional[Decoder], ...]) -> Decoder:
+    def _decode(value: typing.Any) -> typing.Any:
+        if not isinstance(value := _loads(value), list):
+            return value
+        return tuple(
+            (
+                v
+                if (v is None or i >= len(decoders) or decoders[i] is None)
+                else decoders[i](v)  # type: ignore[misc]
+                )
+            for i, v
+            in enumerate(value)
+            )
+    return _decode
+
+
+def _union_decoder(
+    options: tuple[tuple[typing.Any, typing.Optional[Decoder]], ...]
+    ) -> typing.Optional[Decoder]:
+    if len(options) == 1:
+        return options[0][1]
+    elif all(decode is None for _, decode in options):
+        return None
+    exact = tuple(
+        tp
+        for tp, decode
+        in options
+        if decode is None and isinstance(tp, type)
+        )
+
+    def _decode(value: typing.Any) -> typing.Any:
+        if isinstance(value, exact):
+            return value
+        for tp, decode in options:
+            if decode is not None and (
+                (decoded := decode(value)) is not value
+                or isinstance(value, tp)
+                ):
+                return decoded
+        return value
+    return _decode
+
+
+def iterencode(
+    value: typing.Any,
+    /,
+    camel_case: bool = False,
+    include_null: bool = True,
+    indent: typing.Optional[typing.Union[int, str]] = None,
+    sort_keys: bool = False,
+    redact: bool = False,
+    ) -> typing.Iterator[str]:
+    """
+    Encode value as JSON, yielding chunks as they are produced.
+
+    ---
+
+    `Base` objects are walked field by field and exported \
+    as by `to_dict` (with `camel_case` and `include_null` \
+    applied to nested objects and their field values), other \
+    values are encoded using `encode`. Unlike \
+    `json.dumps(obj.to_dict())`, no intermediate copy of the \
+    object graph is built, so memory use is independent of \
+    payload size.
+
+    Output is identical to `json.dumps(obj.to_dict(), default=encode)` \
+    (with the same `indent` and `sort_keys`), except for `Base` \
+    objects nested more than one container deep within a field \
+    (for example, in a list within a dict field): `to_dict` leaves \
+    these as is, so `json.dumps` encodes them as their `repr` \
+    string, while they are encoded here as JSON objects (as if \
+    by `to_dict`, without `camel_case` applied to the keys of the \
+    containers between).
+
+    `indent` and `sort_keys` format output as by `json.dumps`, \
+    and if `redact` is `True`, potentially sensitive string \
+    values are redacted as they are for logging.
+
+    Raises `ValueError` for circular references and `TypeError` \
+    for keys that cannot be encoded.
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        id_: fgr.Field[str]
+        name: fgr.Field[str] = None
+
+
+    pet = Pet(id='a1')
+
+    assert ''.join(
+        fgr.core.codec.iterencode(pet, include_null=False)
+        ) == '{"id": "a1"}'
+    ```
+
+    """
+
+    return _Encoder(
+        camel_case,
+        include_null,
+        indent,
+        sort_keys,
+        redact
+        ).iterencode(value)
+
+
+def dump(
+    value: typing.Any,
+    fp: typing.TextIO,
+    /,
+    camel_case: bool = False,
+    include_null: bool = True,
+    indent: typing.Optional[typing.Union[int, str]] = None,
+    sort_keys: bool = False,
+    redact: bool = False,
+    ) -> None:
+    """
+    Write value as JSON to a text stream (for example, \
+    a file or `socket.makefile('w')`).
+
+    ---
+
+    Chunks from `iterencode` are buffered and written at most \
+    `Constants.CHUNK_SIZE` characters at a time.
+
+    """
+
+    buffer: list[str] = []
+    size = 0
+    for chunk in iterencode(
+        value,
+        camel_case=camel_case,
+        include_null=include_null,
+        indent=indent,
+        sort_keys=sort_keys,
+        redact=redact
+        ):
+        buffer.append(chunk)
+        if (size := size + len(chunk)) >= Constants.CHUNK_SIZE:
+            fp.write(''.join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        fp.write(''.join(buffer))
+
+
+class _Encoder:
+    """Incremental JSON encoder state (one per `iterencode` call)."""
+
+    __slots__ = (
+        'base',
+        'camel_case',
+        'fields',
+        'include_null',
+        'indent',
+        'markers',
+        'redact',
+        'sort_keys',
+        )
+
+    def __init__(
+        self,
+        camel_case: bool,
+        include_null: bool,
+        indent: typing.Optional[typing.Union[int, str]],
+        sort_keys: bool,
+        redact: bool
+        ):
+        self.base: type = modules.Modules().meta.Base  # type: ignore[attr-defined]
+        self.camel_case = camel_case
+        self.fields: dict[type, tuple[tuple[str, str, str], ...]] = {}
+        self.include_null = include_null
+        self.indent = ' ' * indent if isinstance(indent, int) else indent
+        self.markers: set[int] = set()
+        self.redact = redact
+        self.sort_keys = sort_keys
+
+    def _fields(self, cls: type) -> tuple[tuple[str, str, str], ...]:
+        """Return (slot name, output key, encoded prefix) per field."""
+
+        if (fields := self.fields.get(cls)) is None:
+            fields = tuple(
+                (name, key, self._key(key) + ': ')
+                for name, key
+                in (
+                    (
+                        name,
+                        (
+                            utils.to_camel_case(name.strip('_'))
+                            if self.camel_case
+                            else name.rstrip('_')
+                            )
+                        )
+                    for name
+                    in cls.__fields__  # type: ignore[attr-defined]
+                    )
+                )
+            if self.sort_keys:
+                fields = tuple(sorted(fields, key=lambda field: field[1]))
+            self.fields[cls] = fields
+        return fields
+
+    def _key(self, key: typing.Any) -> str:
+        if isinstance(key, str):
+            return json.encoder.encode_basestring_ascii(key)
+        elif (
+            key is None
+            or isinstance(key, (bool, int, float))
+            ) and (scalar := self._scalar(key, None)) is not None:
+            return f'"{scalar}"'
+        else:
+            raise TypeError(
+                'keys must be str, int, float, bool or None, '
+                f'not {key.__class__.__name__}'
+                )
+
+    def _scalar(self, value: typing.Any, key: typing.Any) -> typing.Optional[str]:
+        """Return encoded value if it is a JSON scalar, else None."""
+
+        if isinstance(value, str):
+            if self.redact:
+                if isinstance(key, str):
+                    value = utils.redact_dict_string(key, value)
+                value = utils.redact_string(value)
+            return json.encoder.encode_basestring_ascii(value)
+        elif value is None:
+            return 'null'
+        elif value is True:
+            return 'true'
+        elif value is False:
+            return 'false'
+        elif isinstance(value, int):
+            return int.__repr__(value)
+        elif not isinstance(value, float):
+            return None
+        elif value != value:
+            return 'NaN'
+        elif value == float('inf'):
+            return 'Infinity'
+        elif value == -float('inf'):
+            return '-Infinity'
+        else:
+            return float.__repr__(value)
+
+    def iterencode(
+        self,
+        value: typing.Any,
+        depth: int = 0,
+        exported: bool = False,
+        key: typing.Any = None
+        ) -> typing.Iterator[str]:
+        """
+        Yield JSON chunks for value.
+
+        ---
+
+        `exported` is `True` for values of `Base` fields, whose \
+        own items are filtered (and dict keys cased) as by `to_dict`.
+
+        """
+
+        if (scalar := self._scalar(value, key)) is not None:
+            yield scalar
+        else:
+            yield from self._container(value, depth, exported)
+
+    def _container(
+        self,
+        value: typing.Any,
+        depth: int,
+        exported: bool
+        ) -> typing.Iterator[str]:
+        if not (
+            value.__class__ in self.fields
+            or isinstance(value, (self.base, dict, list, tuple))
+            ):
+            yield from self.iterencode(encode(value), depth, exported)
+            return
+        elif (marker := id(value)) in self.markers:
+            raise ValueError('Circular reference detected')
+
+        self.markers.add(marker)
+        if value.__class__ in self.fields or isinstance(value, self.base):
+            yield from self._members(
+                '{}',
+                (
+                    (prefix, v, True, k)
+                    for name, k, prefix
+                    in self._fields(value.__class__)
+                    if (
+                        (v := getattr(value, name)) is not None
+                        or self.include_null
+                        )
+                    ),
+                depth
+                )
+        elif isinstance(value, dict):
+            items: typing.Iterable[tuple[typing.Any, typing.Any]] = (
+                value.items()
+                )
+            if exported:
+                items = (
+                    (
+                        (
+                            utils.to_camel_case(k.strip('_'))
+                            if (self.camel_case and isinstance(k, str))
+                            else k
+                            ),
+                        v
+                        )
+                    for k, v
+                    in items
+                    if (not isinstance(k, str) or utils.is_public_field(k))
+                    and (self.include_null or v is not None)
+                    )
+            if self.sort_keys:
+                items = sorted(items)
+            yield from self._members(
+                '{}',
+                ((self._key(k) + ': ', v, False, k) for k, v in items),
+                depth
+                )
+        else:
+            yield from self._members(
+                '[]',
+                (
+                    ('', v, False, None)
+                    for v
+                    in typing.cast(typing.Iterable[typing.Any], value)
+                    if not exported or self.include_null or v is not None
+                    ),
+                depth
+                )
+        self.markers.remove(marker)
+
+    def _members(
+        self,
+        brackets: str,
+        members: typing.Iterable[tuple[str, typing.Any, bool, typing.Any]],
+        depth: int
+        ) -> typing.Iterator[str]:
+        """Yield container chunks, formatting members as `json.dumps`."""
+
+        if self.indent is None:
+            opening, separator, close = brackets[0], ', ', brackets[1]
+        else:
+            opening = brackets[0] + '\n' + self.indent * (depth + 1)
+            separator = ',\n' + self.indent * (depth + 1)
+            close = '\n' + self.indent * depth + brackets[1]
+        head = opening
+        for prefix, value, exported, key in members:
+            if (scalar := self._scalar(value, key)) is not None:
+                yield head + prefix + scalar
+            else:
+                yield head + prefix
+                yield from self._container(value, depth + 1, exported)
+            head = separator
+        yield brackets if head is opening else close
@@ -31,6 +31,7 @@ class PackageConstants:
         }
 
     BASE_ATTRS     = (
+        '__aliases__',
         '__cache__',
         '__fields__',
         '__heritage__',
@@ -76,8 +77,11 @@ class PackageConstants:
         '__sub__',
         '__lshift__',
         '__rshift__',
+        '__ilshift__',
+        '__irshift__',
         '__getstate__',
         '__setstate__',
+        '__reduce__',
         '__instancecheck__',
         '__subclasscheck__',
         'description',
@@ -127,6 +127,7 @@ class SupportsFields(typing.Protocol):
 
     if typing.TYPE_CHECKING:
         __fields__: typing.ClassVar[typing.Mapping[str, FieldType]] = {}
+        __aliases__: typing.ClassVar[typing.Mapping[str, str]] = {}
         __heritage__: typing.ClassVar[tuple[type['meta.Base'], ...]] = ()
         __cache__: typing.ClassVar[dict[str, typing.Any]] = {}
 
@@ -4,11 +4,11 @@ __all__ = (
     'is_classvar',
     'is_finalvar',
     'parse_type',
-    'parse_type_args',
     'resolve_annotations',
     'resolve_type',
     )
 
+import types
 import typing
 
 from . import constants
@@ -29,6 +29,24 @@ _eval_type: typing.Callable[
     type[typing.Any]
     ] = getattr(typing, '_eval_type')
 
+_ALIAS_TYPES: tuple[type, ...] = (
+    getattr(typing, '_GenericAlias'),
+    types.GenericAlias,
+    types.UnionType,
+    )
+"""Types with `__args__` evaluated by `_eval_type`."""
+
+
+def _is_resolved(dtype: typing.Any) -> bool:
+    """True if type contains no strings or ForwardRefs to evaluate."""
+
+    if isinstance(dtype, (str, typing.ForwardRef)):
+        return False
+    elif isinstance(dtype, _ALIAS_TYPES):
+        return all(_is_resolved(arg) for arg in getattr(dtype, '__args__', ()))
+    else:
+        return True
+
 
 def parse_type(
     dtype: typing.Union[type[typing.Any], typing.ForwardRef, str],
@@ -39,6 +57,8 @@ def parse_type(
 
     if isinstance(dtype, str):
         dtype = typing.ForwardRef(dtype, is_argument=False, is_class=True)
+    elif _is_resolved(dtype):
+        return dtype
 
     try:
         dtyped: type[typing.Any] = _eval_type(
@@ -54,23 +74,6 @@ def parse_type(
     return dtype
 
 
-def parse_type_args(
-    tp: typing.Union[type[typing.Any], typing.ForwardRef, str]
-    ) -> typing.Union[type[typing.Any], typing.ForwardRef, str]:
-    """Replace string type hints in Generics with ForwardRefs."""
-
-    if not (
-        typing.get_origin(tp)
-        and getattr(tp, '__args__', None)
-        ):
-        return tp
-
-    for arg in typing.get_args(tp):
-        parse_type_args(arg)
-
-    return tp
-
-
 def resolve_annotations(
     __annotations: dict[str, typing.Union[type[typing.Any], str]],
     __globals: typing.Optional[dict[str, typing.Any]] = None
@@ -90,7 +93,6 @@ def resolve_type(
     ) -> typing.Union[type[typing.Any], typing.ForwardRef]:
     """Attempt to resolve str or ForwardRef to type."""
 
-    tp = parse_type_args(tp)
     return parse_type(tp, __globals, __locals)
 
 
@@ -0,0 +1,213 @@
+"""In-memory query execution."""
+
+__all__ = (
+    'compile_predicate',
+    'execute',
+    'sort',
+    )
+
+import itertools
+import typing
+
+from . import constants
+from . import dtypes
+from . import enums
+from . import exceptions
+from . import meta
+from . import optimizer
+from . import query
+from . import similarity
+from . import utils
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    COMPARISONS: dict[type[query.QueryCondition], tuple[str, str]] = {
+        query.EqQueryCondition: ('eq', '=='),
+        query.NeQueryCondition: ('ne', '!='),
+        query.GeQueryCondition: ('ge', '>='),
+        query.GtQueryCondition: ('gt', '>'),
+        query.LeQueryCondition: ('le', '<='),
+        query.LtQueryCondition: ('lt', '<'),
+        }
+    RANGES = frozenset(('ge', 'gt', 'le', 'lt'))
+
+
+Predicate = typing.Callable[[meta.Base], bool]
+
+
+def compile_predicate(
+    q: dtypes.Query,
+    dtype: type[meta.Base]
+    ) -> Predicate:
+    """
+    Compile `Query` into a predicate for objects of type `dtype`.
+
+    ---
+
+    The `Query` tree is translated once, here, into a single \
+    python expression (with field aliases resolved to slot names), \
+    so evaluating the predicate does not walk the tree per object. \
+    The tree is first passed through `optimizer.optimize`, so \
+    redundant conditions are removed, contradictions compile to \
+    `False` and the most selective conditions are tested first.
+
+    Comparisons other than `==` and `!=` are never satisfied \
+    by `None`, consistent with `null` semantics for most databases.
+
+    Raises `InvalidQueryFieldError` if a condition references \
+    a field not defined for `dtype`.
+
+    """
+
+    namespace: dict[str, typing.Any] = {'_similarity': similarity.score}
+    expression = _expression(optimizer.optimize(q, dtype), dtype, namespace)
+    exec(f'def predicate(o):\n    return {expression}', namespace)
+    predicate: Predicate = namespace['predicate']
+    return predicate
+
+
+def _expression(
+    q: dtypes.Query,
+    dtype: type[meta.Base],
+    namespace: dict[str, typing.Any]
+    ) -> str:
+    if isinstance(q, query.AndQuery):
+        return _join(q, 'and_', ' and ', dtype, namespace)
+    elif isinstance(q, query.OrQuery):
+        return _join(q, 'or_', ' or ', dtype, namespace)
+    elif isinstance(q, query.InvertQuery):
+        inverted = _expression(q.invert, dtype, namespace)  # type: ignore[arg-type]
+        return f'(not {inverted})'
+    elif not isinstance(q, query.QueryCondition):
+        return 'True'
+
+    if not (name := utils.key_for(dtype, q.field)):
+        raise exceptions.InvalidQueryFieldError(q.field, dtype)
+
+    value = f'_v{len(namespace)}'
+    if isinstance(q, query.ContainsQueryCondition):
+        namespace[value] = q.contains
+        return f'((_x := o.{name}) is not None and {value} in _x)'
+    elif isinstance(q, query.SimilarQueryCondition):
+        namespace[value] = q.like
+        namespace[threshold := f'_v{len(namespace)}'] = (
+            enums.MatchThreshold.default.value
+            if q.threshold is None
+            else q.threshold
+            )
+        return ''.join(
+            (
+                f'((_x := o.{name}) is not None',
+                f' and _similarity(_x, {value}) >= {threshold})',
+                )
+            )
+
+    attr, operator = Constants.COMPARISONS[q.__class__]
+    namespace[value] = (v := q[attr])
+    if v is None and attr in Constants.RANGES:
+        return 'False'
+    elif v is None:
+        return f'(o.{name} {"is" if attr == "eq" else "is not"} None)'
+    elif attr in Constants.RANGES:
+        return f'((_x := o.{name}) is not None and _x {operator} {value})'
+    else:
+        return f'(o.{name} {operator} {value})'
+
+
+def _join(
+    q: dtypes.Query,
+    key: str,
+    operator: str,
+    dtype: type[meta.Base],
+    namespace: dict[str, typing.Any]
+    ) -> str:
+    """Join operands, flattening nested queries of the same type."""
+
+    return ''.join(
+        (
+            '(',
+            operator.join(
+                _expression(operand, dtype, namespace)
+                for operand
+                in _operands(q, key)
+                ) or str(key == 'and_'),
+            ')',
+            )
+        )
+
+
+def _operands(
+    q: dtypes.Query,
+    key: str
+    ) -> typing.Iterator[dtypes.Query]:
+    for operand in q[key]:
+        if operand.__class__ is q.__class__:
+            yield from _operands(operand, key)
+        else:
+            yield operand
+
+
+def sort(
+    objects: typing.Iterable[dtypes.BaseType],
+    sorting: typing.Iterable[query.QuerySortBy]
+    ) -> list[dtypes.BaseType]:
+    """
+    Return objects sorted by each `QuerySortBy` (in order of priority).
+
+    ---
+
+    `None` values sort last in `asc` order and first in `desc` order.
+
+    """
+
+    results = list(objects)
+    for sort_by in reversed(list(sorting)):
+        results.sort(
+            key=_sort_key(sort_by.field),
+            reverse=sort_by.direction == enums.SortDirection.desc.value
+            )
+    return results
+
+
+def _sort_key(
+    field: str
+    ) -> typing.Callable[[meta.Base], tuple[bool, typing.Any]]:
+    def _key(object_: meta.Base) -> tuple[bool, typing.Any]:
+        return ((v := object_[field]) is None, v)
+    return _key
+
+
+def execute(
+    q: dtypes.Query,
+    objects: typing.Iterable[dtypes.BaseType]
+    ) -> list[dtypes.BaseType]:
+    """
+    Return objects matching the `Query`, sorted by \
+    `Query.sorting` and limited to `Query.limit`.
+
+    ---
+
+    Predicates are compiled once per object type encountered.
+
+    If no sorting is specified, iteration stops as soon \
+    as `Query.limit` results are found.
+
+    """
+
+    predicates: dict[type[meta.Base], Predicate] = {}
+
+    def _match(object_: dtypes.BaseType) -> bool:
+        if (predicate := predicates.get(object_.__class__)) is None:
+            predicate = predicates[object_.__class__] = compile_predicate(
+                q,
+                object_.__class__
+                )
+        return predicate(object_)
+
+    results: typing.Iterable[dtypes.BaseType] = filter(_match, objects)
+    if q.sorting:
+        results = sort(results, q.sorting)
+    if q.limit is not None:
+        results = itertools.islice(results, q.limit)
+    return list(results)
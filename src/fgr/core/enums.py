@@ -4,6 +4,7 @@ __all__ = (
     'Boolean',
     'MatchThreshold',
     'SortDirection',
+    'SqlDialect',
     )
 
 import enum
@@ -33,3 +34,10 @@ class SortDirection(enum.Enum):
 
     asc  = 'asc'
     desc = 'desc'
+
+
+class SqlDialect(enum.Enum):
+    """Enumeration for supported SQL dialects."""
+
+    postgresql = 'postgresql'
+    sqlite     = 'sqlite'
@@ -8,7 +8,9 @@ __all__ = (
     'InvalidComparisonTypeError',
     'InvalidContainerComparisonTypeError',
     'InvalidFieldRedefinitionError',
+    'InvalidJSONDocumentError',
     'InvalidLogMessageTypeError',
+    'InvalidQueryFieldError',
     'MissingTypeAnnotation',
     'ReservedKeywordError',
     )
@@ -39,6 +41,31 @@ class InvalidFieldRedefinitionError(KeyError):
             )
 
 
+class InvalidQueryFieldError(KeyError):
+    """Error raised when a query references a field not defined for an object."""  # noqa
+
+    def __init__(self, name: str, dtype: type[typing.Any]):
+        self.name = name
+        self.dtype = dtype
+        super().__init__(
+            ' '.join(
+                (
+                    f"Cannot query field: '{name}',",
+                    f"as it is not defined for: '{dtype!s}'.",
+                    )
+                )
+            )
+
+    def __reduce__(self) -> typing.Union[str, tuple[typing.Any, ...]]:
+        return (
+            self.__class__,
+            (
+                self.name,
+                self.dtype,
+                )
+            )
+
+
 class IncorrectCasingError(SyntaxError):
     """Incorrect field casing."""
 
@@ -184,6 +211,33 @@ class InvalidContainerComparisonTypeError(SyntaxError):
             )
 
 
+class InvalidJSONDocumentError(ValueError):
+    """Error raised when a JSON document is not a JSON object."""
+
+    def __init__(self, dtype: type[typing.Any], value: typing.Any):
+        self.dtype = dtype
+        self.value = value
+        super().__init__(
+            ' '.join(
+                (
+                    f"Cannot decode: '{dtype!s}',",
+                    f'from JSON value: {value!s},',
+                    f"of type: '{type(value)!s}',",
+                    'as it is not a JSON object.'
+                    )
+                )
+            )
+
+    def __reduce__(self) -> typing.Union[str, tuple[typing.Any, ...]]:
+        return (
+            self.__class__,
+            (
+                self.dtype,
+                self.value,
+                )
+            )
+
+
 class InvalidLogMessageTypeError(SyntaxError):
     """Error raised when a log message of invalid data type is passed."""
 
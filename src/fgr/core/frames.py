@@ -0,0 +1,251 @@
+"""Columnar collections of Objects."""
+
+__all__ = (
+    'ObjectFrame',
+    )
+
+import array
+import sys
+import typing
+
+from . import constants
+from . import dtypes
+from . import meta
+from . import utils
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    TYPECODES: dict[type, str] = {
+        bool: 'b',
+        float: 'd',
+        int: 'q',
+        }
+
+
+Column = typing.Union[array.array, list]
+
+
+class ObjectFrame(typing.Generic[dtypes.BaseType]):
+    """
+    Columnar (struct-of-arrays) collection of `Objects`.
+
+    ---
+
+    Each field in `__fields__` for the `Object` derivative is \
+    stored in its own column, rather than per instance.
+
+    * Fields typed `bool`, `float` or `int` are stored in a compact \
+    `array.array`, for so long as all values stored are of \
+    exactly that type (for example, not `None`), at which point \
+    the column is converted to a `list`.
+
+    * Fields typed `str` are stored in a `list` of interned strings.
+
+    * All other fields are stored in a `list`.
+
+    `Objects` are only materialized on indexing or iteration, \
+    and are not views: assigning a field on a materialized `Object` \
+    does not update the frame (assign it back by index to do so).
+
+    * Values are stored as is, not copied, so mutable values \
+    (for example, a `list`, `dict` or nested `Object`) are shared \
+    by the frame, the `Objects` added and any materialized from it, \
+    and mutating one in place is visible through all of them.
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        name: fgr.Field[str]
+        age: fgr.Field[int] = 1
+
+
+    frame = fgr.core.frames.ObjectFrame(
+        Pet,
+        [Pet(name='Fido'), Pet(name='Buddy', age=3)]
+        )
+
+    assert frame['age'].tolist() == [1, 3]
+    assert frame[1] == Pet(name='Buddy', age=3)
+    assert list(frame) == frame.to_objects()
+    ```
+
+    """
+
+    __slots__ = (
+        'columns',
+        'dtype',
+        '_types',
+        )
+
+    def __init__(
+        self,
+        dtype: type[dtypes.BaseType],
+        objects: typing.Iterable[dtypes.BaseType] = (),
+        /
+        ):
+        self.dtype = dtype
+        self.columns: dict[str, Column] = {}
+        self._types: dict[str, typing.Optional[type]] = {}
+        for name, field in dtype.__fields__.items():
+            if (typecode := Constants.TYPECODES.get(field['type'])):
+                self.columns[name] = array.array(typecode)
+                self._types[name] = field['type']
+            else:
+                self.columns[name] = []
+                self._types[name] = (
+                    str
+                    if field['type'] is str
+                    else None
+                    )
+        self.extend(objects)
+
+    @typing.overload
+    def __getitem__(self, key: int) -> dtypes.BaseType: ...
+    @typing.overload
+    def __getitem__(
+        self,
+        key: slice
+        ) -> 'ObjectFrame[dtypes.BaseType]': ...
+    @typing.overload
+    def __getitem__(self, key: str) -> Column: ...
+    def __getitem__(
+        self,
+        key: typing.Union[int, slice, str]
+        ) -> typing.Union[dtypes.BaseType, 'ObjectFrame[dtypes.BaseType]', Column]:  # noqa
+        """
+        Return `Object` by index, `ObjectFrame` by slice, \
+        or column by field name (or alias).
+
+        """
+
+        if isinstance(key, str):
+            if (k := utils.key_for(self.dtype, key)):
+                return self.columns[k]
+            else:
+                raise KeyError(key)
+        elif isinstance(key, slice):
+            frame: 'ObjectFrame[dtypes.BaseType]' = ObjectFrame(self.dtype)
+            frame._types = dict(self._types)
+            frame.columns = {
+                name: column[key]
+                for name, column
+                in self.columns.items()
+                }
+            return frame
+        else:
+            return self._from_values(
+                *(
+                    bool(column[key])
+                    if self._types[name] is bool
+                    else column[key]
+                    for name, column
+                    in self.columns.items()
+                    )
+                )
+
+    def __setitem__(self, index: int, object_: dtypes.BaseType) -> None:
+        """Replace `Object` at index."""
+
+        for name, column in self.columns.items():
+            value = getattr(object_, name)
+            if self._types[name] is str and value.__class__ is str:
+                value = sys.intern(value)
+            elif (
+                column.__class__ is array.array
+                and value.__class__ is not self._types[name]
+                ):
+                column = self._to_list(name)
+            try:
+                column[index] = value
+            except OverflowError:
+                self._to_list(name)[index] = value
+
+    def __iter__(self) -> typing.Iterator[dtypes.BaseType]:
+        """Materialize and yield `Objects` in order."""
+
+        from_values = self._from_values
+        for values in zip(
+            *(
+                map(bool, column)
+                if self._types[name] is bool
+                else column
+                for name, column
+                in self.columns.items()
+                ),
+            strict=True
+            ):
+            yield from_values(*values)
+
+    def __len__(self) -> int:
+        """Return count of `Objects`."""
+
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}[{self.dtype.__name__}]({len(self)})'
+            )
+
+    @property
+    def _from_values(self) -> typing.Callable[..., dtypes.BaseType]:
+        from_values = (
+            self.dtype.__cache__.get('from_values')
+            or meta._compile_from_values(self.dtype)
+            )
+        return typing.cast(typing.Callable[..., dtypes.BaseType], from_values)
+
+    def _to_list(self, name: str) -> list:
+        """Convert typed array column to list."""
+
+        column: list = self.columns[name].tolist()  # type: ignore[union-attr]
+        if self._types[name] is bool:
+            column = [bool(v) for v in column]
+        self.columns[name] = column
+        self._types[name] = None
+        return column
+
+    def append(self, object_: dtypes.BaseType) -> None:
+        """Append `Object` to the frame."""
+
+        self.extend((object_, ))
+
+    def extend(self, objects: typing.Iterable[dtypes.BaseType]) -> None:
+        """Append `Objects` to the frame."""
+
+        if not isinstance(objects, typing.Sequence):
+            objects = list(objects)
+        for name, column in self.columns.items():
+            values = [getattr(object_, name) for object_ in objects]
+            if (dtype := self._types[name]) is str:
+                column.extend(
+                    sys.intern(v) if v.__class__ is str else v
+                    for v
+                    in values
+                    )
+            elif dtype is None:
+                column.extend(values)
+            elif all(v.__class__ is dtype for v in values):
+                try:
+                    column.extend(
+                        array.array(Constants.TYPECODES[dtype], values)
+                        )
+                except OverflowError:
+                    self._to_list(name).extend(values)
+            else:
+                self._to_list(name).extend(values)
+
+    def to_objects(self) -> list[dtypes.BaseType]:
+        """Return list of materialized `Objects`."""
+
+        return list(self)
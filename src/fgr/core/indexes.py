@@ -0,0 +1,749 @@
+"""Indexed collections of Objects."""
+
+__all__ = (
+    'HashIndex',
+    'IndexedCollection',
+    'SimilarityIndex',
+    'SortedIndex',
+    )
+
+import bisect
+import itertools
+import typing
+
+from . import dtypes
+from . import engine
+from . import exceptions
+from . import meta
+from . import query
+from . import similarity
+from . import utils
+
+
+RowIds = dict[int, None]
+"""Insertion ordered set of row ids."""
+
+Plan = tuple[int, typing.Callable[[], RowIds], str]
+"""Estimated count of candidates, candidate supplier and description."""
+
+
+class HashIndex:
+    """
+    Hash index on a field.
+
+    ---
+
+    If the field is an array (ex. `list[str]`), each element \
+    is indexed, so the index answers `ContainsQueryCondition`, \
+    otherwise the value itself is indexed, and the index \
+    answers `EqQueryCondition`.
+
+    Rows with unhashable values are tracked separately and \
+    always returned as candidates.
+
+    """
+
+    __slots__ = (
+        'field',
+        'is_array',
+        'rows',
+        'unhashable',
+        )
+
+    def __init__(self, field: str, is_array: bool):
+        self.field = field
+        self.is_array = is_array
+        self.rows: dict[typing.Any, RowIds] = {}
+        self.unhashable: RowIds = {}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.field})'
+
+    def _values(self, object_: meta.Base) -> typing.Iterable[typing.Any]:
+        value = getattr(object_, self.field)
+        if self.is_array and utils.is_array_type(value):
+            return value
+        else:
+            return (value, )
+
+    def add(self, row_id: int, object_: meta.Base) -> None:
+        for value in self._values(object_):
+            try:
+                self.rows.setdefault(value, {})[row_id] = None
+            except TypeError:
+                self.unhashable[row_id] = None
+
+    def remove(self, row_id: int, object_: meta.Base) -> None:
+        for value in self._values(object_):
+            try:
+                rows = self.rows.get(value)
+            except TypeError:
+                self.unhashable.pop(row_id, None)
+            else:
+                if rows is not None:
+                    rows.pop(row_id, None)
+                    if not rows:
+                        del self.rows[value]
+
+    def count(self, value: typing.Any) -> int:
+        """Return count of row ids that may match value."""
+
+        try:
+            rows = self.rows.get(value, {})
+        except TypeError:
+            rows = {}
+        return len(rows) + len(self.unhashable)
+
+    def lookup(self, value: typing.Any) -> RowIds:
+        """Return row ids that may match value."""
+
+        try:
+            rows = self.rows.get(value, {})
+        except TypeError:
+            rows = {}
+        return {**rows, **self.unhashable}
+
+
+class SortedIndex:
+    """
+    Sorted index on a field.
+
+    ---
+
+    Answers range conditions (and `EqQueryCondition`) \
+    by bisection. `None` values are not indexed, as range \
+    conditions are never satisfied by `None`.
+
+    Rows with equal values are ordered by row id, so rows \
+    are removed by bisection even if many values are equal.
+
+    Rows with values that cannot be ordered with the \
+    other values in the index are tracked separately \
+    and always returned as candidates.
+
+    """
+
+    __slots__ = (
+        'field',
+        'keys',
+        'row_ids',
+        'unordered',
+        )
+
+    def __init__(self, field: str):
+        self.field = field
+        self.keys: list[typing.Any] = []
+        self.row_ids: list[int] = []
+        self.unordered: RowIds = {}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.field})'
+
+    def _insert(self, row_id: int, value: typing.Any) -> None:
+        try:
+            lo = bisect.bisect_left(self.keys, value)
+            hi = bisect.bisect_right(self.keys, value, lo)
+        except TypeError:
+            self.unordered[row_id] = None
+        else:
+            i = bisect.bisect_left(self.row_ids, row_id, lo, hi)
+            self.keys.insert(i, value)
+            self.row_ids.insert(i, row_id)
+
+    def add(self, row_id: int, object_: meta.Base) -> None:
+        if (value := getattr(object_, self.field)) is not None:
+            self._insert(row_id, value)
+
+    def extend(
+        self,
+        rows: typing.Iterable[tuple[int, meta.Base]]
+        ) -> None:
+        pairs = [
+            (value, row_id)
+            for row_id, object_
+            in rows
+            if (value := getattr(object_, self.field)) is not None
+            ]
+        try:
+            pairs = sorted(
+                itertools.chain(
+                    zip(self.keys, self.row_ids, strict=True),
+                    pairs
+                    )
+                )
+        except TypeError:
+            for value, row_id in pairs:
+                self._insert(row_id, value)
+        else:
+            self.keys = [value for value, _ in pairs]
+            self.row_ids = [row_id for _, row_id in pairs]
+
+    def remove(self, row_id: int, object_: meta.Base) -> None:
+        if (value := getattr(object_, self.field)) is None:
+            return None
+        elif row_id in self.unordered:
+            # Values may become orderable with the remaining keys,
+            # so unordered rows are looked up by row id only.
+            del self.unordered[row_id]
+            return None
+        # Otherwise the value was ordered with (so is among) the keys.
+        lo = bisect.bisect_left(self.keys, value)
+        hi = bisect.bisect_right(self.keys, value, lo)
+        i = bisect.bisect_left(self.row_ids, row_id, lo, hi)
+        if i < hi and self.row_ids[i] == row_id:
+            del self.keys[i]
+            del self.row_ids[i]
+
+    def reindex(self, rows: typing.Mapping[int, meta.Base]) -> None:
+        """Remove then re-add rows (by row id) in a single pass."""
+
+        keep = [
+            i
+            for i, row_id
+            in enumerate(self.row_ids)
+            if row_id not in rows
+            ]
+        self.keys = [self.keys[i] for i in keep]
+        self.row_ids = [self.row_ids[i] for i in keep]
+        for row_id in rows:
+            self.unordered.pop(row_id, None)
+        self.extend(rows.items())
+
+    def bounds(
+        self,
+        lo: typing.Any = None,
+        hi: typing.Any = None,
+        include_lo: bool = True,
+        include_hi: bool = True
+        ) -> tuple[int, int]:
+        """Return start and stop positions of keys within range."""
+
+        try:
+            start = (
+                0
+                if lo is None
+                else bisect.bisect_left(self.keys, lo)
+                if include_lo
+                else bisect.bisect_right(self.keys, lo)
+                )
+            stop = (
+                len(self.keys)
+                if hi is None
+                else bisect.bisect_right(self.keys, hi)
+                if include_hi
+                else bisect.bisect_left(self.keys, hi)
+                )
+        except TypeError:
+            start, stop = 0, len(self.keys)
+        return start, max(start, stop)
+
+    def rows(self, start: int, stop: int) -> RowIds:
+        """Return row ids that may fall within positions."""
+
+        return {
+            **dict.fromkeys(self.row_ids[start:stop]),
+            **self.unordered
+            }
+
+    def range(
+        self,
+        lo: typing.Any = None,
+        hi: typing.Any = None,
+        include_lo: bool = True,
+        include_hi: bool = True
+        ) -> RowIds:
+        """Return row ids that may fall within range."""
+
+        return self.rows(*self.bounds(lo, hi, include_lo, include_hi))
+
+
+class SimilarityIndex:
+    """
+    Trigram index on a field.
+
+    ---
+
+    Answers `SimilarQueryCondition` by `similarity.TrigramIndex` \
+    search, which only scores values that could satisfy the \
+    threshold. `None` values are not indexed, as similarity \
+    conditions are never satisfied by `None`.
+
+    """
+
+    __slots__ = (
+        'field',
+        'trigrams',
+        )
+
+    def __init__(self, field: str):
+        self.field = field
+        self.trigrams = similarity.TrigramIndex()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.field})'
+
+    def add(self, row_id: int, object_: meta.Base) -> None:
+        self.trigrams.add(row_id, getattr(object_, self.field))
+
+    def remove(self, row_id: int, object_: meta.Base) -> None:
+        self.trigrams.remove(row_id, getattr(object_, self.field))
+
+
+class IndexedCollection(typing.Generic[dtypes.BaseType]):
+    """
+    Collection of `Objects` with secondary indexes \
+    for in-memory `Query` execution.
+
+    ---
+
+    By default, a `HashIndex` is maintained for each of \
+    the `hash_fields` for the `Object` derivative, and additional \
+    hash, sorted and similarity indexes may be specified by \
+    field name (or alias).
+
+    On `query`, a plan is chosen from the indexes available:
+
+    * `EqQueryCondition` uses a `HashIndex` (or `SortedIndex`).
+    * `ContainsQueryCondition` uses a `HashIndex` on an array field.
+    * `Ge`, `Gt`, `Le` and `LtQueryCondition` use a `SortedIndex`.
+    * `SimilarQueryCondition` uses a `SimilarityIndex`.
+    * `AndQuery` uses the indexed operand with the fewest candidates.
+    * `OrQuery` unites the candidates if all operands are indexed.
+
+    Otherwise, all objects are scanned. In all cases, candidates \
+    are verified with the compiled `Query` predicate, so indexes \
+    never change results, only the number of objects evaluated.
+
+    Objects must be `remove`d and re-`add`ed if indexed fields \
+    are mutated after being added to the collection (other than \
+    by `merge`).
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        id_: fgr.Field[str]
+        age: fgr.Field[int]
+
+
+    pets = fgr.core.indexes.IndexedCollection(
+        Pet,
+        [Pet(id='a1', age=3), Pet(id='a2', age=5)],
+        sorted_fields=('age', )
+        )
+
+    assert pets.query(Pet.age > 4) == [Pet(id='a2', age=5)]
+    assert pets.explain(Pet.age > 4) == 'SortedIndex(age)'
+    ```
+
+    """
+
+    __slots__ = (
+        'dtype',
+        'hash_indexes',
+        'rows',
+        'similarity_indexes',
+        'sorted_indexes',
+        '_row_ids',
+        '_next_row_id',
+        )
+
+    def __init__(
+        self,
+        dtype: type[dtypes.BaseType],
+        objects: typing.Iterable[dtypes.BaseType] = (),
+        /,
+        hash_fields: typing.Optional[typing.Iterable[str]] = None,
+        sorted_fields: typing.Iterable[str] = (),
+        similar_fields: typing.Iterable[str] = (),
+        ):
+        self.dtype = dtype
+        self.rows: dict[int, dtypes.BaseType] = {}
+        self.hash_indexes: dict[str, HashIndex] = {}
+        self.sorted_indexes: dict[str, SortedIndex] = {}
+        self.similarity_indexes: dict[str, SimilarityIndex] = {}
+        self._row_ids: dict[int, int] = {}
+        self._next_row_id = 0
+        for field in (
+            dtype.hash_fields
+            if hash_fields is None
+            else hash_fields
+            ):
+            name = self._key_for(field)
+            self.hash_indexes[name] = HashIndex(
+                name,
+                utils.is_array_annotation(dtype.__fields__[name]['type'])
+                )
+        for field in sorted_fields:
+            name = self._key_for(field)
+            self.sorted_indexes[name] = SortedIndex(name)
+        for field in similar_fields:
+            name = self._key_for(field)
+            self.similarity_indexes[name] = SimilarityIndex(name)
+        self.extend(objects)
+
+    def __contains__(self, object_: dtypes.BaseType) -> bool:
+        return id(object_) in self._row_ids
+
+    def __iter__(self) -> typing.Iterator[dtypes.BaseType]:
+        return iter(self.rows.values())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}[{self.dtype.__name__}]({len(self)})'
+            )
+
+    def _key_for(self, field: str) -> str:
+        if (name := utils.key_for(self.dtype, field)):
+            return name
+        else:
+            raise exceptions.InvalidQueryFieldError(field, self.dtype)
+
+    def add(self, object_: dtypes.BaseType) -> None:
+        """Add `Object` to the collection (if not already added)."""
+
+        if id(object_) in self._row_ids:
+            return None
+        row_id = self._next_row_id
+        self._next_row_id += 1
+        self.rows[row_id] = object_
+        self._row_ids[id(object_)] = row_id
+        for hash_index in self.hash_indexes.values():
+            hash_index.add(row_id, object_)
+        for sorted_index in self.sorted_indexes.values():
+            sorted_index.add(row_id, object_)
+        for similarity_index in self.similarity_indexes.values():
+            similarity_index.add(row_id, object_)
+
+    def extend(self, objects: typing.Iterable[dtypes.BaseType]) -> None:
+        """Add `Objects` to the collection."""
+
+        added: list[tuple[int, meta.Base]] = []
+        for object_ in objects:
+            if id(object_) in self._row_ids:
+                continue
+            added.append((self._append(object_), object_))
+        for sorted_index in self.sorted_indexes.values():
+            sorted_index.extend(added)
+
+    def _append(self, object_: dtypes.BaseType) -> int:
+        """Add `Object` to all but the sorted indexes, returning its row id."""
+
+        row_id = self._next_row_id
+        self._next_row_id += 1
+        self.rows[row_id] = object_
+        self._row_ids[id(object_)] = row_id
+        for hash_index in self.hash_indexes.values():
+            hash_index.add(row_id, object_)
+        for similarity_index in self.similarity_indexes.values():
+            similarity_index.add(row_id, object_)
+        return row_id
+
+    def merge(
+        self,
+        records: typing.Iterable[
+            typing.Union[dtypes.BaseType, typing.Mapping[str, typing.Any]]
+            ],
+        overwrite: bool = True
+        ) -> None:
+        """
+        Merge a stream of (partial) records into the collection, \
+        matched to existing `Objects` by the `hash_fields` values \
+        for the `Object` derivative.
+
+        ---
+
+        Matched `Objects` are updated in place (as `>>=`, or \
+        `<<=` if not `overwrite`), so no intermediate objects are \
+        created and only indexes on updated fields are maintained. \
+        Unmatched records are added (mappings are first parsed \
+        as the derivative).
+
+        For `Object` records, only non-default values are merged, \
+        while every key present in a mapping is merged. Key fields \
+        missing from a mapping, and values compared against defaults, \
+        are resolved as by `__init__` (factories are called).
+
+        Matches are looked up from the `HashIndex` for each key \
+        field where available, otherwise from a key table built \
+        once per call. Sorted indexes are rebuilt once per call \
+        for all rows added or updated.
+
+        """
+
+        default = meta._default_object(self.dtype)
+        keys = tuple(self._key_for(field) for field in self.dtype.hash_fields)
+        hash_indexes = [
+            hash_index
+            for key
+            in keys
+            if (
+                (hash_index := self.hash_indexes.get(key)) is not None
+                and not hash_index.is_array
+                )
+            ]
+        table: typing.Optional[dict[typing.Any, dtypes.BaseType]] = None
+        if not hash_indexes or len(hash_indexes) != len(keys):
+            table = {}
+            for existing in self.rows.values():
+                try:
+                    table.setdefault(
+                        tuple(getattr(existing, key) for key in keys),
+                        existing
+                        )
+                except TypeError:
+                    continue
+        stale: dict[str, dict[int, meta.Base]] = {
+            name: {}
+            for name
+            in self.sorted_indexes
+            }
+
+        try:
+            for record in records:
+                values: typing.Optional[dict[str, typing.Any]] = None
+                parsed: typing.Optional[dtypes.BaseType] = None
+                if isinstance(record, meta.Base):
+                    key = tuple(getattr(record, k) for k in keys)
+                else:
+                    values = {
+                        k: v
+                        for field, v
+                        in record.items()
+                        if (k := utils.key_for(self.dtype, field))
+                        }
+                    if all(k in values for k in keys):
+                        key = tuple(values[k] for k in keys)
+                    else:
+                        parsed = self.dtype(values)
+                        key = tuple(getattr(parsed, k) for k in keys)
+
+                match = self._match(key, keys, hash_indexes, table)
+                if match is None:
+                    object_ = typing.cast(
+                        dtypes.BaseType,
+                        record
+                        if values is None
+                        else parsed
+                        if parsed is not None
+                        else self.dtype(values)
+                        )
+                    if id(object_) in self._row_ids:
+                        continue
+                    row_id = self._append(object_)
+                    for rows in stale.values():
+                        rows[row_id] = object_
+                    if table is not None:
+                        try:
+                            table.setdefault(key, object_)
+                        except TypeError:
+                            pass
+                    continue
+
+                if values is None:
+                    updates = {
+                        k: v
+                        for k, v
+                        in meta._iter_merge(
+                            match,
+                            typing.cast(dtypes.BaseType, record),
+                            overwrite
+                            )
+                        if k not in keys
+                        }
+                else:
+                    updates = {
+                        k: v
+                        for k, v
+                        in values.items()
+                        if k not in keys
+                        and (overwrite or getattr(match, k) == getattr(default, k))
+                        }
+                if updates:
+                    self._update(match, updates, stale)
+        finally:
+            for name, rows in stale.items():
+                if rows:
+                    self.sorted_indexes[name].reindex(rows)
+
+    def _match(
+        self,
+        key: tuple[typing.Any, ...],
+        keys: tuple[str, ...],
+        hash_indexes: list[HashIndex],
+        table: typing.Optional[dict[typing.Any, dtypes.BaseType]]
+        ) -> typing.Optional[dtypes.BaseType]:
+        """Return existing `Object` with key values (if any)."""
+
+        if table is not None:
+            try:
+                return table.get(key)
+            except TypeError:
+                candidates: RowIds = dict.fromkeys(self.rows)
+        else:
+            candidates = min(
+                (
+                    hash_index.lookup(value)
+                    for hash_index, value
+                    in zip(hash_indexes, key, strict=True)
+                    ),
+                key=len
+                )
+        for row_id in candidates:
+            existing = self.rows[row_id]
+            if all(getattr(existing, k) == v for k, v in zip(keys, key, strict=True)):
+                return existing
+        return None
+
+    def _update(
+        self,
+        object_: dtypes.BaseType,
+        updates: dict[str, typing.Any],
+        stale: dict[str, dict[int, meta.Base]]
+        ) -> None:
+        """
+        Set values on `Object`, maintaining hash and similarity \
+        indexes on updated fields and marking sorted ones `stale`.
+
+        """
+
+        row_id = self._row_ids[id(object_)]
+        for k in updates:
+            if k in stale:
+                stale[k][row_id] = object_
+        indexes: list[typing.Union[HashIndex, SimilarityIndex]] = [
+            *(self.hash_indexes[k] for k in updates if k in self.hash_indexes),
+            *(
+                self.similarity_indexes[k]
+                for k
+                in updates
+                if k in self.similarity_indexes
+                ),
+            ]
+        for index in indexes:
+            index.remove(row_id, object_)
+        for field, value in updates.items():
+            setattr(object_, field, value)
+        for index in indexes:
+            index.add(row_id, object_)
+
+    def remove(self, object_: dtypes.BaseType) -> None:
+        """Remove `Object` from the collection."""
+
+        row_id = self._row_ids.pop(id(object_))
+        del self.rows[row_id]
+        for hash_index in self.hash_indexes.values():
+            hash_index.remove(row_id, object_)
+        for sorted_index in self.sorted_indexes.values():
+            sorted_index.remove(row_id, object_)
+        for similarity_index in self.similarity_indexes.values():
+            similarity_index.remove(row_id, object_)
+
+    def explain(self, q: dtypes.Query) -> str:
+        """Return description of the plan that would be used for `Query`."""
+
+        if (plan := self._plan(q)) is None:
+            return 'scan'
+        return plan[2]
+
+    def _plan(self, q: dtypes.Query) -> typing.Optional[Plan]:
+        if isinstance(q, query.AndQuery):
+            plans = [
+                plan
+                for operand
+                in q.and_
+                if (plan := self._plan(operand)) is not None  # type: ignore[arg-type]
+                ]
+            if not plans:
+                return None
+            return min(plans, key=lambda plan: plan[0])
+        elif isinstance(q, query.OrQuery):
+            or_plans = [self._plan(operand) for operand in q.or_]  # type: ignore[arg-type]
+            if not or_plans or any(plan is None for plan in or_plans):
+                return None
+            plans = typing.cast(list[Plan], or_plans)
+            return (
+                sum(size for size, _, _ in plans),
+                lambda: dict.fromkeys(
+                    itertools.chain.from_iterable(
+                        row_ids()
+                        for _, row_ids, _
+                        in plans
+                        )
+                    ),
+                ' | '.join(description for _, _, description in plans)
+                )
+        elif not isinstance(q, query.QueryCondition):
+            return None
+
+        name = self._key_for(q.field)
+        if (
+            isinstance(q, query.SimilarQueryCondition)
+            and (similarity_index := self.similarity_indexes.get(name))
+            ):
+            trigrams = similarity_index.trigrams
+            return (
+                trigrams.estimate(q.like, q.threshold),
+                lambda: dict.fromkeys(trigrams.search(q.like, q.threshold)),
+                repr(similarity_index)
+                )
+        elif (
+            (hash_index := self.hash_indexes.get(name))
+            and (
+                isinstance(q, query.ContainsQueryCondition)
+                if hash_index.is_array
+                else isinstance(q, query.EqQueryCondition)
+                )
+            ):
+            value = q['contains' if hash_index.is_array else 'eq']
+            return (
+                hash_index.count(value),
+                lambda: hash_index.lookup(value),
+                repr(hash_index)
+                )
+        elif (sorted_index := self.sorted_indexes.get(name)) is None:
+            return None
+        elif isinstance(q, query.EqQueryCondition) and q.eq is not None:
+            start, stop = sorted_index.bounds(q.eq, q.eq)
+        elif isinstance(q, query.GeQueryCondition) and q.ge is not None:
+            start, stop = sorted_index.bounds(lo=q.ge)
+        elif isinstance(q, query.GtQueryCondition) and q.gt is not None:
+            start, stop = sorted_index.bounds(lo=q.gt, include_lo=False)
+        elif isinstance(q, query.LeQueryCondition) and q.le is not None:
+            start, stop = sorted_index.bounds(hi=q.le)
+        elif isinstance(q, query.LtQueryCondition) and q.lt is not None:
+            start, stop = sorted_index.bounds(hi=q.lt, include_hi=False)
+        else:
+            return None
+        return (
+            stop - start + len(sorted_index.unordered),
+            lambda: sorted_index.rows(start, stop),
+            repr(sorted_index)
+            )
+
+    def query(self, q: dtypes.Query) -> list[dtypes.BaseType]:
+        """
+        Return `Objects` matching the `Query`, sorted by \
+        `Query.sorting` and limited to `Query.limit`.
+
+        """
+
+        if (plan := self._plan(q)) is None:
+            candidates: typing.Iterable[dtypes.BaseType] = self.rows.values()
+        else:
+            candidates = (
+                self.rows[row_id]
+                for row_id
+                in sorted(plan[1]())
+                )
+        return engine.execute(q, candidates)
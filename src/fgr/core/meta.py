@@ -2,16 +2,20 @@
 
 __all__ = (
     'Base',
+    'Key',
     'Meta',
+    'add_class_creation_hook',
+    'remove_class_creation_hook',
     )
 
 import copy
-import inspect
 import json
-import types
+import time
 import typing
 import sys
+import weakref
 
+from . import codec
 from . import constants
 from . import dtypes
 from . import exceptions
@@ -25,7 +29,877 @@ if typing.TYPE_CHECKING:
 
 class Constants(constants.PackageConstants):  # noqa
 
-        pass
+    HASH_SLOT = '__hash_value__'
+    RECORD_SHAPES_MAX = 128
+
+
+class Key(str):
+    """
+    Field key, as yielded by `Base.keys()`.
+
+    ---
+
+    Dict style access by `Key` returns nested `Base` values \
+    (and arrays of `Base` values) in their exported (`to_dict`) form, \
+    which is how `dict(Object)` recursively converts nested objects \
+    without any inspection of its caller.
+
+    """
+
+    __slots__ = ()
+
+
+ATOMIC_TYPES: tuple[type, ...] = (
+    *typing.get_args(dtypes.Primitive),
+    complex,
+    dtypes.NoneType,
+    )
+"""Types for which `copy.deepcopy` would return the value unchanged."""
+
+COMPILED: 'weakref.WeakSet[Meta]' = weakref.WeakSet()
+"""Derivatives with a generated `__init__`."""
+
+VALIDATED: 'weakref.WeakSet[Meta]' = weakref.WeakSet()
+"""Derivatives with a generated (validating or hash resetting) `__setattr__`."""
+
+RECORD_COMPILED: 'weakref.WeakSet[Meta]' = weakref.WeakSet()
+"""Derivatives with generated (and cached) record constructors."""
+
+ClassCreationHook = typing.Callable[['Meta', dict[str, float]], None]
+"""Called with each new derivative and seconds spent per phase."""
+
+CLASS_CREATION_HOOKS: list[ClassCreationHook] = []
+"""Hooks called after each class creation (see `add_class_creation_hook`)."""
+
+
+def add_class_creation_hook(hook: ClassCreationHook) -> None:
+    """
+    Register a hook called with each class created by `Meta` \
+    and the seconds spent on each phase of its creation.
+
+    ---
+
+    Phases are timed only while at least one hook is registered:
+
+    * `annotations`: resolving type annotations.
+    * `inheritance`: merging fields from (and rebasing) bases.
+    * `fields`: building `Field` objects from the namespace.
+    * `casing`: validating field name casing.
+    * `namespace`: building aliases, caches and class metadata.
+    * `type`: creating the class itself.
+    * `compile`: preparing generated methods.
+
+    Rebasing multiple bases creates a common base class, which is \
+    reported separately and also counted within `inheritance`.
+
+    ### Example
+
+    ```py
+    import fgr
+
+    timings = {}
+
+    def hook(cls, phases):
+        timings[cls.__name__] = sum(phases.values())
+
+    fgr.core.meta.add_class_creation_hook(hook)
+
+    ```
+
+    """
+
+    CLASS_CREATION_HOOKS.append(hook)
+
+
+def remove_class_creation_hook(hook: ClassCreationHook) -> None:
+    """Unregister a hook added by `add_class_creation_hook`."""
+
+    if hook in CLASS_CREATION_HOOKS:
+        CLASS_CREATION_HOOKS.remove(hook)
+
+
+class _PhaseTimer:
+    """Record seconds elapsed since the previous phase."""
+
+    __slots__ = (
+        'last',
+        'timings',
+        )
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self.last = time.perf_counter()
+
+    def __call__(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.timings[phase] = now - self.last
+        self.last = now
+
+
+def _no_timer(phase: str) -> None:
+    """Phase timer used while no hooks are registered."""
+
+
+def _is_shallow(default: typing.Any) -> bool:
+    """True if a shallow copy of the default is equivalent to a deep copy."""
+
+    if isinstance(default, dict):
+        return all(
+            isinstance(v, ATOMIC_TYPES)
+            for v
+            in (*default.keys(), *default.values())
+            )
+    elif isinstance(default, (list, set)):
+        return all(isinstance(v, ATOMIC_TYPES) for v in default)
+    else:
+        return False
+
+
+def _is_compiled_init(init: typing.Any) -> bool:
+    return getattr(init, '__compiled__', False)
+
+
+def _compile_init(cls: 'Meta') -> None:
+    """
+    Generate and set a straight-line `__init__` for the derivative.
+
+    ---
+
+    Each field is assigned directly to its slot, with \
+    factories, immutable defaults and mutable defaults \
+    (which are deep copied) resolved once, here, rather \
+    than per instantiation.
+
+    Only derivatives inheriting the generic `Base.__init__` \
+    (or an `__init__` previously generated here) are compiled, \
+    so custom constructors, such as `Field.__init__`, \
+    are left untouched.
+
+    """
+
+    if not (
+        (init := cls.__init__) is Base.__init__  # type: ignore[misc]
+        or _is_compiled_init(init)
+        ):
+        return None
+
+    names = frozenset(cls.__fields__)
+    namespace: dict[str, typing.Any] = {
+        '_deepcopy': copy.deepcopy,
+        '_mapping_for': _mapping_for,
+        '_resolve': _key_resolver(cls, names),
+        }
+    assign_defaults: list[str] = []
+    assign_values: list[str] = []
+    for i, (name, field) in enumerate(cls.__fields__.items()):
+        expr = _default_expression(i, field, namespace)
+        assign_defaults.append(f'        self.{name} = {expr}')
+        assign_values.append(
+            f'        self.{name} = values[{name!r}] '
+            f'if {name!r} in values else {expr}'
+            )
+
+    lines = [
+        'def __init__(self, class_as_dict=None, /, **kwargs):',
+        '    if class_as_dict:',
+        '        kwargs.update(_mapping_for(class_as_dict))',
+        '    if kwargs:',
+        '        values = _resolve(kwargs)',
+        *assign_values,
+        '    else:',
+        *(assign_defaults or ['        pass']),
+        ]
+    if cls.__post_init__ is not Base.__post_init__:  # type: ignore[attr-defined]
+        lines.append('    self.__post_init__()')
+
+    exec('\n'.join(lines), namespace)
+    __init__ = namespace['__init__']
+    __init__.__compiled__ = True
+    __init__.__module__ = cls.__module__
+    __init__.__qualname__ = '.'.join((cls.__qualname__, '__init__'))
+    cls.__init__ = __init__  # type: ignore[misc]
+    COMPILED.add(cls)
+
+
+def _defer(
+    cls: 'Meta',
+    name: str,
+    compile_: typing.Callable[['Meta'], typing.Any]
+    ) -> None:
+    """
+    Set a method for the derivative that generates \
+    (with `compile_`) and calls the real one on first use.
+
+    ---
+
+    Generating methods is the most expensive part of class \
+    creation, so it is deferred until first use (most \
+    derivatives of large schemas are never instantiated).
+
+    Only methods inherited from `Base` (or previously \
+    generated) are deferred.
+
+    """
+
+    if not (
+        (method := getattr(cls, name)) is getattr(Base, name)
+        or _is_compiled_init(method)
+        ):
+        return None
+
+    def deferred(self: Base, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        if cls.__dict__[name] is deferred:
+            compile_(cls)
+        return getattr(cls, name)(self, *args, **kwargs)
+
+    deferred.__compiled__ = True  # type: ignore[attr-defined]
+    deferred.__module__ = cls.__module__
+    deferred.__name__ = name
+    deferred.__qualname__ = '.'.join((cls.__qualname__, name))
+    setattr(cls, name, deferred)
+
+
+def _slot_setter(
+    cls: 'Meta',
+    name: str
+    ) -> typing.Callable[[typing.Any, typing.Any], None]:
+    """Return `__set__` of the slot for name (bypassing `__setattr__`)."""
+
+    slot = next(
+        (
+            base.__dict__[name]
+            for base
+            in cls.__mro__
+            if name in base.__dict__
+            ),
+        None
+        )
+    if hasattr(slot, '__set__'):
+        set_: typing.Callable[[typing.Any, typing.Any], None] = slot.__set__
+        return set_
+    else:
+        return lambda o, v: object.__setattr__(o, name, v)
+
+
+def _compile_setattr(cls: 'Meta') -> None:
+    """
+    Generate and set a `__setattr__` for the derivative \
+    validating (and coercing) values assigned to fields \
+    and / or resetting its cached hash.
+
+    ---
+
+    If `__validate_assignment__`, values are parsed by the \
+    compiled `Field.coercer` for each field, resolved once, here.
+
+    If `__cache_hash__`, assigning any of the `hash_fields` \
+    resets the cached hash (see `_compile_hash`).
+
+    Derivatives defining their own `__setattr__` are left untouched.
+
+    """
+
+    if (
+        '__setattr__' in cls.__dict__
+        and not _is_compiled_init(cls.__dict__['__setattr__'])
+        ):
+        return None
+
+    _setattr = object.__setattr__
+    hash_fields = frozenset(cls.hash_fields if cls.__cache_hash__ else ())
+    reset_hash = (
+        _slot_setter(cls, Constants.HASH_SLOT)
+        if hash_fields
+        else None
+        )
+    setters: dict[
+        str,
+        tuple[
+            typing.Optional[typing.Callable[[typing.Any], typing.Any]],
+            typing.Callable[[typing.Any, typing.Any], None],
+            typing.Optional[typing.Callable[[typing.Any, typing.Any], None]],
+            ]
+        ] = {}
+    for name, field in cls.__fields__.items():
+        if cls.__validate_assignment__ or name in hash_fields:
+            setters[name] = (
+                field.coercer()  # type: ignore[union-attr]
+                if cls.__validate_assignment__
+                else None,
+                _slot_setter(cls, name),
+                reset_hash if name in hash_fields else None
+                )
+
+    def __setattr__(self: Base, name: str, value: typing.Any) -> None:
+        if (setter := setters.get(name)) is not None:
+            coerce, set_, reset = setter
+            set_(self, value if coerce is None else coerce(value))
+            if reset is not None:
+                reset(self, None)
+        else:
+            _setattr(self, name, value)
+
+    __setattr__.__compiled__ = True  # type: ignore[attr-defined]
+    __setattr__.__qualname__ = '.'.join((cls.__qualname__, '__setattr__'))
+    cls.__setattr__ = __setattr__  # type: ignore[assignment, method-assign]
+    VALIDATED.add(cls)
+
+
+def _hash(object_: 'Base') -> int:
+    """
+    Hash `hash_fields` values (as generated by `_compile_hash`).
+
+    ---
+
+    Falsy values are hashed as `None`, and if any value \
+    is unhashable, objects are hashed by their string \
+    form instead (see `_hash_str`).
+
+    """
+
+    try:
+        return hash(
+            (
+                object_.hash_fields,
+                *(getattr(object_, k) or None for k in object_.hash_fields),
+                )
+            )
+    except TypeError:
+        return _hash_str(object_)
+
+
+def _hash_str(object_: 'Base') -> int:
+    """Hash truthy `hash_fields` values by their string form."""
+
+    return hash(
+        Constants.DELIM.join(
+            [
+                '.'.join((k, str(v)))
+                for k
+                in object_.hash_fields
+                if (v := getattr(object_, k))
+                ]
+            )
+        )
+
+
+def _compile_hash(cls: 'Meta') -> None:
+    """
+    Generate and set a straight-line `__hash__` for the derivative.
+
+    ---
+
+    Objects are hashed by a tuple of their `hash_fields` \
+    values (see `_hash`), resolved once, here.
+
+    If `__cache_hash__`, the hash is stored in a slot until \
+    any of the `hash_fields` are next assigned (values mutated \
+    in place are not tracked).
+
+    """
+
+    namespace: dict[str, typing.Any] = {
+        '_fields': cls.hash_fields,
+        '_hash_str': _hash_str,
+        }
+    values = ''.join(f'self.{name} or None, ' for name in cls.hash_fields)
+    compute = [
+        '    try:',
+        f'        h = hash((_fields, {values}))',
+        '    except TypeError:',
+        '        h = _hash_str(self)',
+        ]
+    if cls.__cache_hash__:
+        namespace['_set_hash'] = _slot_setter(cls, Constants.HASH_SLOT)
+        lines = [
+            'def __hash__(self):',
+            '    try:',
+            f'        if (h := self.{Constants.HASH_SLOT}) is not None:',
+            '            return h',
+            '    except AttributeError:',
+            '        pass',
+            *compute,
+            '    _set_hash(self, h)',
+            '    return h',
+            ]
+    else:
+        lines = ['def __hash__(self):', *compute, '    return h']
+
+    exec('\n'.join(lines), namespace)
+    __hash__ = namespace['__hash__']
+    __hash__.__compiled__ = True
+    __hash__.__module__ = cls.__module__
+    __hash__.__qualname__ = '.'.join((cls.__qualname__, '__hash__'))
+    cls.__hash__ = __hash__  # type: ignore[method-assign]
+
+
+def _compile_from_record(
+    cls: 'Meta',
+    keys: tuple[str, ...],
+    decode: bool = False
+    ) -> typing.Callable[[dict[str, typing.Any]], 'Base']:
+    """
+    Generate and return a constructor for records (dicts) \
+    with exactly the keys specified.
+
+    ---
+
+    Aliases are resolved to slot names once, here, so each \
+    record costs one key lookup per field present and one \
+    default per field missing.
+
+    If `decode` is `True`, records are expected as decoded \
+    from JSON and values are converted to their field types \
+    (see `codec.decoder`), with decoders resolved once, here.
+
+    Up to `Constants.RECORD_SHAPES_MAX` constructors \
+    are cached per derivative (and value of `decode`); \
+    records of any further shapes are passed to `__init__` \
+    (see `_init_from_record`) rather than compiled.
+
+    """
+
+    cache = cls.__cache__['from_json' if decode else 'from_record']
+    if len(cache) >= Constants.RECORD_SHAPES_MAX:
+        return _init_from_record(cls, keys, decode)
+
+    values: dict[str, str] = {}
+    for key in keys:
+        if (k := utils.key_for(cls, key)):
+            values[k] = key
+        else:
+            raise exceptions.InvalidFieldRedefinitionError(key)
+
+    namespace: dict[str, typing.Any] = {
+        '_cls': cls,
+        '_deepcopy': copy.deepcopy,
+        '_new': object.__new__,
+        }
+    lines = [
+        'def from_record(record):',
+        '    self = _new(_cls)',
+        ]
+    globalns = getattr(sys.modules.get(cls.__module__), '__dict__', None)
+    for i, (name, field) in enumerate(cls.__fields__.items()):
+        if name not in values:
+            expr = _default_expression(i, field, namespace)
+        elif (
+            decode
+            and (decoder := codec.decoder(field['type'], globalns)) is not None
+            ):
+            namespace[f'_decode_{i}'] = decoder
+            expr = ' '.join(
+                (
+                    f'None if (v := record[{values[name]!r}]) is None',
+                    f'else _decode_{i}(v)',
+                    )
+                )
+        else:
+            expr = f'record[{values[name]!r}]'
+        lines.append(f'    self.{name} = {expr}')
+    if cls.__post_init__ is not Base.__post_init__:  # type: ignore[attr-defined]
+        lines.append('    self.__post_init__()')
+    lines.append('    return self')
+
+    exec('\n'.join(lines), namespace)
+    from_record: typing.Callable[[dict[str, typing.Any]], 'Base'] = (
+        namespace['from_record']
+        )
+    cache[keys] = from_record
+    RECORD_COMPILED.add(cls)
+    return from_record
+
+
+def _init_from_record(
+    cls: 'Meta',
+    keys: tuple[str, ...],
+    decode: bool
+    ) -> typing.Callable[[dict[str, typing.Any]], 'Base']:
+    """
+    Return a constructor for records (dicts) with the keys \
+    specified, that calls `__init__` (after decoding values, \
+    if `decode`) instead of a generated constructor.
+
+    """
+
+    if not decode:
+        return cls
+
+    globalns = getattr(sys.modules.get(cls.__module__), '__dict__', None)
+    decoders: dict[str, codec.Decoder] = {}
+    for key in keys:
+        if (
+            (k := utils.key_for(cls, key))
+            and (
+                decoder := codec.decoder(cls.__fields__[k]['type'], globalns)
+                ) is not None
+            ):
+            decoders[key] = decoder
+
+    def from_record(record: dict[str, typing.Any]) -> 'Base':
+        return typing.cast(
+            'Base',
+            cls(
+                {
+                    key: (
+                        value
+                        if value is None or (decoder := decoders.get(key)) is None
+                        else decoder(value)
+                        )
+                    for key, value
+                    in record.items()
+                    }
+                )
+            )
+
+    return from_record
+
+
+def _from_json_record(
+    cls: 'Meta',
+    record: dict[str, typing.Any]
+    ) -> 'Base':
+    """Return object from a record (dict) decoded from JSON."""
+
+    from_record = (
+        cls.__cache__['from_json'].get(keys := tuple(record))
+        or _compile_from_record(cls, keys, decode=True)
+        )
+    return from_record(record)
+
+
+def _compile_from_values(
+    cls: 'Meta'
+    ) -> typing.Callable[..., 'Base']:
+    """
+    Generate, cache and return a constructor taking one \
+    positional argument per field (in `__fields__` order), \
+    assigned to slots as is.
+
+    ---
+
+    Intended for rehydrating objects from previously \
+    initialized state, so `__post_init__` is not called.
+
+    """
+
+    names = tuple(cls.__fields__)
+    namespace: dict[str, typing.Any] = {
+        '_cls': cls,
+        '_new': object.__new__,
+        }
+    lines = [
+        f'def from_values({", ".join(f"_{i}" for i in range(len(names)))}):',
+        '    self = _new(_cls)',
+        *(f'    self.{name} = _{i}' for i, name in enumerate(names)),
+        '    return self',
+        ]
+
+    exec('\n'.join(lines), namespace)
+    from_values: typing.Callable[..., 'Base'] = namespace['from_values']
+    cls.__cache__['from_values'] = from_values
+    return from_values
+
+
+def _rehydrate(cls: 'Meta', *values: typing.Any) -> 'Base':
+    """Return object from field values (see `Base.__reduce__`)."""
+
+    from_values = cls.__cache__.get('from_values') or _compile_from_values(cls)
+    return from_values(*values)
+
+
+def _compile_reduce(cls: 'Meta') -> None:
+    """
+    Generate and set a straight-line `__reduce__` for the derivative.
+
+    ---
+
+    Objects are pickled as a reference to the derivative \
+    followed by their values in `__fields__` order, and \
+    unpickled by `_rehydrate` (so `__post_init__` is not called).
+
+    """
+
+    namespace: dict[str, typing.Any] = {
+        '_cls': cls,
+        '_rehydrate': _rehydrate,
+        }
+    values = ''.join(f'self.{name}, ' for name in cls.__fields__)
+    lines = [
+        'def __reduce__(self):',
+        f'    return (_rehydrate, (_cls, {values}))',
+        ]
+
+    exec('\n'.join(lines), namespace)
+    __reduce__ = namespace['__reduce__']
+    __reduce__.__compiled__ = True
+    __reduce__.__module__ = cls.__module__
+    __reduce__.__qualname__ = '.'.join((cls.__qualname__, '__reduce__'))
+    cls.__reduce__ = __reduce__  # type: ignore[method-assign]
+
+
+def _default_expression(
+    i: int,
+    field: dtypes.FieldType,
+    namespace: dict[str, typing.Any]
+    ) -> str:
+    """
+    Add field default to namespace as `_default_{i}` and return \
+    the expression that evaluates to a (mutation-safe) default.
+
+    """
+
+    default = field['default']
+    namespace[f'_default_{i}'] = default
+    if callable(default):
+        return f'_default_{i}()'
+    elif (
+        field['type'] in typing.get_args(dtypes.Immutable)
+        or isinstance(default, ATOMIC_TYPES)
+        ):
+        return f'_default_{i}'
+    elif _is_shallow(default):
+        return f'_default_{i}.copy()'
+    else:
+        return f'_deepcopy(_default_{i})'
+
+
+def _key_resolver(
+    cls: 'Meta',
+    names: frozenset[str]
+    ) -> typing.Callable[[dict[str, typing.Any]], dict[str, typing.Any]]:
+    """Return function mapping keyword keys (or aliases) to slot names."""
+
+    def _resolve(kwargs: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        values: dict[str, typing.Any] = {}
+        for key, value in kwargs.items():
+            if key in names:
+                values[key] = value
+            elif (k := utils.key_for(cls, key)):
+                values[k] = value
+            else:
+                raise exceptions.InvalidFieldRedefinitionError(key)
+        return values
+
+    return _resolve
+
+
+SCALAR_TYPES: frozenset[type] = frozenset(
+    (
+        *typing.get_args(dtypes.Primitive),
+        dtypes.NoneType,
+        )
+    )
+"""Types exported as is by `Base.to_dict`."""
+
+
+def _compile_to_dict(
+    cls: 'Meta',
+    camel_case: bool,
+    include_null: bool
+    ) -> typing.Callable[['Base'], dict[str, typing.Any]]:
+    """
+    Generate, cache and return a straight-line `to_dict` \
+    for the derivative and options.
+
+    ---
+
+    Output keys are resolved once, here, and scalar values \
+    are copied without any further type dispatch; all other \
+    values are exported by `_to_serial`.
+
+    """
+
+    namespace: dict[str, typing.Any] = {
+        '_scalars': SCALAR_TYPES,
+        '_to_serial': _to_serial,
+        }
+    lines = [
+        'def to_dict(self):',
+        '    d = {}',
+        ]
+    for name in cls.__fields__:
+        key = (
+            utils.to_camel_case(name.strip('_'))
+            if camel_case
+            else name.rstrip('_')
+            )
+        assignment = ' '.join(
+            (
+                f'd[{key!r}] = v if v.__class__ in _scalars',
+                f'else _to_serial(v, {camel_case}, {include_null})',
+                )
+            )
+        lines.append(f'    v = self.{name}')
+        if include_null:
+            lines.append(f'    {assignment}')
+        else:
+            lines.append('    if v is not None:')
+            lines.append(f'        {assignment}')
+    lines.append('    return d')
+
+    exec('\n'.join(lines), namespace)
+    to_dict: typing.Callable[['Base'], dict[str, typing.Any]] = (
+        namespace['to_dict']
+        )
+    cls.__cache__['to_dict'][(camel_case, include_null)] = to_dict
+    return to_dict
+
+
+def _to_serial(
+    value: typing.Any,
+    camel_case: bool,
+    include_null: bool
+    ) -> typing.Any:
+    """Export non-scalar field value for `Base.to_dict`."""
+
+    if isinstance(value, Base):
+        return value.to_dict(camel_case, include_null)
+    elif isinstance(value, dict):
+        return {
+            (
+                utils.to_camel_case(k.strip('_'))
+                if (camel_case and isinstance(k, str))
+                else k
+                ): (
+                    v.to_dict(camel_case, include_null)
+                    if isinstance(v, Base)
+                    else v
+                    )
+            for k, v
+            in value.items()
+            if utils.is_public_field(k)
+            and (include_null or v is not None)
+            }
+    elif isinstance(value, typing.get_args(dtypes.Array)):
+        return value.__class__(
+            v.to_dict(camel_case, include_null)
+            if isinstance(v, Base)
+            else v
+            for v
+            in value
+            if (include_null or v is not None)
+            )
+    else:
+        return value
+
+
+def _export(value: typing.Any) -> typing.Any:
+    """Return nested `Base` value (or array of) in exported form."""
+
+    if isinstance(value, Base):
+        return value.to_dict()
+    elif utils.is_obj_array_type(value):
+        return value.__class__(obj.to_dict() for obj in value)  # type: ignore[call-arg]
+    else:
+        return value
+
+
+def _mapping_for(
+    class_as_dict: typing.Union['Base', typing.Mapping[str, typing.Any]]
+    ) -> typing.Mapping[str, typing.Any]:
+    """Return raw field values if `Base`, otherwise the mapping as is."""
+
+    if isinstance(class_as_dict, Base):
+        return {
+            name: getattr(class_as_dict, name)
+            for name
+            in class_as_dict.__fields__
+            }
+    else:
+        return class_as_dict
+
+
+def _default_object(cls: 'Meta') -> 'Base':
+    """
+    Return a default instance of the derivative, created once \
+    (by `__init__`, so factories are called and mutable defaults \
+    resolved) and cached until a field is redefined.
+
+    """
+
+    try:
+        default: 'Base' = cls.__cache__['default']
+    except KeyError:
+        default = cls.__cache__['default'] = cls()
+    return default
+
+
+def _iter_merge(
+    object_: 'Base',
+    other: 'Base',
+    overwrite: bool
+    ) -> typing.Iterator[tuple[str, typing.Any]]:
+    """
+    Yield `(field, value)` for each non-default value in other \
+    to merge into object (if `overwrite`, or the object's value \
+    is the default).
+
+    ---
+
+    Defaults are the values of a default instance (see \
+    `_default_object`), not the raw `Field` defaults, so \
+    fields with factory defaults compare as expected.
+
+    """
+
+    same = other.__class__ is object_.__class__
+    default_object = _default_object(object_.__class__)
+    for field in object_.__fields__:
+        default = getattr(default_object, field)
+        if (
+            (value := getattr(other, field) if same else other[field]) != default
+            and (overwrite or getattr(object_, field) == default)
+            ):
+            yield field, value
+
+
+def _merged(
+    object_: dtypes.BaseType,
+    other: dtypes.BaseType,
+    overwrite: bool
+    ) -> dtypes.BaseType:
+    """
+    Return new object with values from other merged.
+
+    ---
+
+    Values are assigned as is (not copied), then `__post_init__` \
+    is called, as it would be by `__init__`.
+
+    """
+
+    values = {field: getattr(object_, field) for field in object_.__fields__}
+    values.update(_iter_merge(object_, other, overwrite))
+    from_values = (
+        object_.__cache__.get('from_values')
+        or _compile_from_values(object_.__class__)
+        )
+    merged = typing.cast(dtypes.BaseType, from_values(*values.values()))
+    merged.__post_init__()
+    return merged
+
+
+def _recompile_init(field: dtypes.FieldType) -> None:
+    """
+    Regenerate `__init__` (and validating `__setattr__`) \
+    for all derivatives sharing the field, discarding \
+    any default instance cached for `Base.__bool__` and \
+    any cached record constructors.
+
+    """
+
+    for cls in list(COMPILED):
+        if any(f is field for f in cls.__fields__.values()):
+            _compile_init(cls)
+            cls.__cache__.pop('default', None)
+    for cls in list(RECORD_COMPILED):
+        if any(f is field for f in cls.__fields__.values()):
+            cls.__cache__['from_json'] = {}
+            cls.__cache__['from_record'] = {}
+    for cls in list(VALIDATED):
+        if any(f is field for f in cls.__fields__.values()):
+            _compile_setattr(cls)
 
 
 class Meta(type):
@@ -33,8 +907,11 @@ class Meta(type):
 
     if typing.TYPE_CHECKING:
         __fields__: typing.ClassVar[typing.Mapping[str, dtypes.FieldType]] = {}
+        __aliases__: typing.ClassVar[typing.Mapping[str, str]] = {}
         __heritage__: typing.ClassVar[tuple[type['Base'], ...]] = ()
         __cache__: typing.ClassVar[dict[str, typing.Any]] = {}
+        __validate_assignment__: typing.ClassVar[bool] = False
+        __cache_hash__: typing.ClassVar[bool] = False
 
         description: typing.ClassVar[str] = Constants.UNDEFINED
         distribution: typing.ClassVar[str] = Constants.UNDEFINED
@@ -52,8 +929,26 @@ class Meta(type):
         __namespace: dict[str, typing.Any],
         **kwargs: typing.Any
         ) -> dtypes.MetaType:
+        timer = _PhaseTimer() if CLASS_CREATION_HOOKS else None
+        lap = timer or _no_timer
         fields: dict[str, dtypes.FieldType] = {}
         heritage: tuple[type, ...] = __bases
+        validate_assignment = kwargs.pop(
+            'validate_assignment',
+            any(
+                getattr(_base, '__validate_assignment__', False)
+                for _base
+                in __bases
+                )
+            )
+        cache_hash = kwargs.pop(
+            'cache_hash',
+            any(
+                getattr(_base, '__cache_hash__', False)
+                for _base
+                in __bases
+                )
+            )
         slots: list[str] = (
             [_slots,]
             if isinstance(
@@ -73,6 +968,7 @@ class Meta(type):
             __namespace.pop('__annotations__', {}),
             sys.modules[module].__dict__
             )
+        lap('annotations')
 
         base_count = 0
         for _base in reversed(__bases):
@@ -85,17 +981,17 @@ class Meta(type):
             common_base_names: list[str] = []
             common_bases: list[type['Base']] = []
             common_namespace: dict[str, typing.Any] = {}
-            common_slots: list[str] = []
+            common_slots: dict[str, None] = {}
+            seen: set[str] = set()
             for _base in reversed(__bases):
                 for __base in reversed(_base.__mro__):
                     if issubclass(__base, Base) and __base is not Base:
-                        if __base.__name__ not in common_base_names:
+                        if __base.__name__ not in seen:
+                            seen.add(__base.__name__)
                             common_base_names.insert(0, __base.__name__)
                             common_bases.insert(0, __base)
                             common_namespace.update(__base.__dict__)
-                            for slot in __base.__slots__:
-                                if slot not in common_slots:
-                                    common_slots.append(slot)
+                            common_slots.update(dict.fromkeys(__base.__slots__))
                             common_annotations.update(__base.__annotations__)
             common_namespace = {
                 k: v
@@ -114,8 +1010,14 @@ class Meta(type):
                 common_namespace
                 )
             __bases = (common_base, )
+        lap('inheritance')
 
         if module != Constants.META_MODULE:
+            Field = (
+                modules.Modules.fields.Field  # type: ignore[attr-defined]
+                if module == Constants.FIELDS_MODULE
+                else modules.Modules().fields.Field  # type: ignore[attr-defined]
+                ) if annotations else None
             base_fields = set(fields.keys())
             defaults: list[str] = []
             for name, default in __namespace.items():
@@ -143,9 +1045,7 @@ class Meta(type):
                         and default
                         and is_field_as_dict
                         ):
-                        default = modules.Modules().fields.Field(  # type: ignore[attr-defined]
-                            **__namespace.get(name)
-                            )
+                        default = Field(**__namespace.get(name))
                     else:
                         default = __namespace.get(name)
                     if (dtype := annotations.get(name)):
@@ -166,12 +1066,12 @@ class Meta(type):
                     continue
                 elif not utils.is_valid_keyword(name):
                     raise exceptions.ReservedKeywordError(name)
-                elif (
-                    dtypes.utils.is_classvar(dtype)
-                    or dtypes.utils.is_finalvar(dtype)
-                    ):
-                    continue
                 elif not getattr(dtype, '__name__', '') == 'Field':
+                    if (
+                        dtypes.utils.is_classvar(dtype)
+                        or dtypes.utils.is_finalvar(dtype)
+                        ):
+                        continue
                     raise exceptions.FieldAnnotationeError(name, dtype)
                 elif (
                     (default := __namespace.pop(name, Constants.UNDEFINED))
@@ -181,22 +1081,14 @@ class Meta(type):
                     default = None
                 else:
                     required = False
-                if module == Constants.FIELDS_MODULE:
-                    field = modules.Modules.fields.Field(  # type: ignore[attr-defined]
-                        name=name,
-                        type=typing.get_args(dtype)[0],
-                        default=default,
-                        required=required,
-                        )
-                else:
-                    field = modules.Modules().fields.Field(  # type: ignore[attr-defined]
-                        name=name,
-                        type=typing.get_args(dtype)[0],
-                        default=default,
-                        required=required,
-                        )
-                fields[name] = field
+                fields[name] = Field(
+                    name=name,
+                    type=typing.get_args(dtype)[0],
+                    default=default,
+                    required=required,
+                    )
                 slots.append(name)
+        lap('fields')
 
         is_snake_case = (
             utils.is_snake_case(fields)
@@ -210,15 +1102,31 @@ class Meta(type):
             )
         if fields and not (is_snake_case or isCamelCase):
             raise exceptions.IncorrectCasingError(fields)
+        lap('casing')
+
+        if cache_hash and not any(
+            hasattr(_base, Constants.HASH_SLOT)
+            for _base
+            in __bases
+            ):
+            slots.append(Constants.HASH_SLOT)
 
         namespace = {
-            '__slots__': tuple(slots),
             **__namespace,
+            '__slots__': tuple(dict.fromkeys(slots)),
             }
 
         namespace['__fields__'] = fields
+        namespace['__aliases__'] = utils.get_aliases(fields, is_snake_case)
         namespace['__heritage__'] = heritage
-        namespace['__cache__'] = {}
+        namespace['__validate_assignment__'] = bool(validate_assignment)
+        namespace['__cache_hash__'] = bool(cache_hash)
+        namespace['__cache__'] = {
+            'from_json': {},
+            'from_record': {},
+            'keys': tuple(Key(f.rstrip('_')) for f in fields),
+            'to_dict': {},
+            }
         namespace['fields'] = tuple(
             f
             for f
@@ -236,8 +1144,9 @@ class Meta(type):
         namespace['reference'] = utils.get_reference(__name, module)
         namespace['is_snake_case'] = is_snake_case
         namespace['isCamelCase'] = isCamelCase
+        lap('namespace')
 
-        return super().__new__(
+        cls = super().__new__(
             mcs,
             __name,
             __bases,
@@ -245,15 +1154,44 @@ class Meta(type):
             **kwargs
             )
 
+        lap('type')
+
+        if module != Constants.META_MODULE:
+            _defer(cls, '__init__', _compile_init)
+            _defer(cls, '__hash__', _compile_hash)
+            _defer(cls, '__reduce__', _compile_reduce)
+            if validate_assignment or cache_hash:
+                _compile_setattr(cls)
+        lap('compile')
+
+        if timer is not None:
+            for hook in tuple(CLASS_CREATION_HOOKS):
+                hook(cls, timer.timings)
+
+        return cls
+
     def __getattribute__(cls, __name: str) -> typing.Any:
-        __fields: dict[str, dtypes.FieldType] = type.__getattribute__(
-            cls,
-            '__fields__'
-            )
-        if (field := __fields.get(__name)):
+        """Return Field for field names, otherwise the class attribute."""
+
+        if (
+            field := type.__getattribute__(cls, '__fields__').get(__name)
+            ) is not None:
             return field
-        else:
-            return super().__getattribute__(__name)
+        return type.__getattribute__(cls, __name)
+
+    def __setattr__(cls, __name: str, __value: typing.Any) -> None:
+        """Set class attribute, raising for fields of the class."""
+
+        if __name in cls.__fields__:
+            raise exceptions.InvalidFieldRedefinitionError(__name)
+        type.__setattr__(cls, __name, __value)
+
+    def __delattr__(cls, __name: str) -> None:
+        """Delete class attribute, raising for fields of the class."""
+
+        if __name in cls.__fields__:
+            raise exceptions.InvalidFieldRedefinitionError(__name)
+        type.__delattr__(cls, __name)
 
     @typing.overload
     def __getitem__(cls: type['fields_.Field'], key: type[dtypes.Type]) -> 'fields_.Field[dtypes.Type]': ...  # type: ignore[misc]  # noqa
@@ -298,6 +1236,8 @@ class Meta(type):
             raise exceptions.IncorrectDefaultTypeError(k, ftype, value['default'])
         elif k:
             cls.__fields__[k].update(value)
+            cls.__cache__.pop('default', None)
+            _recompile_init(cls.__fields__[k])
         else:
             raise exceptions.InvalidFieldRedefinitionError(key)
 
@@ -408,8 +1348,11 @@ class Base(metaclass=Meta):
 
     if typing.TYPE_CHECKING:
         __fields__: typing.ClassVar[typing.Mapping[str, dtypes.FieldType]] = {}
+        __aliases__: typing.ClassVar[typing.Mapping[str, str]] = {}
         __heritage__: typing.ClassVar[tuple[type['Base'], ...]] = ()
         __cache__: typing.ClassVar[dict[str, typing.Any]] = {}
+        __validate_assignment__: typing.ClassVar[bool] = False
+        __cache_hash__: typing.ClassVar[bool] = False
 
         description: typing.ClassVar[str] = Constants.UNDEFINED
         distribution: typing.ClassVar[str] = Constants.UNDEFINED
@@ -428,7 +1371,7 @@ class Base(metaclass=Meta):
         /,
         **kwargs: typing.Any
         ):
-        kwargs.update(class_as_dict or {})
+        kwargs.update(_mapping_for(class_as_dict or {}))
         for name, field in self.__fields__.items():
             self[name] = kwargs.get(
                 name,
@@ -448,36 +1391,22 @@ class Base(metaclass=Meta):
         """Method that will always run after instantiation."""
 
     def __getitem__(self, key: str) -> typing.Any:
-        """Return field value dict style."""
+        """
+        Return field value dict style.
+
+        ---
+
+        If key is a `Key` (as yielded by `keys()`, and so as used \
+        by `dict(Object)`), nested `Base` values are returned \
+        in their exported form.
+
+        """
 
         if (k := utils.key_for(self, key)):
-            value = getattr(self, k)
-            if (
-                (
-                    (is_obj := isinstance(value, Base))
-                    or utils.is_obj_array_type(value)
-                    )
-                and (
-                    callers := typing.cast(
-                        types.FrameType,
-                        typing.cast(
-                            types.FrameType,
-                            inspect.currentframe()
-                            ).f_back
-                        ).f_code.co_names
-                    )
-                and 'dict' in callers
-                and (
-                    callers[0] == 'dict'
-                    or callers[callers.index('dict') - 1] != 'to_dict'
-                    )
-                ):
-                if is_obj:
-                    return value.to_dict()  # type: ignore[union-attr]
-                else:
-                    return value.__class__(obj.to_dict() for obj in value)  # type: ignore[arg-type, call-arg, union-attr]
+            if key.__class__ is Key:
+                return _export(getattr(self, k))
             else:
-                return value
+                return getattr(self, k)
         else:
             raise KeyError(key)
 
@@ -523,21 +1452,22 @@ class Base(metaclass=Meta):
             )
 
     def __hash__(self) -> int:
-        return hash(
-            Constants.DELIM.join(
-                [
-                    '.'.join((k, str(v)))
-                    for k
-                    in self.hash_fields
-                    if (v := self[k])
-                    ]
-                )
-            )
+        return _hash(self)
 
     def __bool__(self) -> bool:
-        """Determine truthiness by diff with default field values."""
+        """
+        Determine truthiness by diff with default field values.
 
-        return bool(self - self.__class__())
+        ---
+
+        Compares against a default instance of the derivative, \
+        created once and cached, stopping at the first difference.
+
+        """
+
+        for _ in self.iter_diff(_default_object(self.__class__)):
+            return True
+        return False
 
     def __eq__(self, other: object) -> bool:
 
@@ -553,11 +1483,7 @@ class Base(metaclass=Meta):
         ) -> dict[str, typing.Any]:
         """Calculate diff between same object types."""
 
-        diff = {}
-        for field in self.__fields__:
-            if self[field] != other[field]:
-                diff[field] = other[field]
-        return diff
+        return {field: value for field, _, value in self.iter_diff(other)}
 
     def __lshift__(
         self: dtypes.BaseType,
@@ -569,16 +1495,7 @@ class Base(metaclass=Meta):
 
         """
 
-        object_ = self.__class__()
-        for field, __field in self.__fields__.items():
-            if (
-                self[field] == __field['default']
-                and other[field] != __field['default']
-                ):
-                object_[field] = other[field]
-            else:
-                object_[field] = self[field]
-        return object_
+        return _merged(self, other, overwrite=False)
 
     def __rshift__(
         self: dtypes.BaseType,
@@ -590,17 +1507,93 @@ class Base(metaclass=Meta):
 
         """
 
-        object_ = self.__class__()
-        for field, __field in self.__fields__.items():
-            if other[field] != __field['default']:
-                object_[field] = other[field]
-            else:
-                object_[field] = self[field]
-        return object_
+        return _merged(self, other, overwrite=True)
+
+    def __ilshift__(
+        self: dtypes.BaseType,
+        other: dtypes.BaseType
+        ) -> dtypes.BaseType:
+        """Interpolate values from other (as `<<`) in place."""
+
+        for field, value in _iter_merge(self, other, overwrite=False):
+            setattr(self, field, value)
+        return self
+
+    def __irshift__(
+        self: dtypes.BaseType,
+        other: dtypes.BaseType
+        ) -> dtypes.BaseType:
+        """Overwrite values from other (as `>>`) in place."""
+
+        for field, value in _iter_merge(self, other, overwrite=True):
+            setattr(self, field, value)
+        return self
+
+    def iter_diff(
+        self: dtypes.BaseType,
+        other: typing.Union[dtypes.BaseType, typing.Mapping[str, typing.Any]]
+        ) -> typing.Iterator[tuple[str, typing.Any, typing.Any]]:
+        """
+        Lazily yield `(field, value, other_value)` for each \
+        field with a different value in other.
+
+        ---
 
-    def __getstate__(self) -> dict[str, typing.Any]:
-        return {'__values__': dict(self)}
+        Values are read directly from slots if other is of the \
+        same type, otherwise by key (`other[field]`).
 
+        ### Example
+
+        ```py
+        import fgr
+
+
+        class Pet(fgr.Object):
+            \"""A pet.\"""
+
+            name: fgr.Field[str]
+            age: fgr.Field[int] = 1
+
+
+        changes = dict(
+            (field, new)
+            for field, old, new
+            in Pet(name='Fido').iter_diff(Pet(name='Rex'))
+            )
+        assert changes == {'name': 'Rex'}
+
+        ```
+
+        """
+
+        if other.__class__ is self.__class__:
+            for field in self.__fields__:
+                if (
+                    (value := getattr(self, field))
+                    != (other_value := getattr(other, field))
+                    ):
+                    yield field, value, other_value
+        else:
+            for field in self.__fields__:
+                if (value := getattr(self, field)) != (other_value := other[field]):
+                    yield field, value, other_value
+
+    def __reduce__(
+        self
+        ) -> tuple[typing.Callable[..., 'Base'], tuple[typing.Any, ...]]:
+        """
+        Return derivative and field values (in `__fields__` order) \
+        for `pickle` and `copy`.
+
+        """
+
+        return (
+            _rehydrate,
+            (self.__class__, *(getattr(self, f) for f in self.__fields__))
+            )
+
+    # Only loads pickles from previous versions (pickled with
+    # state {'__values__': dict(self)}); see __reduce__.
     def __setstate__(
         self,
         state: dict[str, typing.Union[dict, typing.Any]]
@@ -643,8 +1636,7 @@ class Base(metaclass=Meta):
 
         """
 
-        for field in cls.__fields__:
-            yield field.rstrip('_')
+        yield from cls.__cache__['keys']
 
     def setdefault(self, key: str, value: typing.Any) -> None:
         """Set value for key if unset; otherwise do nothing."""
@@ -696,64 +1688,16 @@ class Base(metaclass=Meta):
 
         """
 
-        d = {
-            k: v
-            for k
-            in self.__fields__
-            if (v := self[k]) is not None
-            or (include_null and v is None)
-            }
-        dbo: dict[str, typing.Any] = {}
-        for k, v in d.items():
-            if isinstance(v, Base):
-                dbo[k] = v.to_dict(camel_case, include_null)
-            elif isinstance(v, dict):
-                dbo[k] = {
-                    (
-                        utils.to_camel_case(_k.strip('_'))
-                        if (camel_case and isinstance(_k, str))
-                        else _k
-                        ): (
-                            _v.to_dict(camel_case, include_null)
-                            if isinstance(_v, Base)
-                            else
-                            _v
-                            )
-                    for _k, _v
-                    in v.items()
-                    if utils.is_public_field(_k)
-                    and (
-                        _v is not None
-                        if not include_null
-                        else True
-                        )
-                    }
-            elif isinstance(v, typing.get_args(dtypes.Array)):
-                dbo[k] = v.__class__(
-                    _v.to_dict(camel_case, include_null)
-                    if isinstance(_v, Base)
-                    else
-                    _v
-                    for _v
-                    in v
-                    if (
-                        _v is not None
-                        if not include_null
-                        else True
-                        )
-                    )
-            else:
-                dbo[k] = v
-        if camel_case:
-            dbo = {
-                utils.to_camel_case(k.strip('_')): v
-                for k, v
-                in dbo.items()
-                }
-        else:
-            dbo = {
-                k.rstrip('_'): v
-                for k, v
-                in dbo.items()
-                }
-        return dbo
+        to_dict: typing.Callable[['Base'], dict[str, typing.Any]]
+        try:
+            to_dict = self.__cache__['to_dict'][
+                (camel_case := bool(camel_case)),
+                (include_null := bool(include_null))
+                ]
+        except KeyError:
+            to_dict = _compile_to_dict(
+                self.__class__,
+                camel_case,
+                include_null
+                )
+        return to_dict(self)
@@ -4,8 +4,12 @@ __all__ = (
     'Object',
     )
 
+import json
+import typing
+
 from . import constants
 from . import dtypes
+from . import exceptions
 from . import fields
 from . import meta
 
@@ -177,6 +181,62 @@ class Object(meta.Base):  # type: ignore[misc]
 
     ```
 
+    #### Validated Assignment
+    Values are assigned to fields as is by default. Pass \
+    `validate_assignment=True` on the class definition to parse \
+    every value assigned (including on instantiation) with the \
+    compiled `Field.coercer` for its field, raising \
+    `IncorrectTypeError` for invalid values. The setting is \
+    inherited by derivatives.
+
+    * Derivatives that do not opt in keep the default \
+    (unvalidated) assignment path, at no extra cost.
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object, validate_assignment=True):
+        \"""A pet.\"""
+
+        age: fgr.Field[int]
+
+
+    pet = Pet(age='3')
+    assert pet.age == 3
+
+    pet.age = 'three'  # Raises IncorrectTypeError.
+    ```
+
+    #### Cached Hashing
+    Objects are hashed (and compared) by the values of their \
+    `hash_fields`. Pass `cache_hash=True` on the class definition \
+    to compute each object's hash once, until any of its \
+    `hash_fields` are next assigned. The setting is inherited \
+    by derivatives.
+
+    * Values mutated in place (for example, appending to a list) \
+    do not reset the cached hash.
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object, cache_hash=True):
+        \"""A pet.\"""
+
+        id_: fgr.Field[str]
+
+
+    pets = {Pet(id='abc123'), Pet(id='abc123'), Pet(id='def456')}
+    assert len(pets) == 2
+    ```
+
+    #### Pickling
+    Objects are pickled (and copied) compactly, as a reference \
+    to their class followed by their values in field order. \
+    `__post_init__` is not called again when unpickled.
+
     ---
 
     Special Method Usage
@@ -296,3 +356,211 @@ class Object(meta.Base):  # type: ignore[misc]
     ```
 
     """
+
+    @classmethod
+    def from_records(
+        cls: type[dtypes.BaseType],
+        records: typing.Iterable[typing.Mapping[str, typing.Any]],
+        /
+        ) -> list[dtypes.BaseType]:
+        """
+        Return a list of objects from an iterable of dicts.
+
+        ---
+
+        Equivalent to `[cls(record) for record in records]`.
+
+        See `iter_from_records` for more detail.
+
+        """
+
+        return list(cls.iter_from_records(records))  # type: ignore[attr-defined]
+
+    @classmethod
+    def iter_from_records(
+        cls: type[dtypes.BaseType],
+        records: typing.Iterable[typing.Mapping[str, typing.Any]],
+        /
+        ) -> typing.Iterator[dtypes.BaseType]:
+        """
+        Yield objects from an iterable of dicts.
+
+        ---
+
+        Key (and alias) resolution and default handling are \
+        compiled once per distinct set of keys, rather than \
+        per record, so batches of uniformly keyed records \
+        (ex. rows from a database) are hydrated at close \
+        to the cost of plain attribute assignment.
+
+        Records that are not of type `dict` are passed \
+        to the constructor as is.
+
+        """
+
+        cache = cls.__cache__['from_record']
+        keys: typing.Optional[tuple[str, ...]] = None
+        from_record: typing.Optional[
+            typing.Callable[[dict[str, typing.Any]], meta.Base]
+            ] = None
+        for record in records:
+            if record.__class__ is not dict:
+                yield cls(record)  # type: ignore[arg-type]
+                continue
+            elif (_keys := tuple(record)) != keys:
+                keys = _keys
+                from_record = (
+                    cache.get(keys)
+                    or meta._compile_from_record(cls, keys)
+                    )
+            yield from_record(record)  # type: ignore[arg-type, misc]
+
+    @classmethod
+    def from_json(
+        cls: type[dtypes.BaseType],
+        data: typing.Union[str, bytes, bytearray],
+        /
+        ) -> dtypes.BaseType:
+        """
+        Return an object from a JSON object.
+
+        ---
+
+        Values are converted to their field types as the document \
+        is hydrated (including nested objects and typed containers, \
+        see `codec.decoder`), using constructors compiled once per \
+        distinct set of keys, so no intermediate objects are built \
+        and no nested JSON is re-parsed.
+
+        Raises `InvalidJSONDocumentError` (a `ValueError`) \
+        if the document is not a JSON object.
+
+        ---
+
+        ### Example
+
+        ```py
+        import datetime
+
+        import fgr
+
+
+        class Toy(fgr.Object):
+            \"""A toy.\"""
+
+            name: fgr.Field[str]
+
+
+        class Pet(fgr.Object):
+            \"""A pet.\"""
+
+            id_: fgr.Field[str]
+            born: fgr.Field[datetime.date] = None
+            toys: fgr.Field[list[Toy]] = []
+
+
+        pet = Pet.from_json(
+            '{"id": "a1", "born": "2020-01-01", "toys": [{"name": "ball"}]}'
+            )
+
+        assert pet.born == datetime.date(2020, 1, 1)
+        assert pet.toys == [Toy(name='ball')]
+        ```
+
+        """
+
+        if (record := json.loads(data)).__class__ is not dict:
+            raise exceptions.InvalidJSONDocumentError(cls, record)
+        return typing.cast(
+            dtypes.BaseType,
+            meta._from_json_record(cls, record)  # type: ignore[arg-type]
+            )
+
+    @classmethod
+    def from_json_lines(
+        cls: type[dtypes.BaseType],
+        lines: typing.Iterable[typing.Union[str, bytes, bytearray]],
+        /
+        ) -> list[dtypes.BaseType]:
+        """
+        Return a list of objects from JSON lines.
+
+        ---
+
+        See `iter_from_json_lines` for more detail.
+
+        """
+
+        return list(cls.iter_from_json_lines(lines))  # type: ignore[attr-defined]
+
+    @classmethod
+    def iter_from_json_lines(
+        cls: type[dtypes.BaseType],
+        lines: typing.Iterable[typing.Union[str, bytes, bytearray]],
+        /
+        ) -> typing.Iterator[dtypes.BaseType]:
+        """
+        Yield objects from JSON lines (one JSON object per line), \
+        such as a file opened in text or binary mode.
+
+        ---
+
+        Blank lines are skipped and each line is decoded \
+        as by `from_json`, so memory use is independent \
+        of the number of lines.
+
+        """
+
+        for line in lines:
+            if line.strip():
+                yield cls.from_json(line)  # type: ignore[attr-defined]
+
+    @classmethod
+    def to_records(
+        cls,
+        objects: typing.Iterable[meta.Base],
+        /,
+        camel_case: bool = False,
+        include_null: bool = True,
+        ) -> list[dict[str, typing.Any]]:
+        """
+        Return a list of dicts from an iterable of objects.
+
+        ---
+
+        Equivalent to `[obj.to_dict(camel_case, include_null) for obj in objects]`.
+
+        See `iter_to_records` for more detail.
+
+        """
+
+        return list(cls.iter_to_records(objects, camel_case, include_null))
+
+    @classmethod
+    def iter_to_records(
+        cls,
+        objects: typing.Iterable[meta.Base],
+        /,
+        camel_case: bool = False,
+        include_null: bool = True,
+        ) -> typing.Iterator[dict[str, typing.Any]]:
+        """
+        Yield dicts from an iterable of objects.
+
+        ---
+
+        The compiled `to_dict` is resolved once per run of \
+        objects of the same class, rather than per object.
+
+        """
+
+        options = (bool(camel_case), bool(include_null))
+        dtype: typing.Optional[type[meta.Base]] = None
+        for object_ in objects:
+            if object_.__class__ is not dtype:
+                dtype = object_.__class__
+                to_dict = (
+                    dtype.__cache__['to_dict'].get(options)
+                    or meta._compile_to_dict(dtype, *options)
+                    )
+            yield to_dict(object_)
@@ -0,0 +1,402 @@
+"""Query optimization."""
+
+__all__ = (
+    'estimate',
+    'optimize',
+    )
+
+import functools
+import math
+import typing
+
+from . import constants
+from . import dtypes
+from . import meta
+from . import query
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    COSTS: dict[type[query.Query], float] = {
+        query.ContainsQueryCondition: 2.0,
+        query.SimilarQueryCondition: 20.0,
+        }
+    EPSILON = 1e-6
+    LOWER_BOUNDS = (query.GeQueryCondition, query.GtQueryCondition)
+    UPPER_BOUNDS = (query.LeQueryCondition, query.LtQueryCondition)
+    SELECTIVITY: dict[type[query.Query], float] = {
+        query.ContainsQueryCondition: 0.1,
+        query.EqQueryCondition: 0.05,
+        query.GeQueryCondition: 0.33,
+        query.GtQueryCondition: 0.33,
+        query.LeQueryCondition: 0.33,
+        query.LtQueryCondition: 0.33,
+        query.NeQueryCondition: 0.95,
+        query.SimilarQueryCondition: 0.05,
+        }
+
+
+Selectivity = typing.Callable[
+    [query.QueryCondition],
+    typing.Optional[float]
+    ]
+"""Return estimated fraction of objects matching a condition (or None)."""
+
+
+def estimate(
+    q: dtypes.Query,
+    selectivity: typing.Optional[Selectivity] = None
+    ) -> float:
+    """
+    Return estimated fraction of objects matching `Query`.
+
+    ---
+
+    Conditions are estimated by `selectivity` (for example, \
+    from index statistics), falling back to a fixed estimate \
+    per condition type, and operands are assumed independent.
+
+    """
+
+    if isinstance(q, query.AndQuery):
+        return math.prod(estimate(o, selectivity) for o in _operands(q))
+    elif isinstance(q, query.OrQuery):
+        return 1.0 - math.prod(
+            1.0 - estimate(o, selectivity)
+            for o
+            in _operands(q)
+            )
+    elif isinstance(q, query.InvertQuery):
+        return 1.0 - estimate(q.invert, selectivity)  # type: ignore[arg-type]
+    elif not isinstance(q, query.QueryCondition):
+        return 1.0
+    elif (
+        selectivity is not None
+        and (s := selectivity(q)) is not None
+        ):
+        return s
+    else:
+        return Constants.SELECTIVITY[q.__class__]
+
+
+def optimize(
+    q: dtypes.Query,
+    dtype: typing.Optional[type[meta.Base]] = None,
+    selectivity: typing.Optional[Selectivity] = None
+    ) -> dtypes.Query:
+    """
+    Return new, equivalent `Query` requiring less work to evaluate.
+
+    ---
+
+    Starting from `query.normalize` (flattened, de-duplicated, \
+    with inversions pushed down and double inversions removed):
+
+    * Range conditions on the same field are merged within \
+    `AndQuery` (keeping the tightest bounds) and `OrQuery` \
+    (keeping the loosest), and ranges implied by an `==` \
+    condition are removed.
+
+    * Always-false branches are detected (for example, \
+    `x == 1 & x == 2`, `x > 5 & x < 1`, `x > None`, or \
+    `a & ~a`), as are always-true branches (`a | ~a`), \
+    and folded into their parents.
+
+    * Operands are reordered by estimated selectivity and cost \
+    (see `estimate`), so short-circuit evaluation rejects \
+    (`and`) or accepts (`or`) objects as early as possible.
+
+    An always-true `Query` is returned as an empty `AndQuery` \
+    and an always-false one as an empty `OrQuery`.
+
+    """
+
+    normal = query.normalize(q, dtype)
+    optimized = _optimize(normal, selectivity)
+    optimized.sorting = normal.sorting
+    optimized.limit = normal.limit
+    return optimized
+
+
+def _operands(
+    q: typing.Union[query.AndQuery, query.OrQuery]
+    ) -> list[dtypes.Query]:
+    return typing.cast(
+        list[dtypes.Query],
+        q.and_ if isinstance(q, query.AndQuery) else q.or_
+        )
+
+
+def _true() -> query.AndQuery:
+    return query._new(query.AndQuery, [])
+
+
+def _false() -> query.OrQuery:
+    return query._new(query.OrQuery, [])
+
+
+def _is_true(q: dtypes.Query) -> bool:
+    return q.__class__ is query.AndQuery and not q.and_  # type: ignore[attr-defined]
+
+
+def _is_false(q: dtypes.Query) -> bool:
+    return q.__class__ is query.OrQuery and not q.or_  # type: ignore[attr-defined]
+
+
+def _cost(q: dtypes.Query) -> float:
+    if isinstance(q, (query.AndQuery, query.OrQuery)):
+        return sum(_cost(o) for o in _operands(q))
+    elif isinstance(q, query.InvertQuery):
+        return _cost(q.invert)  # type: ignore[arg-type]
+    else:
+        return Constants.COSTS.get(q.__class__, 1.0)
+
+
+def _complement(q: dtypes.Query) -> typing.Hashable:
+    """Return key for the complement of a normalized `Query`."""
+
+    if isinstance(q, query.EqQueryCondition):
+        return query._key(query._new(query.NeQueryCondition, q.field, q.eq))
+    elif isinstance(q, query.NeQueryCondition):
+        return query._key(query._new(query.EqQueryCondition, q.field, q.ne))
+    elif isinstance(q, query.InvertQuery):
+        return query._key(q.invert)  # type: ignore[arg-type]
+    else:
+        return ('not', query._key(q))
+
+
+def _optimize(
+    q: dtypes.Query,
+    selectivity: typing.Optional[Selectivity]
+    ) -> dtypes.Query:
+    if isinstance(q, (query.AndQuery, query.OrQuery)):
+        return _junction(q, selectivity)
+    elif (
+        isinstance(q, (*Constants.LOWER_BOUNDS, *Constants.UPPER_BOUNDS))
+        and _value(q) is None
+        ):
+        return _false()
+    elif (
+        isinstance(q, query.InvertQuery)
+        and isinstance(
+            inverted := typing.cast(dtypes.Query, q.invert),
+            (*Constants.LOWER_BOUNDS, *Constants.UPPER_BOUNDS)
+            )
+        and _value(inverted) is None
+        ):
+        return _true()
+    else:
+        return q
+
+
+def _junction(
+    q: typing.Union[query.AndQuery, query.OrQuery],
+    selectivity: typing.Optional[Selectivity]
+    ) -> dtypes.Query:
+    """Optimize `AndQuery` or `OrQuery`."""
+
+    is_and = q.__class__ is query.AndQuery
+    key = 'and_' if is_and else 'or_'
+    identity, absorbing = (_is_true, _is_false) if is_and else (_is_false, _is_true)
+
+    operands: dict[typing.Hashable, dtypes.Query] = {}
+    for operand in q[key]:
+        optimized = _optimize(operand, selectivity)
+        for o in (
+            optimized[key]
+            if optimized.__class__ is q.__class__
+            else (optimized, )
+            ):
+            if absorbing(o):
+                return o
+            elif not identity(o):
+                operands.setdefault(query._key(o), o)
+
+    if any(_complement(o) in operands for o in operands.values()):
+        return _false() if is_and else _true()
+
+    merged = (
+        _merge_and(list(operands.values()))
+        if is_and
+        else _merge_or(list(operands.values()))
+        )
+    if merged is None:
+        return _false()
+    elif len(merged) == 1:
+        return merged[0]
+
+    def _rank(o: dtypes.Query) -> float:
+        s = estimate(o, selectivity)
+        return _cost(o) / max((1.0 - s) if is_and else s, Constants.EPSILON)
+
+    merged.sort(key=_rank)
+    return query._new(q.__class__, merged)
+
+
+def _value(q: dtypes.Query) -> typing.Any:
+    return query._values(q)[0]
+
+
+def _tighter(
+    a: query.QueryCondition,
+    b: query.QueryCondition,
+    lower: bool
+    ) -> query.QueryCondition:
+    """Return the tighter of two lower (or upper) bounds."""
+
+    va, vb = _value(a), _value(b)
+    if va == vb:
+        return a if isinstance(a, (query.GtQueryCondition, query.LtQueryCondition)) else b
+    elif (va > vb) == lower:
+        return a
+    else:
+        return b
+
+
+def _satisfies(value: typing.Any, bound: query.QueryCondition) -> bool:
+    v = _value(bound)
+    if isinstance(bound, query.GeQueryCondition):
+        return bool(value >= v)
+    elif isinstance(bound, query.GtQueryCondition):
+        return bool(value > v)
+    elif isinstance(bound, query.LeQueryCondition):
+        return bool(value <= v)
+    else:
+        return bool(value < v)
+
+
+def _group(
+    operands: list[dtypes.Query]
+    ) -> tuple[dict[str, list[query.QueryCondition]], list[dtypes.Query]]:
+    """Group comparison conditions by field."""
+
+    groups: dict[str, list[query.QueryCondition]] = {}
+    others: list[dtypes.Query] = []
+    for o in operands:
+        if isinstance(
+            o,
+            (
+                query.EqQueryCondition,
+                query.NeQueryCondition,
+                *Constants.LOWER_BOUNDS,
+                *Constants.UPPER_BOUNDS,
+                )
+            ):
+            groups.setdefault(o.field, []).append(o)
+        else:
+            others.append(o)
+    return groups, others
+
+
+def _merge_and(
+    operands: list[dtypes.Query]
+    ) -> typing.Optional[list[dtypes.Query]]:
+    """Merge conditions per field, returning None if never satisfied."""
+
+    groups, merged = _group(operands)
+    for conditions in groups.values():
+        eqs = [c for c in conditions if isinstance(c, query.EqQueryCondition)]
+        nes = [c for c in conditions if isinstance(c, query.NeQueryCondition)]
+        lowers: list[query.QueryCondition] = [
+            c
+            for c
+            in conditions
+            if isinstance(c, Constants.LOWER_BOUNDS)
+            ]
+        uppers: list[query.QueryCondition] = [
+            c
+            for c
+            in conditions
+            if isinstance(c, Constants.UPPER_BOUNDS)
+            ]
+        try:
+            lower = functools.reduce(
+                lambda a, b: _tighter(a, b, lower=True),
+                lowers
+                ) if lowers else None
+            upper = functools.reduce(
+                lambda a, b: _tighter(a, b, lower=False),
+                uppers
+                ) if uppers else None
+            bounds = [b for b in (lower, upper) if b is not None]
+            if eqs:
+                v = eqs[0].eq
+                if (
+                    any(c.eq != v for c in eqs[1:])
+                    or any(c.ne == v for c in nes)
+                    or (bounds and v is None)
+                    or not all(_satisfies(v, b) for b in bounds)
+                    ):
+                    return None
+                merged.append(eqs[0])
+                continue
+            elif lower is not None and upper is not None and (
+                _value(lower) > _value(upper)
+                or (
+                    _value(lower) == _value(upper)
+                    and not (
+                        isinstance(lower, query.GeQueryCondition)
+                        and isinstance(upper, query.LeQueryCondition)
+                        )
+                    )
+                ):
+                return None
+        except TypeError:
+            merged.extend(conditions)
+        else:
+            merged.extend((*nes, *bounds))
+    return merged
+
+
+def _merge_or(operands: list[dtypes.Query]) -> list[dtypes.Query]:
+    """Merge same-direction bounds per field, keeping the loosest."""
+
+    groups, merged = _group(operands)
+    for conditions in groups.values():
+        others = [
+            c
+            for c
+            in conditions
+            if not isinstance(c, (*Constants.LOWER_BOUNDS, *Constants.UPPER_BOUNDS))
+            ]
+        lowers: list[query.QueryCondition] = [
+            c
+            for c
+            in conditions
+            if isinstance(c, Constants.LOWER_BOUNDS)
+            ]
+        uppers: list[query.QueryCondition] = [
+            c
+            for c
+            in conditions
+            if isinstance(c, Constants.UPPER_BOUNDS)
+            ]
+        try:
+            bounds = [
+                functools.reduce(
+                    lambda a, b: _loosest(a, b, lower=True),
+                    lowers
+                    ),
+                ] if lowers else []
+            if uppers:
+                bounds.append(
+                    functools.reduce(
+                        lambda a, b: _loosest(a, b, lower=False),
+                        uppers
+                        )
+                    )
+        except TypeError:
+            merged.extend(conditions)
+        else:
+            merged.extend((*others, *bounds))
+    return merged
+
+
+def _loosest(
+    a: query.QueryCondition,
+    b: query.QueryCondition,
+    lower: bool
+    ) -> query.QueryCondition:
+    """Return the looser of two lower (or upper) bounds."""
+
+    return b if _tighter(a, b, lower) is a else a
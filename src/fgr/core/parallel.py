@@ -0,0 +1,190 @@
+"""Parallel processing of Objects."""
+
+__all__ = (
+    'map_objects',
+    )
+
+import collections
+import concurrent.futures
+import os
+import typing
+
+from . import constants
+from . import dtypes
+from . import frames
+from . import meta
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    CHUNK_SIZE = 1024
+    PENDING_PER_WORKER = 2
+
+
+ResultType = typing.TypeVar('ResultType')
+
+Chunk = typing.Union['frames.ObjectFrame[typing.Any]', list]
+"""`Objects` (or results) transferred to (or from) a worker."""
+
+
+def _pack(items: list[typing.Any]) -> Chunk:
+    """Return items as `ObjectFrame` if all of one derivative, else as is."""
+
+    if (
+        items
+        and isinstance(items[0], meta.Base)
+        and all(item.__class__ is items[0].__class__ for item in items)
+        ):
+        return frames.ObjectFrame(items[0].__class__, items)
+    else:
+        return items
+
+
+def _map_chunk(
+    fn: typing.Callable[[typing.Any], typing.Any],
+    chunk: Chunk
+    ) -> Chunk:
+    """Apply fn to each `Object` in chunk (in a worker)."""
+
+    return _pack([fn(object_) for object_ in chunk])
+
+
+def _chunks(
+    objects: typing.Iterable[dtypes.BaseType],
+    chunk_size: int
+    ) -> typing.Iterator[Chunk]:
+    """Lazily yield chunks of at most chunk_size consecutive `Objects`."""
+
+    chunk: list[dtypes.BaseType] = []
+    for object_ in objects:
+        if chunk and object_.__class__ is not chunk[0].__class__:
+            yield _pack(chunk)
+            chunk = []
+        chunk.append(object_)
+        if len(chunk) == chunk_size:
+            yield _pack(chunk)
+            chunk = []
+    if chunk:
+        yield _pack(chunk)
+
+
+def map_objects(
+    fn: typing.Callable[[dtypes.BaseType], ResultType],
+    objects: typing.Iterable[dtypes.BaseType],
+    /,
+    chunk_size: int = Constants.CHUNK_SIZE,
+    ordered: bool = True,
+    max_pending: typing.Optional[int] = None,
+    max_workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> typing.Iterator[ResultType]:
+    """
+    Lazily yield the result of fn for each `Object`, \
+    computed in a process pool.
+
+    ---
+
+    `Objects` are sent to workers in chunks of at most \
+    `chunk_size` consecutive `Objects` of the same derivative, \
+    each as an `ObjectFrame` (columns of field values, rather \
+    than a pickle per `Object`). Results are returned the same \
+    way if all `Objects` of one derivative, else as a list.
+
+    * If `ordered`, results are yielded in the order of `objects`, \
+    otherwise chunk by chunk, as completed.
+
+    * At most `max_pending` chunks (default: \
+    `Constants.PENDING_PER_WORKER` per worker) are submitted \
+    and not yet yielded at any time, so `objects` is consumed \
+    only as fast as results are, and may be unbounded.
+
+    A `concurrent.futures.ProcessPoolExecutor` with `max_workers` \
+    is created (and shut down when exhausted or closed), unless \
+    an `executor` is specified. As with any process pool, fn must \
+    be picklable (for example, defined at module level), and \
+    `Objects` are copies (mutating them in fn does not update \
+    `objects`).
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        name: fgr.Field[str]
+        age: fgr.Field[int] = 1
+
+
+    def birthday(pet: Pet) -> Pet:
+        pet.age += 1
+        return pet
+
+
+    pets = [Pet(name='Fido'), Pet(name='Buddy', age=3)]
+    for pet in fgr.core.parallel.map_objects(birthday, pets):
+        ...
+    ```
+
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+    if max_pending is None:
+        max_pending = Constants.PENDING_PER_WORKER * (
+            max_workers or os.cpu_count() or 1
+            )
+    return _map_objects(
+        fn,
+        objects,
+        chunk_size,
+        ordered,
+        max(max_pending, 1),
+        max_workers,
+        executor
+        )
+
+
+def _map_objects(
+    fn: typing.Callable[[dtypes.BaseType], ResultType],
+    objects: typing.Iterable[dtypes.BaseType],
+    chunk_size: int,
+    ordered: bool,
+    max_pending: int,
+    max_workers: typing.Optional[int],
+    executor: typing.Optional[concurrent.futures.Executor]
+    ) -> typing.Iterator[ResultType]:
+    pool = executor or concurrent.futures.ProcessPoolExecutor(max_workers)
+    pending: collections.deque[concurrent.futures.Future[Chunk]] = (
+        collections.deque()
+        )
+    not_done: set[concurrent.futures.Future[Chunk]] = set()
+    try:
+        for chunk in _chunks(objects, chunk_size):
+            future = pool.submit(_map_chunk, fn, chunk)
+            if ordered:
+                pending.append(future)
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            else:
+                not_done.add(future)
+                if len(not_done) >= max_pending:
+                    done, not_done = concurrent.futures.wait(
+                        not_done,
+                        return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                    for future in done:
+                        yield from future.result()
+        while pending:
+            yield from pending.popleft().result()
+        for future in concurrent.futures.as_completed(not_done):
+            yield from future.result()
+    finally:
+        for future in (*pending, *not_done):
+            future.cancel()
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
@@ -3,6 +3,10 @@
 __all__ = (
     'Query',
     'QuerySortBy',
+    'and_',
+    'canonical',
+    'normalize',
+    'or_',
     )
 
 import typing
@@ -11,12 +15,14 @@ from . import constants
 from . import dtypes
 from . import enums
 from . import fields
+from . import meta
 from . import objects
+from . import utils
 
 
 class Constants(constants.PackageConstants):  # noqa
 
-    pass
+    BASE_FIELDS = frozenset(('field', 'limit', 'sorting'))
 
 
 class QuerySortBy(objects.Object):
@@ -55,7 +61,12 @@ class Query(objects.Object):
     * `field_1_similarity_filter_with_threshold = Object.field_1 % ('test_value_123', 0.8)`
 
     Queries may be chained together using the `&` and `|` bitwise \
-    operators, corresponding to `and` and `or` clauses respectively.
+    operators, corresponding to `and` and `or` clauses respectively. \
+    Chains of the same operator are flattened into a single n-ary \
+    `AndQuery` or `OrQuery` (so `a | b | c` has three operands), \
+    and operands are shared, never copied or mutated. For large \
+    generated filters, `and_` and `or_` build the same n-ary \
+    queries from any number of operands at once.
 
     Additionally, the invert (`~`) operator may be prefixed to any \
     Query to match the opposite of any conditions specified \
@@ -106,13 +117,13 @@ class Query(objects.Object):
         return self
 
     def __and__(self, other: dtypes.Query) -> 'AndQuery':
-        return AndQuery(and_=[self, other])  # type: ignore[arg-type]
+        return and_(self, other)
 
     def __or__(self, other: dtypes.Query) -> 'OrQuery':
-        return OrQuery(or_=[self, other])  # type: ignore[arg-type]
+        return or_(self, other)
 
     def __invert__(self) -> 'InvertQuery':
-        return InvertQuery(invert=self)  # type: ignore[arg-type]
+        return _new(InvertQuery, self)
 
     def _sort_by(
         self,
@@ -202,3 +213,222 @@ class InvertQuery(Query):
     """Inverts the filter."""
 
     invert: 'fields.Field[type[Query]]'
+
+
+def _new(cls: type[dtypes.QueryType], *values: typing.Any) -> dtypes.QueryType:
+    """
+    Return new `Query` of type `cls`, from values for \
+    each field after `sorting` and `limit`, in order.
+
+    ---
+
+    Skips `__init__` (key resolution and defaults), \
+    as values are already known to be complete.
+
+    """
+
+    from_values = (
+        cls.__cache__.get('from_values')
+        or meta._compile_from_values(cls)  # type: ignore[arg-type]
+        )
+    return typing.cast(dtypes.QueryType, from_values([], None, *values))
+
+
+def _flatten(
+    queries: typing.Iterable[dtypes.Query],
+    cls: type[dtypes.Query],
+    key: str
+    ) -> list[dtypes.Query]:
+    """Return operands, expanding unsorted, unlimited queries of `cls`."""
+
+    operands: list[dtypes.Query] = []
+    for q in queries:
+        if q.__class__ is cls and not q.sorting and q.limit is None:
+            operands.extend(q[key])
+        else:
+            operands.append(q)
+    return operands
+
+
+def and_(*queries: dtypes.Query) -> AndQuery:
+    """Return n-ary `AndQuery` for all queries."""
+
+    return _new(AndQuery, _flatten(queries, AndQuery, 'and_'))
+
+
+def or_(*queries: dtypes.Query) -> OrQuery:
+    """Return n-ary `OrQuery` for any of queries."""
+
+    return _new(OrQuery, _flatten(queries, OrQuery, 'or_'))
+
+
+def normalize(
+    q: dtypes.Query,
+    dtype: typing.Optional[type[meta.Base]] = None
+    ) -> dtypes.Query:
+    """
+    Return new, equivalent `Query` in normal form.
+
+    ---
+
+    * `AndQuery` and `OrQuery` operands are flattened, \
+    de-duplicated and sorted, and single operands unwrapped.
+
+    * `InvertQuery` is pushed down to conditions (by De Morgan's \
+    laws), double inversion is removed and inverted `==` and `!=` \
+    conditions are replaced by their complements.
+
+    * A plain `Query` (which matches everything) becomes an empty \
+    `AndQuery` (or an empty `OrQuery` if inverted).
+
+    * `SimilarQueryCondition` thresholds default to \
+    `MatchThreshold.default`.
+
+    * If `dtype` is specified, field aliases are resolved.
+
+    Sorting and limit are kept for the outermost `Query` only, \
+    as they have no effect on nested queries.
+
+    """
+
+    normal = _normalize(q, False, dtype)
+    normal.sorting = [
+        QuerySortBy(field=_field(s.field, dtype), direction=s.direction)  # type: ignore[arg-type]
+        for s
+        in q.sorting
+        ]
+    normal.limit = q.limit
+    return normal
+
+
+def canonical(
+    q: dtypes.Query,
+    dtype: typing.Optional[type[meta.Base]] = None
+    ) -> typing.Hashable:
+    """
+    Return canonical, hashable key for `Query`.
+
+    ---
+
+    Equivalent queries in the sense of `normalize` (for example, \
+    `a & b` and `b & a`, or `~(a | b)` and `~a & ~b`) have the \
+    same key. Values are compared by type and value, so \
+    `x == 1` and `x == True` have different keys.
+
+    """
+
+    normal = normalize(q, dtype)
+    return (
+        _key(normal),
+        tuple((s.field, s.direction) for s in normal.sorting),
+        normal.limit
+        )
+
+
+def _field(field: str, dtype: typing.Optional[type[meta.Base]]) -> str:
+    if dtype is not None and (name := utils.key_for(dtype, field)):
+        return name.rstrip('_')
+    return field
+
+
+def _normalize(
+    q: dtypes.Query,
+    invert: bool,
+    dtype: typing.Optional[type[meta.Base]]
+    ) -> dtypes.Query:
+    if isinstance(q, (AndQuery, OrQuery)):
+        cls = (
+            (OrQuery if invert else AndQuery)
+            if isinstance(q, AndQuery)
+            else (AndQuery if invert else OrQuery)
+            )
+        key = 'and_' if cls is AndQuery else 'or_'
+        operands: dict[typing.Hashable, dtypes.Query] = {}
+        for operand in q['and_' if isinstance(q, AndQuery) else 'or_']:
+            normal = _normalize(operand, invert, dtype)
+            for o in (normal[key] if normal.__class__ is cls else (normal, )):
+                operands.setdefault(_key(o), o)
+        if len(operands) == 1:
+            o, = operands.values()
+            return o
+        return _new(
+            cls,
+            [operands[k] for k in sorted(operands, key=repr)]
+            )
+    elif isinstance(q, InvertQuery):
+        return _normalize(q.invert, not invert, dtype)  # type: ignore[arg-type]
+    elif not isinstance(q, QueryCondition):
+        return _new(OrQuery, []) if invert else _new(AndQuery, [])
+
+    field = _field(q.field, dtype)
+    condition: QueryCondition
+    if isinstance(q, SimilarQueryCondition):
+        condition = _new(
+            SimilarQueryCondition,
+            field,
+            q.like,
+            (
+                enums.MatchThreshold.default.value
+                if q.threshold is None
+                else q.threshold
+                )
+            )
+    elif invert and isinstance(q, (EqQueryCondition, NeQueryCondition)):
+        return (
+            _new(NeQueryCondition, field, q.eq)
+            if isinstance(q, EqQueryCondition)
+            else _new(EqQueryCondition, field, q.ne)
+            )
+    else:
+        condition = _new(q.__class__, field, *_values(q))
+    return _new(InvertQuery, condition) if invert else condition
+
+
+def _values(q: dtypes.Query) -> tuple[typing.Any, ...]:
+    """Return condition values (for fields after `field`)."""
+
+    return tuple(
+        getattr(q, name)
+        for name
+        in q.__fields__
+        if name not in Constants.BASE_FIELDS
+        )
+
+
+def _key(q: dtypes.Query) -> typing.Hashable:
+    """Return hashable key for normalized `Query` structure."""
+
+    if isinstance(q, AndQuery):
+        return ('and', tuple(_key(o) for o in q.and_))  # type: ignore[arg-type]
+    elif isinstance(q, OrQuery):
+        return ('or', tuple(_key(o) for o in q.or_))  # type: ignore[arg-type]
+    elif isinstance(q, InvertQuery):
+        return ('not', _key(q.invert))  # type: ignore[arg-type]
+    else:
+        return (
+            q.__class__.__name__,
+            q.field,  # type: ignore[attr-defined]
+            *(_freeze(v) for v in _values(q))
+            )
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:
+    """Return hashable, type-qualified representation of value."""
+
+    if isinstance(value, dict):
+        return (
+            'dict',
+            frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+            )
+    elif isinstance(value, (set, frozenset)):
+        return ('set', frozenset(_freeze(v) for v in value))
+    elif isinstance(value, (list, tuple)):
+        return (value.__class__.__name__, tuple(_freeze(v) for v in value))
+    elif isinstance(value, meta.Base):
+        return (value.__class__.__name__, _freeze(dict(value)))
+    try:
+        hash(value)
+    except TypeError:
+        return (value.__class__.__name__, repr(value))
+    else:
+        return (value.__class__.__name__, value)
@@ -0,0 +1,281 @@
+"""
+Similarity scoring and indexing.
+
+---
+
+Score Semantics
+---------------
+
+The similarity of two values is the Jaccard index of their \
+character trigrams: `len(a & b) / len(a | b)`, between `0.0` \
+(no trigrams in common) and `1.0` (identical trigrams).
+
+* Values are converted to `str` and lowercased.
+* Each value is padded with two leading spaces and one trailing \
+space before trigrams are extracted (as for PostgreSQL `pg_trgm`), \
+so word starts weigh more than word ends, and even an empty \
+string has a trigram.
+
+A `SimilarQueryCondition` is satisfied by a non-null value if its \
+score against `like` is greater than or equal to `threshold` \
+(`MatchThreshold.default` if unspecified).
+
+"""
+
+__all__ = (
+    'TrigramIndex',
+    'score',
+    'trigrams',
+    )
+
+import collections
+import math
+import typing
+
+from . import constants
+from . import enums
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    EPSILON = 1e-9
+    RESCORE_COST = 10
+    """Cost of scoring a value relative to counting one posting."""
+
+
+def trigrams(value: typing.Any) -> frozenset[str]:
+    """Return set of (case-insensitive, padded) trigrams for value."""
+
+    s = f'  {str(value).lower()} '
+    return frozenset(s[i:i + 3] for i in range(len(s) - 2))
+
+
+def score(value: typing.Any, like: typing.Any) -> float:
+    """Return similarity score between `0.0` and `1.0` for two values."""
+
+    a = trigrams(value)
+    b = trigrams(like)
+    return len(a & b) / len(a | b)
+
+
+class TrigramIndex:
+    """
+    Inverted trigram index for similarity search.
+
+    ---
+
+    Maps each trigram (and trigram count) to the distinct values \
+    containing it, so `search` only visits values that share \
+    a trigram with `like` and could satisfy the threshold:
+
+    * A value with trigrams `a` can only score `>= t` against `b` \
+    if `t * len(b) <= len(a) <= len(b) / t` (length filter).
+
+    * It must also share at least `ceil(t * len(b))` trigrams \
+    with `b`, so it must contain at least one of the \
+    `len(b) - ceil(t * len(b)) + 1` rarest trigrams in `b` \
+    (prefix filter).
+
+    If the prefix filter leaves few candidates, each is scored \
+    directly, otherwise the overlap `len(a & b)` is counted from \
+    the postings for every trigram in `b`, and the score computed \
+    as `overlap / (len(a) + len(b) - overlap)`. Either way, results \
+    are identical to scoring every value.
+
+    Row ids are supplied by the caller, and rows with the \
+    same value share a single entry, which is dropped from \
+    the postings (and its id reused) once its last row is removed.
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+    index = fgr.core.similarity.TrigramIndex()
+    index.extend(enumerate(['fido', 'Fido', 'rex', 'buddy']))
+
+    assert index.search('FIDO') == [0, 1]
+    ```
+
+    """
+
+    __slots__ = (
+        'postings',
+        'rows',
+        'sizes',
+        'values',
+        '_free',
+        '_value_ids',
+        )
+
+    def __init__(self) -> None:
+        self.postings: dict[str, dict[int, dict[int, None]]] = {}
+        self.rows: list[dict[int, None]] = []
+        self.sizes: list[int] = []
+        self.values: list[str] = []
+        self._free: list[int] = []
+        self._value_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self.rows)
+
+    def add(self, row_id: int, value: typing.Any) -> None:
+        """Index value for row id (`None` is not indexed)."""
+
+        if value is None:
+            return None
+        value = str(value)
+        if (value_id := self._value_ids.get(value)) is None:
+            grams = trigrams(value)
+            size = len(grams)
+            if self._free:
+                value_id = self._free.pop()
+                self.values[value_id] = value
+                self.sizes[value_id] = size
+            else:
+                value_id = len(self.values)
+                self.values.append(value)
+                self.sizes.append(size)
+                self.rows.append({})
+            self._value_ids[value] = value_id
+            for gram in grams:
+                self.postings.setdefault(gram, {}).setdefault(
+                    size,
+                    {}
+                    )[value_id] = None
+        self.rows[value_id][row_id] = None
+
+    def extend(self, rows: typing.Iterable[tuple[int, typing.Any]]) -> None:
+        """Index values for row ids."""
+
+        for row_id, value in rows:
+            self.add(row_id, value)
+
+    def remove(self, row_id: int, value: typing.Any) -> None:
+        """Remove value for row id from the index."""
+
+        if (
+            value is None
+            or (value_id := self._value_ids.get(value := str(value))) is None
+            ):
+            return None
+        rows = self.rows[value_id]
+        rows.pop(row_id, None)
+        if rows:
+            return None
+        size = self.sizes[value_id]
+        for gram in trigrams(value):
+            by_size = self.postings[gram]
+            value_ids = by_size[size]
+            del value_ids[value_id]
+            if not value_ids:
+                del by_size[size]
+                if not by_size:
+                    del self.postings[gram]
+        del self._value_ids[value]
+        self.values[value_id] = ''
+        self.sizes[value_id] = 0
+        self._free.append(value_id)
+
+    def _postings(
+        self,
+        grams: frozenset[str],
+        threshold: float
+        ) -> list[tuple[int, list[dict[int, None]]]]:
+        """
+        Return postings per trigram (within the length filter), \
+        with their total length, rarest first.
+
+        """
+
+        n = len(grams)
+        lo = threshold * n - Constants.EPSILON
+        hi = n / threshold + Constants.EPSILON
+        postings = []
+        for gram in grams:
+            value_ids = [
+                value_ids
+                for size, value_ids
+                in self.postings.get(gram, {}).items()
+                if lo <= size <= hi
+                ]
+            postings.append((sum(map(len, value_ids)), value_ids))
+        postings.sort(key=lambda posting: posting[0])
+        return postings
+
+    def estimate(
+        self,
+        like: typing.Any,
+        threshold: typing.Optional[float] = None
+        ) -> int:
+        """Return upper bound on count of values to be scored."""
+
+        if threshold is None:
+            threshold = enums.MatchThreshold.default.value
+        if threshold <= 0:
+            return len(self._value_ids)
+        return sum(
+            total
+            for total, _
+            in self._postings(trigrams(like), threshold)
+            )
+
+    def search(
+        self,
+        like: typing.Any,
+        threshold: typing.Optional[float] = None
+        ) -> list[int]:
+        """
+        Return sorted row ids for values with a similarity score \
+        against `like` greater than or equal to `threshold`.
+
+        """
+
+        if threshold is None:
+            threshold = enums.MatchThreshold.default.value
+        if threshold <= 0:
+            return sorted(
+                row_id
+                for rows
+                in self.rows
+                for row_id
+                in rows
+                )
+
+        grams = trigrams(like)
+        n = len(grams)
+        postings = self._postings(grams, threshold)
+        prefix = postings[
+            :max(n - math.ceil(threshold * n - Constants.EPSILON) + 1, 0)
+            ]
+        sizes = self.sizes
+        row_ids: list[int] = []
+        if (
+            sum(total for total, _ in prefix) * Constants.RESCORE_COST
+            < sum(total for total, _ in postings)
+            ):
+            candidates: set[int] = set()
+            for _, by_size in prefix:
+                for value_ids in by_size:
+                    candidates.update(value_ids)
+            for value_id in candidates:
+                if (
+                    (rows := self.rows[value_id])
+                    and score(self.values[value_id], like) >= threshold
+                    ):
+                    row_ids.extend(rows)
+        else:
+            overlaps: collections.Counter[int] = collections.Counter()
+            for _, by_size in postings:
+                for value_ids in by_size:
+                    overlaps.update(value_ids.keys())
+            for value_id, overlap in overlaps.items():
+                if (
+                    overlap / (sizes[value_id] + n - overlap) >= threshold
+                    and (rows := self.rows[value_id])
+                    ):
+                    row_ids.extend(rows)
+        row_ids.sort()
+        return row_ids
@@ -0,0 +1,327 @@
+"""Query to SQL compilation."""
+
+__all__ = (
+    'register_functions',
+    'to_sql',
+    )
+
+import sqlite3
+import typing
+
+from . import constants
+from . import dtypes
+from . import engine
+from . import enums
+from . import exceptions
+from . import meta
+from . import optimizer
+from . import query
+from . import similarity
+from . import utils
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    SQL_SHAPES_MAX = 256
+    COMPARISONS: dict[str, dict[str, str]] = {
+        enums.SqlDialect.postgresql.value: {
+            'eq': 'IS NOT DISTINCT FROM',
+            'ne': 'IS DISTINCT FROM',
+            'ge': '>=',
+            'gt': '>',
+            'le': '<=',
+            'lt': '<',
+            },
+        enums.SqlDialect.sqlite.value: {
+            'eq': 'IS',
+            'ne': 'IS NOT',
+            'ge': '>=',
+            'gt': '>',
+            'le': '<=',
+            'lt': '<',
+            },
+        }
+    PLACEHOLDERS: dict[str, str] = {
+        enums.SqlDialect.postgresql.value: '%s',
+        enums.SqlDialect.sqlite.value: '?',
+        }
+
+
+Shape = tuple[typing.Any, ...]
+"""Hashable structure of a `Query`, excluding literal values."""
+
+Statement = tuple[str, tuple[typing.Any, ...]]
+"""SQL text and parameters, in order."""
+
+
+def register_functions(connection: sqlite3.Connection) -> None:
+    """
+    Register functions required by compiled SQL on an SQLite connection.
+
+    ---
+
+    `SimilarQueryCondition` compiles to `similarity(column, like)`, \
+    which is provided by `similarity.score` for SQLite, and by \
+    the `pg_trgm` extension (with different scores) for PostgreSQL.
+
+    """
+
+    connection.create_function(
+        'similarity',
+        2,
+        similarity.score,
+        deterministic=True
+        )
+
+
+def to_sql(
+    q: dtypes.Query,
+    dtype: type[meta.Base],
+    /,
+    table: typing.Optional[str] = None,
+    dialect: typing.Union[enums.SqlDialect, str] = enums.SqlDialect.sqlite,
+    camel_case: bool = False,
+    optimize: bool = False,
+    ) -> Statement:
+    """
+    Compile `Query` into a parameterized `SELECT` statement \
+    for objects of type `dtype`.
+
+    ---
+
+    Columns are named for the fields of `dtype` (with any trailing \
+    underscores stripped, and optionally in `camelCase`), and \
+    `table` defaults to the `snake_case` name of `dtype`.
+
+    Literal values are never interpolated into the SQL text, \
+    they are returned as parameters (in `?` style for SQLite, \
+    and `%s` style for PostgreSQL), so the SQL text is compiled \
+    once per query shape (up to `Constants.SQL_SHAPES_MAX` \
+    shapes per `dtype`) and reused for different values.
+
+    Comparisons are null-safe, as in `engine.execute`: `None` \
+    only equals `None` and comparisons other than `==` and `!=` \
+    are never satisfied by `None`.
+
+    Similarity conditions match `engine.execute` for SQLite \
+    (see `register_functions`) but not for PostgreSQL, where \
+    `pg_trgm` extracts trigrams per word (ignoring non-alphanumeric \
+    characters), whereas `similarity.score` pads the whole value, \
+    so scores (and matches for a threshold) may differ.
+
+    Array fields are expected to be stored as `JSON` arrays in \
+    SQLite and as native arrays in PostgreSQL.
+
+    If `optimize` is `True`, the `Query` is first passed through \
+    `optimizer.optimize` (simplifying the statement at the cost \
+    of optimizing on every call).
+
+    Raises `InvalidQueryFieldError` if the `Query` references \
+    a field not defined for `dtype`.
+
+    ---
+
+    ### Example
+
+    ```py
+    import fgr
+
+
+    class Pet(fgr.Object):
+        \"""A pet.\"""
+
+        id_: fgr.Field[str]
+        age: fgr.Field[int]
+
+
+    sql, params = fgr.core.sql.to_sql(Pet.age > 4, Pet)
+
+    assert sql == (
+        'SELECT "id", "age" FROM "pet"'
+        ' WHERE ("age" IS NOT NULL AND "age" > ?)'
+        )
+    assert params == (4, )
+    ```
+
+    """
+
+    if optimize:
+        q = optimizer.optimize(q, dtype)
+    dialect = enums.SqlDialect(dialect).value
+    parameters: list[typing.Any] = []
+    shape = (
+        _shape(q, parameters),
+        tuple((s.field, s.direction) for s in q.sorting),
+        q.limit is not None,
+        )
+    if q.limit is not None:
+        parameters.append(q.limit)
+    key = (shape, table, dialect, camel_case)
+    cache: dict[tuple[typing.Any, ...], str] = dtype.__cache__.setdefault(
+        'sql',
+        {}
+        )
+    if (sql := cache.get(key)) is None:
+        sql = _compile(shape, dtype, table, dialect, camel_case)
+        if len(cache) < Constants.SQL_SHAPES_MAX:
+            cache[key] = sql
+    return sql, tuple(parameters)
+
+
+def _shape(q: dtypes.Query, parameters: list[typing.Any]) -> Shape:
+    """Return shape of `Query`, appending its values to parameters."""
+
+    if isinstance(q, query.AndQuery):
+        return (
+            'and',
+            tuple(_shape(o, parameters) for o in engine._operands(q, 'and_'))
+            )
+    elif isinstance(q, query.OrQuery):
+        return (
+            'or',
+            tuple(_shape(o, parameters) for o in engine._operands(q, 'or_'))
+            )
+    elif isinstance(q, query.InvertQuery):
+        return ('not', _shape(q.invert, parameters))  # type: ignore[arg-type]
+    elif isinstance(q, query.ContainsQueryCondition):
+        parameters.append(q.contains)
+        return ('contains', q.field)
+    elif isinstance(q, query.SimilarQueryCondition):
+        parameters.append(q.like)
+        parameters.append(
+            enums.MatchThreshold.default.value
+            if q.threshold is None
+            else q.threshold
+            )
+        return ('like', q.field)
+    elif isinstance(q, query.QueryCondition):
+        attr, _ = engine.Constants.COMPARISONS[q.__class__]
+        if (v := q[attr]) is None and attr in engine.Constants.RANGES:
+            return ('false', )
+        parameters.append(v)
+        return (attr, q.field)
+    else:
+        return ('true', )
+
+
+def _compile(
+    shape: Shape,
+    dtype: type[meta.Base],
+    table: typing.Optional[str],
+    dialect: str,
+    camel_case: bool
+    ) -> str:
+    where, sorting, has_limit = shape
+    statement = ' '.join(
+        (
+            'SELECT',
+            ', '.join(
+                _quote(_column(name, camel_case))
+                for name
+                in dtype.__fields__
+                ),
+            'FROM',
+            _quote(table or utils.camel_case_to_snake_case(dtype.__name__)),
+            )
+        )
+    if where != ('true', ):
+        statement += ' WHERE ' + _expression(where, dtype, dialect, camel_case)
+    if sorting:
+        statement += ' ORDER BY ' + ', '.join(
+            (
+                f'{_identifier(field, dtype, camel_case)} ASC NULLS LAST'
+                if direction == enums.SortDirection.asc.value
+                else f'{_identifier(field, dtype, camel_case)} DESC NULLS FIRST'
+                )
+            for field, direction
+            in sorting
+            )
+    if has_limit:
+        statement += ' LIMIT ' + Constants.PLACEHOLDERS[dialect]
+    return statement
+
+
+def _expression(
+    shape: Shape,
+    dtype: type[meta.Base],
+    dialect: str,
+    camel_case: bool
+    ) -> str:
+    kind: str
+    kind, *args = shape
+    if kind in ('and', 'or'):
+        operands, = args
+        return '(' + (
+            f' {kind.upper()} '.join(
+                _expression(operand, dtype, dialect, camel_case)
+                for operand
+                in operands
+                )
+            or str(kind == 'and').upper()
+            ) + ')'
+    elif kind == 'not':
+        operand, = args
+        return f'(NOT {_expression(operand, dtype, dialect, camel_case)})'
+    elif kind in ('true', 'false'):
+        return kind.upper()
+
+    field, = args
+    column = _identifier(field, dtype, camel_case)
+    placeholder = Constants.PLACEHOLDERS[dialect]
+    if kind == 'like':
+        return ''.join(
+            (
+                f'({column} IS NOT NULL',
+                f' AND similarity({column}, {placeholder}) >= {placeholder})',
+                )
+            )
+    elif kind == 'contains' and utils.is_array_annotation(
+        dtype.__fields__[utils.key_for(dtype, field)]['type']  # type: ignore[index]
+        ):
+        if dialect == enums.SqlDialect.postgresql.value:
+            return f'COALESCE({placeholder} = ANY({column}), FALSE)'
+        else:
+            return ''.join(
+                (
+                    f'EXISTS (SELECT 1 FROM json_each({column})',
+                    f' WHERE value = {placeholder})',
+                    )
+                )
+    elif kind == 'contains':
+        function = (
+            'strpos'
+            if dialect == enums.SqlDialect.postgresql.value
+            else 'instr'
+            )
+        return ''.join(
+            (
+                f'({column} IS NOT NULL',
+                f' AND {function}({column}, {placeholder}) > 0)',
+                )
+            )
+
+    operator = Constants.COMPARISONS[dialect][kind]
+    if kind in engine.Constants.RANGES:
+        return ''.join(
+            (
+                f'({column} IS NOT NULL',
+                f' AND {column} {operator} {placeholder})',
+                )
+            )
+    else:
+        return f'({column} {operator} {placeholder})'
+
+
+def _identifier(field: str, dtype: type[meta.Base], camel_case: bool) -> str:
+    if not (name := utils.key_for(dtype, field)):
+        raise exceptions.InvalidQueryFieldError(field, dtype)
+    return _quote(_column(name, camel_case))
+
+
+def _column(name: str, camel_case: bool) -> str:
+    column = name.rstrip('_')
+    return utils.to_camel_case(column) if camel_case else column
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
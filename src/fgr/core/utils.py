@@ -5,12 +5,14 @@ __all__ = (
     'camel_case_to_snake_case',
     'convert_for_representation',
     'convert_string_for_representation',
+    'get_aliases',
     'get_description',
     'get_default_description',
     'get_distribution',
     'get_enumerations',
     'get_hash_fields',
     'get_reference',
+    'is_array_annotation',
     'is_array_type',
     'is_field_type',
     'is_obj_array_type',
@@ -30,8 +32,10 @@ __all__ = (
 import enum
 import functools
 import logging
+import os
 import re
 import textwrap
+import types
 import typing
 
 from . import codec
@@ -47,6 +51,7 @@ if typing.TYPE_CHECKING:
 
 class Constants(constants.PackageConstants):  # noqa
 
+    CASING_CACHE_MAXSIZE = int(os.getenv('CASING_CACHE_MAXSIZE', 4096))
     REDACT_DICT_KEY_PATTERNS = [
         dtypes.RePatternDict(
             ID='api-key-token',
@@ -259,7 +264,40 @@ def snake_case_to_kebab_case(snake_case_str: str) -> str:
     return snake_case_str.replace('_', '-')
 
 
+_CAMEL_CASE_BOUNDARIES = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+_CAMEL_CASE_CANDIDATES = re.compile('[A-Z0-9]')
+
+
+@functools.lru_cache(maxsize=Constants.CASING_CACHE_MAXSIZE)
 def camel_case_to_snake_case(camel_case_str: str) -> str:
+    """
+    Convert a camelCase string to snake_case.
+
+    ---
+
+    Memoized (see `to_camel_case`).
+
+    """
+
+    if not camel_case_str.isascii():
+        return _camel_case_to_snake_case(camel_case_str)
+    return _CAMEL_CASE_CANDIDATES.sub(
+        _snake_case_candidate,
+        camel_case_str[:1].lower() + camel_case_str[1:]
+        )
+
+
+def _snake_case_candidate(match: re.Match[str]) -> str:
+    character, s, i = match.group(), match.string, match.start()
+    if i < len(s) - 1 and s[i + 1] not in _CAMEL_CASE_BOUNDARIES:
+        return '_' + character.lower()
+    elif s[i - 1].islower():
+        return '_' + character
+    else:
+        return character
+
+
+def _camel_case_to_snake_case(camel_case_str: str) -> str:
     """Convert a camelCase string to snake_case."""
 
     camel_case_str = camel_case_str[0].lower() + camel_case_str[1:]
@@ -324,7 +362,29 @@ def isCamelCase(fields: typing.Iterable[str]) -> bool:
         )
 
 
+@functools.lru_cache(maxsize=Constants.CASING_CACHE_MAXSIZE)
 def to_camel_case(string: str) -> str:
+    """
+    Convert a snake_case or kebab-case string to camelCase.
+
+    ---
+
+    Conversions are memoized in a thread-safe LRU cache of \
+    `CASING_CACHE_MAXSIZE` (environment variable) strings, \
+    with statistics available from `to_camel_case.cache_info()` \
+    (likewise for `camel_case_to_snake_case`).
+
+    """
+
+    if not string.isascii():
+        return _to_camel_case(string)
+    first, *rest = string.replace('-', '_').split('_')
+    return first[:1].lower() + first[1:] + ''.join(
+        [part[0].upper() + part[1:] for part in rest if part]
+        )
+
+
+def _to_camel_case(string: str) -> str:
     """Convert a snake_case or kebab-case string to camelCase."""
 
     string = string[0].lower() + string[1:]
@@ -363,8 +423,9 @@ def get_hash_fields(fields: dict[str, dtypes.FieldType]) -> tuple[str, ...]:
     id_fields: list[str] = []
     name_fields: list[str] = []
     primitive_fields: list[str] = []
+    primitives = typing.get_args(dtypes.Primitive)
     for f, field in fields.items():
-        if field['type'] not in typing.get_args(dtypes.Primitive):
+        if field['type'] not in primitives:
             continue
         elif (s := f.strip('_').lower()).endswith('id'):
             id_fields.append(f)
@@ -442,10 +503,11 @@ def get_enumerations(fields: dict[str, dtypes.FieldType]) -> dict[str, list]:
     """Dictionary containing all enums for object."""
 
     d: dict[str, list] = {}
+    arrays = typing.get_args(dtypes.Array)
     for k, field in fields.items():
         if isinstance((enum_ := field['enum']), enum.EnumMeta):
             d[k] = [e for e in enum_._member_map_.values()]
-        elif isinstance(enum_, typing.get_args(dtypes.Array)):
+        elif isinstance(enum_, arrays):
             d[k] = list(enum_)
         if k in d and field['nullable']:
             d[k].append(None)
@@ -479,44 +541,97 @@ def key_for(
 
     ```
 
+    ---
+
+    Aliases are resolved by a single lookup in the derivative's \
+    frozen `__aliases__` table (see `get_aliases`), built once at \
+    class creation. Any other keys are resolved without being \
+    cached, so memory use does not grow with (untrusted) input.
+
     """
 
-    cls.__cache__.setdefault('key_mappings', {})
-    cache: dict[typing.Any, typing.Optional[str]] = (
-        cls.__cache__['key_mappings']
-        )
-    if key in cache:
-        return cache[key]
+    if (k := cls.__aliases__.get(key)) is not None:
+        return k
     elif not isinstance(key, str):
-        cls.__cache__['key_mappings'][key] = None
         return None
-    elif (
-        cls.is_snake_case
+    return _resolve_key(cls.__fields__, cls.is_snake_case, key)
+
+
+def _resolve_key(
+    fields: typing.Container[str],
+    is_snake_case: bool,
+    key: str
+    ) -> typing.Optional[str]:
+    if (
+        is_snake_case
         and not key.islower()
         and (
             (
                 k := (_k := camel_case_to_snake_case(key.strip('_')))
-                ) in cls.__fields__
-            or (k := '_' + _k) in cls.__fields__
-            or (k := _k + '_') in cls.__fields__
-            or (k := '_' + _k + '_') in cls.__fields__
+                ) in fields
+            or (k := '_' + _k) in fields
+            or (k := _k + '_') in fields
+            or (k := '_' + _k + '_') in fields
             )
         ):
-        cls.__cache__['key_mappings'][key] = k
         return k
     elif (
-        (k := (_k := key.strip('_'))) in cls.__fields__
-        or (k := '_' + _k) in cls.__fields__
-        or (k := _k + '_') in cls.__fields__
-        or (k := '_' + _k + '_') in cls.__fields__
+        (k := (_k := key.strip('_'))) in fields
+        or (k := '_' + _k) in fields
+        or (k := _k + '_') in fields
+        or (k := '_' + _k + '_') in fields
         ):
-        cls.__cache__['key_mappings'][key] = k
         return k
     else:
-        cls.__cache__['key_mappings'][key] = None
         return None
 
 
+def get_aliases(
+    fields: typing.Iterable[str],
+    is_snake_case: bool
+    ) -> types.MappingProxyType[str, str]:
+    """
+    Frozen table of aliases to field names, as resolved by `key_for`.
+
+    ---
+
+    Includes each field name, its snake_case and camelCase forms, \
+    and their leading / trailing underscore variants.
+
+    """
+
+    names = frozenset(fields)
+    aliases: dict[str, str] = {}
+    for f in names:
+        if not (s := f.strip('_')):
+            if (k := _resolve_key(names, is_snake_case, f)) is not None:
+                aliases[f] = k
+            continue
+        for alias in dict.fromkeys((s, to_camel_case(s))):
+            # Keys differing only by leading / trailing underscores
+            # resolve to the same field, so each group resolves once.
+            if (k := _resolve_key(names, is_snake_case, alias)) is not None:
+                aliases.update(
+                    dict.fromkeys(
+                        (alias, '_' + alias, alias + '_', '_' + alias + '_'),
+                        k
+                        )
+                    )
+                if alias is s:
+                    aliases[f] = k
+    return types.MappingProxyType(aliases)
+
+
+def is_array_annotation(tp: typing.Any) -> bool:
+    """True if type annotation is an Array (ex. `list[str]`)."""
+
+    origin = typing.get_origin(tp) or tp
+    return (
+        isinstance(origin, type)
+        and issubclass(origin, typing.get_args(dtypes.Array))
+        )
+
+
 def is_array_type(value: typing.Any) -> typing.TypeGuard[dtypes.Array]:
     """True if Array."""
 
@@ -0,0 +1,91 @@
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestCaching(unittest.TestCase):
+    """Fixture for testing query result caching."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Dog
+        self.objects = mocking.examples.DOGS
+        self.now = 0.0
+        self.calls = 0
+        self.cache = fgr.core.caching.QueryCache(
+            maxsize=2,
+            ttl=10,
+            dtype=self.cls,
+            timer=lambda: self.now
+            )
+        return super().setUp()
+
+    def execute(self, q: fgr.core.query.Query) -> list:
+        self.calls += 1
+        return fgr.core.engine.execute(q, self.objects)
+
+    def test_01_fetch(self):
+        """Test equivalent queries share results."""
+
+        q1 = (self.cls.age > 2) & (self.cls.name != 'rex')
+        q2 = ~((self.cls.name == 'rex') | ~(self.cls.age > 2))
+        self.assertListEqual(
+            self.cache.fetch(q1, self.execute),
+            self.cache.fetch(q2, self.execute)
+            )
+        self.assertEqual(self.calls, 1)
+        self.assertIn(q2, self.cache)
+        self.assertEqual(
+            repr(self.cache.stats),
+            'CacheStats(hits=1, misses=1, evictions=0, expirations=0)'
+            )
+        self.assertEqual(self.cache.stats.hit_rate, 0.5)
+
+    def test_02_lru(self):
+        """Test least recently used results are evicted."""
+
+        a, b, c = (self.cls.age == i for i in range(3))
+        self.cache.fetch(a, self.execute)
+        self.cache.fetch(b, self.execute)
+        self.cache.fetch(a, self.execute)
+        self.cache.fetch(c, self.execute)
+        self.assertIn(a, self.cache)
+        self.assertNotIn(b, self.cache)
+        self.assertEqual(self.cache.stats.evictions, 1)
+        self.assertEqual(repr(self.cache), 'QueryCache(2/2)')
+
+    def test_03_ttl(self):
+        """Test results expire."""
+
+        q = self.cls.name == 'rex'
+        self.cache.put(q, ['cached'])
+        self.now = 9.9
+        self.assertListEqual(self.cache.get(q), ['cached'])
+        self.now = 10
+        self.assertNotIn(q, self.cache)
+        self.assertIsNone(self.cache.get(q))
+        self.assertEqual(self.cache.stats.expirations, 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_04_clear(self):
+        """Test clear keeps statistics."""
+
+        cache = fgr.core.caching.QueryCache()
+        self.assertEqual(cache.stats.hit_rate, 0.0)
+        cache.fetch(self.cls.age > 1, self.execute)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.get(self.cls.age > 1, 'default'), 'default')
+
+    def test_05_sorting_and_limit(self):
+        """Test sorting and limit are part of the key."""
+
+        q = self.cls.age > 1
+        self.cache.fetch(q, self.execute)
+        q += 'age'
+        self.assertNotIn(q, self.cache)
+        q.sorting.clear()
+        q.limit = 1
+        self.assertNotIn(q, self.cache)
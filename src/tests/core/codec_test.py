@@ -1,9 +1,18 @@
 import datetime
 import decimal
+import enum
+import io
+import itertools
+import json
+import typing
 import unittest
+import unittest.mock
+import uuid
 
 import fgr
 
+from . import mocking
+
 
 class TestCodec(unittest.TestCase):
     """Fixture for testing the object."""
@@ -37,3 +46,189 @@ class TestCodec(unittest.TestCase):
             fgr.core.codec.encode(self.decimal_int),
             int(self.decimal_int)
             )
+
+    def test_04_iterencode_matches_to_dict(self):
+        """Test iterencode output is identical to json.dumps(to_dict)."""
+
+        for object_ in (
+            mocking.TripDeriv(required_field=1),
+            mocking.AntiTripDeriv(required_field=1),
+            mocking.examples.DOGS[1],
+            ):
+            for camel_case, include_null, indent, sort_keys in itertools.product(
+                (False, True),
+                (False, True),
+                (None, 2),
+                (False, True)
+                ):
+                with self.subTest(
+                    object_=object_.__class__.__name__,
+                    camel_case=camel_case,
+                    include_null=include_null,
+                    indent=indent,
+                    sort_keys=sort_keys
+                    ):
+                    self.assertEqual(
+                        ''.join(
+                            fgr.core.codec.iterencode(
+                                object_,
+                                camel_case=camel_case,
+                                include_null=include_null,
+                                indent=indent,
+                                sort_keys=sort_keys
+                                )
+                            ),
+                        json.dumps(
+                            object_.to_dict(camel_case, include_null),
+                            default=fgr.core.codec.encode,
+                            indent=indent,
+                            sort_keys=sort_keys
+                            )
+                        )
+
+    def test_05_iterencode_values(self):
+        """Test iterencode of non-object values."""
+
+        value = {
+            'a': [1.5, float('nan'), float('inf'), -float('inf'), {}, []],
+            1: {'b', },
+            None: (True, False, None),
+            2.5: self.decimal_int,
+            }
+        self.assertEqual(
+            ''.join(fgr.core.codec.iterencode(value)),
+            json.dumps(value, default=fgr.core.codec.encode)
+            )
+        with self.assertRaises(TypeError):
+            ''.join(fgr.core.codec.iterencode({(1, 2): 3}))
+        value['c'] = value
+        with self.assertRaises(ValueError):
+            ''.join(fgr.core.codec.iterencode(value))
+
+    def test_06_iterencode_redact(self):
+        """Test iterencode redacts sensitive values."""
+
+        value = {'api_key': 'abc', 'name': 'fido', 'tags': ['good']}
+        self.assertEqual(
+            ''.join(fgr.core.codec.iterencode(value, redact=True)),
+            json.dumps(fgr.core.utils.convert_for_representation(value))
+            )
+        self.assertIn('[ REDACTED :: API KEY ]', json.loads(
+            ''.join(fgr.core.codec.iterencode(value, redact=True))
+            )['api_key'])
+
+    def test_07_dump(self):
+        """Test dump writes buffered chunks."""
+
+        stream = io.StringIO()
+        with unittest.mock.patch.object(
+            fgr.core.codec.Constants,
+            'CHUNK_SIZE',
+            16
+            ):
+            fgr.core.codec.dump(mocking.examples.DOGS, stream, indent=2)
+        self.assertEqual(
+            stream.getvalue(),
+            json.dumps(
+                [dog.to_dict() for dog in mocking.examples.DOGS],
+                indent=2
+                )
+            )
+
+    def test_08_decoder(self):
+        """Test decoders for typed values."""
+
+        class Color(enum.Enum):
+            red = 'r'
+
+        cases = (
+            (int, '12', 12),
+            (int, 'x', 'x'),
+            (float, 1, 1.0),
+            (bool, 'TRUE', True),
+            (Color, 'r', Color.red),
+            (uuid.UUID, 'nope', 'nope'),
+            (datetime.date, '2020-01-02', datetime.date(2020, 1, 2)),
+            (dict[str, int], '{"a": "1", "b": null}', {'a': 1, 'b': None}),
+            (set[int], ['1', 2], {1, 2}),
+            (tuple[int, str], [1, 2, 3], (1, 2, 3)),
+            (tuple[int, ...], 'x', 'x'),
+            (typing.Optional[int], '5', 5),
+            (typing.Union[int, str], '5', '5'),
+            (typing.Union[int, datetime.date], '2020-01-02', datetime.date(2020, 1, 2)),
+            (typing.Union[int, datetime.date], 'x', 'x'),
+            (list[int], 'x', 'x'),
+            (dict[str, int], [1], [1]),
+            (tuple[int, str], 'x', 'x'),
+            (mocking.NewDeriv, '[1]', [1]),
+            (mocking.NewDeriv, 1, 1),
+            )
+        for tp, value, expected in cases:
+            with self.subTest(tp=tp, value=value):
+                self.assertEqual(fgr.core.codec.decoder(tp)(value), expected)
+        for tp in (str, list[str], dict, typing.Any, 'Unresolved', typing.Union[str, list]):
+            with self.subTest(tp=tp):
+                self.assertIsNone(fgr.core.codec.decoder(tp))
+
+    def test_09_iterencode_nested_containers(self):
+        """Test iterencode of objects within nested containers."""
+
+        class NestedDeriv(fgr.Object):
+
+            record_id: fgr.Field[str] = 'abc'
+            dict_field: fgr.Field[dict] = {}
+            list_field: fgr.Field[list] = []
+
+        object_ = NestedDeriv(
+            dict_field={
+                'new_deriv': mocking.NewDeriv(),
+                'some_key': {'inner_key': [1, None], 'other_key': None},
+                'null_key': None,
+                },
+            list_field=[{'a_b': 1, 'c': None}, [2, None], None, mocking.NewDeriv()]
+            )
+        for camel_case, include_null, indent, sort_keys in itertools.product(
+            (False, True),
+            (False, True),
+            (None, 2),
+            (False, True)
+            ):
+            with self.subTest(
+                camel_case=camel_case,
+                include_null=include_null,
+                indent=indent,
+                sort_keys=sort_keys
+                ):
+                self.assertEqual(
+                    ''.join(
+                        fgr.core.codec.iterencode(
+                            object_,
+                            camel_case=camel_case,
+                            include_null=include_null,
+                            indent=indent,
+                            sort_keys=sort_keys
+                            )
+                        ),
+                    json.dumps(
+                        object_.to_dict(camel_case, include_null),
+                        default=fgr.core.codec.encode,
+                        indent=indent,
+                        sort_keys=sort_keys
+                        )
+                    )
+
+        deep = NestedDeriv(
+            dict_field={'some_key': [mocking.NewDeriv()]},
+            list_field=[{'inner_key': mocking.NewDeriv()}]
+            )
+        new_deriv = json.loads(
+            json.dumps(mocking.NewDeriv().to_dict(camel_case=True))
+            )
+        self.assertDictEqual(
+            json.loads(''.join(fgr.core.codec.iterencode(deep, camel_case=True))),
+            {
+                'recordId': 'abc',
+                'dictField': {'someKey': [new_deriv]},
+                'listField': [{'inner_key': new_deriv}],
+                }
+            )
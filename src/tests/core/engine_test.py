@@ -0,0 +1,142 @@
+import math
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestEngine(unittest.TestCase):
+    """Fixture for testing in-memory query execution."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Dog
+        self.objects = mocking.examples.DOGS
+        return super().setUp()
+
+    def names(self, q: fgr.core.query.Query) -> list[str]:
+        return [obj.name for obj in fgr.core.engine.execute(q, self.objects)]
+
+    def test_01_eq(self):
+        """Test == condition."""
+
+        self.assertListEqual(self.names(self.cls.name == 'rex'), ['rex'])
+
+    def test_02_ne(self):
+        """Test != condition."""
+
+        self.assertListEqual(
+            self.names(self.cls.age != None),
+            ['fido', 'rex', 'buddy', 'Fido']
+            )
+
+    def test_03_ranges(self):
+        """Test range conditions never match None."""
+
+        self.assertListEqual(
+            self.names((self.cls.age > 2) & (self.cls.age <= 5)),
+            ['fido', 'rex']
+            )
+
+    def test_04_null_range(self):
+        """Test range condition against None never matches."""
+
+        self.assertListEqual(self.names(self.cls.age < None), [])
+
+    def test_05_eq_null(self):
+        """Test == None condition."""
+
+        self.assertListEqual(self.names(self.cls.age == None), ['fidi'])
+
+    def test_06_contains(self):
+        """Test contains condition."""
+
+        self.assertListEqual(
+            self.names(~(self.cls.tags << 'loud')),
+            ['fido', 'fidi', 'buddy']
+            )
+
+    def test_07_similar(self):
+        """Test similarity condition."""
+
+        self.assertListEqual(
+            self.names(self.cls.name % 'FIDO'),
+            ['fido', 'Fido']
+            )
+
+    def test_08_or_sort_limit(self):
+        """Test or, sorting and limit."""
+
+        q = (self.cls.age >= 5) | (self.cls.age < 3) | (self.cls.age == None)
+        q -= 'age'
+        q += 'name'
+        q.limit = 3
+        self.assertListEqual(self.names(q), ['fidi', 'Fido', 'rex'])
+
+    def test_09_empty_query(self):
+        """Test empty and / or queries."""
+
+        self.assertListEqual(
+            self.names(
+                fgr.core.query.AndQuery(and_=[])
+                | fgr.core.query.OrQuery(or_=[])
+                ),
+            [obj.name for obj in self.objects]
+            )
+
+    def test_10_invalid_field(self):
+        """Test invalid field raises."""
+
+        self.assertRaises(
+            fgr.core.exceptions.InvalidQueryFieldError,
+            lambda: fgr.core.engine.execute(
+                fgr.core.query.EqQueryCondition(field='x', eq=1),
+                self.objects
+                )
+            )
+
+    def test_11_similarity(self):
+        """Test similarity scores."""
+
+        self.assertTupleEqual(
+            (
+                fgr.core.similarity.score('', ''),
+                fgr.core.similarity.score('fido', 'FIDO'),
+                ),
+            (1.0, 1.0)
+            )
+
+    def test_12_similar_threshold_non_finite(self):
+        """Test similarity thresholds that have no literal repr."""
+
+        for threshold, expected in (
+            (math.inf, []),
+            (-math.inf, [obj.name for obj in self.objects]),
+            (math.nan, []),
+            ):
+            with self.subTest(threshold=threshold):
+                self.assertListEqual(
+                    self.names(self.cls.name % ('fido', threshold)),
+                    expected
+                    )
+
+    def test_13_base_query(self):
+        """Test a query without conditions matches all objects."""
+
+        self.assertListEqual(
+            self.names(fgr.core.query.Query()),
+            [obj.name for obj in self.objects]
+            )
+
+    def test_14_nested_junctions(self):
+        """Test nested queries of the same type are evaluated."""
+
+        q = fgr.core.query.OrQuery(
+            or_=[
+                self.cls.name == 'rex',
+                fgr.core.query.OrQuery(
+                    or_=[self.cls.name == 'fidi', self.cls.age > 6]
+                    ),
+                ]
+            )
+        self.assertListEqual(self.names(q), ['fidi', 'rex', 'Fido'])
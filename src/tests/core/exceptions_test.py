@@ -77,3 +77,17 @@ class TestExceptions(unittest.TestCase):
         exc = fgr.core.exceptions.FieldAnnotationeError('test', int)
         dump = pickle.dumps(exc)
         self.assertTupleEqual(exc.args, pickle.loads(dump).args)
+
+    def test_08_serialization(self):
+        """Test multi-arg exc serializes correctly."""
+
+        exc = fgr.core.exceptions.InvalidQueryFieldError('test', fgr.Object)
+        dump = pickle.dumps(exc)
+        self.assertTupleEqual(exc.args, pickle.loads(dump).args)
+
+    def test_09_serialization(self):
+        """Test multi-arg exc serializes correctly."""
+
+        exc = fgr.core.exceptions.InvalidJSONDocumentError(fgr.Object, [1])
+        dump = pickle.dumps(exc)
+        self.assertTupleEqual(exc.args, pickle.loads(dump).args)
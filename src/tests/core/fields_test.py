@@ -239,3 +239,112 @@ class TestFieldValidation(unittest.TestCase):
                 json.dumps(self.cls.tuple_field.default)
                 ),
             )
+
+    def test_15_parse_dtype(self):
+        """Test union types."""
+
+        field = fgr.Field(name='union_field', type=int | list[int])
+        self.assertEqual(field.parse_dtype('2'), 2)
+        self.assertListEqual(field.parse_dtype('["1", 2]'), [1, 2])
+        self.assertEqual(
+            fgr.Field(name='optional_field', type=typing.Optional[int]).parse_dtype('3'),
+            3
+            )
+
+    def test_16_coercer(self):
+        """Test coercer compiled once per type."""
+
+        self.assertIs(
+            self.cls.generic_tuple_field.coercer(),
+            self.cls.generic_tuple_field.coercer()
+            )
+        self.assertIsNot(
+            self.cls.generic_tuple_field.coercer(),
+            self.cls.generic_tuple_field.coercer(validate_dtype=False)
+            )
+
+    def test_17_coercer(self):
+        """Test coercer parses batch of values."""
+
+        coerce = fgr.Field(name='int_field', type=int).coercer()
+        self.assertListEqual(
+            [coerce(v) for v in ('1', 2, '07', None, 'null')],
+            [1, 2, 7, None, None]
+            )
+        self.assertRaises(fgr.core.exceptions.IncorrectTypeError, coerce, 'a')
+
+    def test_18_coercer_union_falsy(self):
+        """Test Union coercer accepts valid falsy values."""
+
+        for t, values in (
+            (typing.Optional[int], (0, '0')),
+            (typing.Optional[float], (0.0, '0.0')),
+            (typing.Optional[str], ('', )),
+            (typing.Optional[bool], (False, 'false')),
+            (typing.Optional[list[int]], ([], ())),
+            (typing.Union[int, str], (0, '')),
+            ):
+            coerce = fgr.Field(name='union_field', type=t).coercer()
+            for v in values:
+                with self.subTest(t=t, v=v):
+                    parsed = coerce(v)
+                    self.assertIsNotNone(parsed)
+                    self.assertFalse(parsed)
+
+    def test_19_coercer_number_str(self):
+        """Test coercer raises IncorrectTypeError for invalid number str."""
+
+        for t in (int, typing.Optional[int]):
+            coerce = fgr.Field(name='int_field', type=t).coercer()
+            for v in ('1.5', '1.', '١.x'):
+                with self.subTest(t=t, v=v):
+                    self.assertRaises(
+                        fgr.core.exceptions.IncorrectTypeError,
+                        coerce,
+                        v
+                        )
+        self.assertIsNone(
+            fgr.Field(name='int_field', type=int).coercer(False)('1.5')
+            )
+
+    def test_20_coercer_invalid_values(self):
+        """Test coercer raises IncorrectTypeError per invalid value."""
+
+        for t, v in (
+            (dict, '{invalid'),
+            (dict, [1, 2]),
+            (dict, ['ab', 'c']),
+            (list[int], '[1'),
+            (mocking.NewDeriv, '{"fieldThatDoesNotExist": 1}'),
+            (mocking.NewDeriv, 1),
+            ):
+            with self.subTest(t=t, v=v):
+                self.assertRaises(
+                    fgr.core.exceptions.IncorrectTypeError,
+                    fgr.Field(name='field', type=t).coercer(),
+                    v
+                    )
+                self.assertIsNone(
+                    fgr.Field(name='field', type=t).coercer(False)(v)
+                    )
+        self.assertEqual(
+            fgr.Field(
+                name='field',
+                type=typing.Optional[mocking.NewDeriv] | dict
+                ).coercer()({'bad': 1}),
+            {'bad': 1}
+            )
+
+    def test_21_coercer_other_types(self):
+        """Test coercer for unhashable, non-class and subclassed types."""
+
+        class Str(str):
+            pass
+
+        field = fgr.Field(name='field', type=typing.Literal[[1]])
+        coerce = field.coercer()
+        self.assertListEqual(coerce([1]), [1])
+        self.assertIsNone(coerce(None))
+        self.assertIsNot(field.coercer(), coerce)
+        value = Str('a')
+        self.assertIs(fgr.Field(name='field', type=str).coercer()(value), value)
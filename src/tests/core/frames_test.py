@@ -0,0 +1,118 @@
+import array
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestObjectFrame(unittest.TestCase):
+    """Fixture for testing ObjectFrame."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.Derivative
+        self.objects = [
+            self.cls(str_field='a', int_field=1, required_field=10),
+            self.cls(str_field='b', bool_field=False, required_field=20),
+            self.cls(str_field='c', int_field=3, required_field=30),
+            ]
+        self.frame = fgr.core.frames.ObjectFrame(self.cls, self.objects)
+        return super().setUp()
+
+    def test_01_round_trip(self):
+        """Test ObjectFrame round trip to list of Objects."""
+
+        self.assertListEqual(
+            [dict(obj) for obj in self.frame.to_objects()],
+            [dict(obj) for obj in self.objects]
+            )
+
+    def test_02_typed_columns(self):
+        """Test numeric and bool columns are stored in arrays."""
+
+        self.assertTupleEqual(
+            (
+                self.frame['int_field'].typecode,
+                self.frame['boolField'].typecode,
+                self.frame['str_field'].__class__,
+                ),
+            ('q', 'b', list)
+            )
+
+    def test_03_index(self):
+        """Test ObjectFrame __getitem__ by index."""
+
+        self.assertIs(self.frame[1].bool_field, False)
+
+    def test_04_slice(self):
+        """Test ObjectFrame __getitem__ by slice."""
+
+        self.assertListEqual(
+            [obj.str_field for obj in self.frame[1:]],
+            ['b', 'c']
+            )
+
+    def test_05_key_error(self):
+        """Test ObjectFrame __getitem__ raises KeyError if no field."""
+
+        self.assertRaises(KeyError, lambda: self.frame['not_a_field'])
+
+    def test_06_nullable_column(self):
+        """Test typed column converted to list on None."""
+
+        self.frame.append(self.cls(int_field=None, bool_field=None))
+        self.assertTupleEqual(
+            (
+                self.frame['int_field'],
+                self.frame['bool_field'],
+                len(self.frame),
+                ),
+            ([1, 2, 3, None], [True, False, True, None], 4)
+            )
+
+    def test_07_overflow_column(self):
+        """Test typed column converted to list on overflow."""
+
+        self.frame.append(self.cls(int_field=2 ** 64))
+        self.frame[0] = self.cls(secondary_key=2 ** 64)
+        self.assertTupleEqual(
+            (self.frame[-1].int_field, self.frame[0].secondary_key),
+            (2 ** 64, 2 ** 64)
+            )
+
+    def test_08_setitem(self):
+        """Test ObjectFrame __setitem__."""
+
+        self.frame[0] = self.cls(str_field='z', bool_field=None)
+        self.assertTupleEqual(
+            (self.frame[0].str_field, self.frame[0].bool_field),
+            ('z', None)
+            )
+
+    def test_09_interned(self):
+        """Test str columns are interned."""
+
+        frame = fgr.core.frames.ObjectFrame(
+            self.cls,
+            (self.cls(str_field=''.join(('x', 'y'))) for _ in range(2))
+            )
+        self.assertIs(frame['str_field'][0], frame['str_field'][1])
+
+    def test_10_empty(self):
+        """Test ObjectFrame without fields."""
+
+        frame = fgr.core.frames.ObjectFrame(fgr.Object)
+        self.assertEqual(
+            (len(frame), repr(frame)),
+            (0, 'ObjectFrame[Object](0)')
+            )
+
+    def test_11_array(self):
+        """Test float columns."""
+
+        class Measure(fgr.Object):
+
+            value: fgr.Field[float] = 1.5
+
+        frame = fgr.core.frames.ObjectFrame(Measure, [Measure()])
+        self.assertIsInstance(frame['value'], array.array)
@@ -0,0 +1,358 @@
+import typing
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestIndexes(unittest.TestCase):
+    """Fixture for testing indexed collections."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Dog
+        self.objects = mocking.examples.DOGS
+        self.collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            self.objects,
+            hash_fields=('id', 'name', 'tags'),
+            sorted_fields=('age', )
+            )
+        return super().setUp()
+
+    def names(self, q: fgr.core.query.Query) -> list[str]:
+        return [obj.name for obj in self.collection.query(q)]
+
+    def test_01_default_hash_fields(self):
+        """Test hash indexes default to hash_fields."""
+
+        collection = fgr.core.indexes.IndexedCollection(self.cls, self.objects)
+        self.assertTupleEqual(
+            tuple(collection.hash_indexes),
+            self.cls.hash_fields
+            )
+
+    def test_02_hash_plan(self):
+        """Test == condition uses hash index."""
+
+        q = self.cls.name == 'rex'
+        self.assertEqual(self.collection.explain(q), 'HashIndex(name)')
+        self.assertListEqual(self.names(q), ['rex'])
+
+    def test_03_contains_plan(self):
+        """Test contains condition uses hash index on array field."""
+
+        q = self.cls.tags << 'loud'
+        self.assertEqual(self.collection.explain(q), 'HashIndex(tags)')
+        self.assertListEqual(self.names(q), ['rex', 'Fido'])
+
+    def test_04_range_plan(self):
+        """Test range conditions use sorted index."""
+
+        for q, expected in (
+            (self.cls.age > 3, ['rex', 'Fido']),
+            (self.cls.age >= 3, ['fido', 'rex', 'Fido']),
+            (self.cls.age < 3, ['buddy']),
+            (self.cls.age <= 3, ['fido', 'buddy']),
+            (self.cls.age == 5, ['rex']),
+            ):
+            with self.subTest(q=q):
+                self.assertEqual(self.collection.explain(q), 'SortedIndex(age)')
+                self.assertListEqual(self.names(q), expected)
+
+    def test_05_and_or_plans(self):
+        """Test and intersects, or unites, otherwise scan."""
+
+        q_and = (self.cls.age > 2) & (self.cls.tags << 'good')
+        q_or = (self.cls.name == 'buddy') | (self.cls.age >= 7)
+        q_scan = (self.cls.name == 'buddy') | (self.cls.age != 7)
+        self.assertEqual(self.collection.explain(q_and), 'HashIndex(tags)')
+        self.assertEqual(
+            self.collection.explain(q_or),
+            'HashIndex(name) | SortedIndex(age)'
+            )
+        self.assertListEqual(self.names(q_and), ['fido', 'rex'])
+        self.assertListEqual(self.names(q_or), ['buddy', 'Fido'])
+        self.assertEqual(self.collection.explain(q_scan), 'scan')
+        self.assertEqual(
+            self.collection.explain(self.cls.age != 7),
+            'scan'
+            )
+        self.assertEqual(
+            self.collection.explain(
+                (self.cls.age != 7) & (self.cls.age != 5)
+                ),
+            'scan'
+            )
+        self.assertEqual(
+            self.collection.explain(fgr.core.query.Query()),
+            'scan'
+            )
+        self.assertEqual(
+            self.collection.explain(self.cls.age < None),
+            'scan'
+            )
+
+    def test_06_results_match_engine(self):
+        """Test indexed results match a full scan."""
+
+        for q in (
+            self.cls.id_ == '3',
+            self.cls.name == 'nope',
+            self.cls.tags << 'good',
+            (self.cls.age > 2) & (self.cls.age < 7),
+            ~(self.cls.age > 2),
+            (self.cls.name == 'fido') | (self.cls.tags << 'loud'),
+            self.cls.name % 'fido',
+            ):
+            with self.subTest(q=q):
+                self.assertListEqual(
+                    self.collection.query(q),
+                    fgr.core.engine.execute(q, self.objects)
+                    )
+
+    def test_07_sorting_and_limit(self):
+        """Test sorting and limit apply to indexed results."""
+
+        q = self.cls.age >= 2
+        q -= 'age'
+        q.limit = 2
+        self.assertListEqual(self.names(q), ['Fido', 'rex'])
+
+    def test_08_add_remove(self):
+        """Test indexes are maintained on add and remove."""
+
+        dog = self.cls(id='6', name='max', age=4, tags=['good'])
+        self.collection.add(dog)
+        self.collection.add(dog)
+        self.assertIn(dog, self.collection)
+        self.assertEqual(len(self.collection), 6)
+        self.assertListEqual(self.names(self.cls.age == 4), ['max'])
+        self.assertListEqual(
+            self.names(self.cls.tags << 'good'),
+            ['fido', 'rex', 'max']
+            )
+        self.collection.remove(dog)
+        self.collection.remove(self.objects[1])
+        self.assertNotIn(dog, self.collection)
+        self.assertListEqual(self.names(self.cls.age == 4), [])
+        self.assertListEqual(self.names(self.cls.tags << 'good'), ['fido', 'rex'])
+        self.assertListEqual(
+            [obj.name for obj in self.collection],
+            ['fido', 'rex', 'buddy', 'Fido']
+            )
+
+    def test_09_unindexable_values(self):
+        """Test unhashable and unordered values remain candidates."""
+
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            hash_fields=('name', ),
+            sorted_fields=('age', 'name')
+            )
+        odd = self.cls(id='7', name=['odd'], age='old')
+        collection.extend([*self.objects, odd])
+        q_name = fgr.core.query.EqQueryCondition(field='name', eq=['odd'])
+        q_age = fgr.core.query.EqQueryCondition(field='age', eq='older')
+        self.assertListEqual(collection.query(q_name), [odd])
+        self.assertListEqual(collection.query(q_age), [])
+        other = self.cls(id='8', name='other', age='older')
+        collection.add(other)
+        self.assertListEqual(collection.query(q_age), [other])
+        self.assertSetEqual(
+            set(collection.sorted_indexes['age'].range(lo=1)),
+            {0, 2, 3, 4, 5, 6}
+            )
+        collection.remove(odd)
+        collection.remove(other)
+        self.assertDictEqual(collection.hash_indexes['name'].unhashable, {})
+        self.assertDictEqual(collection.sorted_indexes['age'].unordered, {})
+        self.assertListEqual(
+            [obj.name for obj in collection.query(self.cls.age > 3)],
+            ['rex', 'Fido']
+            )
+
+    def test_10_invalid_field(self):
+        """Test invalid index field raises."""
+
+        self.assertRaises(
+            fgr.core.exceptions.InvalidQueryFieldError,
+            fgr.core.indexes.IndexedCollection,
+            self.cls,
+            sorted_fields=('nope', )
+            )
+
+    def test_11_repr(self):
+        """Test repr."""
+
+        self.assertEqual(repr(self.collection), 'IndexedCollection[Dog](5)')
+        self.assertEqual(
+            repr(self.collection.sorted_indexes['age']),
+            'SortedIndex(age)'
+            )
+
+    def test_12_similarity_plan(self):
+        """Test similarity condition uses similarity index."""
+
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            self.objects,
+            similar_fields=('name', )
+            )
+        q = self.cls.name % 'FIDO'
+        self.assertEqual(collection.explain(q), 'SimilarityIndex(name)')
+        self.assertListEqual(
+            collection.query(q),
+            fgr.core.engine.execute(q, self.objects)
+            )
+        collection.remove(self.objects[0])
+        collection.add(self.cls(id='6', name='fido'))
+        self.assertListEqual(
+            [obj.id_ for obj in collection.query(self.cls.name % ('fid', 0.3))],
+            ['2', '5', '6']
+            )
+
+    def test_13_merge(self):
+        """Test merge updates matched objects and adds the rest."""
+
+        objects = [self.cls(dog) for dog in self.objects]
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            objects,
+            sorted_fields=('age', ),
+            similar_fields=('name', )
+            )
+        collection.merge(
+            (
+                {'id': '2', 'age': 4},
+                self.cls(id='3', name='rex', tags=['calm']),
+                {'id': '6', 'name': 'spot'},
+                )
+            )
+        self.assertEqual(len(collection), 6)
+        self.assertIs(objects[1], collection.query(self.cls.id_ == '2')[0])
+        self.assertEqual(objects[1].age, 4)
+        self.assertEqual(objects[2].age, 5)
+        self.assertListEqual(objects[2].tags, ['calm'])
+        for q in (
+            self.cls.age > 3,
+            self.cls.name % 'spot',
+            self.cls.id_ == '6',
+            ):
+            with self.subTest(q=q):
+                self.assertListEqual(
+                    collection.query(q),
+                    fgr.core.engine.execute(q, list(collection))
+                    )
+
+    def test_14_merge_interpolate(self):
+        """Test merge without overwrite only fills default values."""
+
+        objects = [self.cls(dog) for dog in self.objects]
+        collection = fgr.core.indexes.IndexedCollection(self.cls, objects)
+        collection.merge(
+            (
+                {'id': '1', 'age': 9},
+                {'id': '2', 'age': 9},
+                {'id': '7', 'name': 'max'},
+                {'id': '7', 'age': 1},
+                ),
+            overwrite=False
+            )
+        self.assertListEqual(
+            [obj.age for obj in collection],
+            [3, 9, 5, 2, 7, 1]
+            )
+
+    def test_15_merge_unindexed_keys(self):
+        """Test merge matches by key table if keys are not indexed."""
+
+        objects = [self.cls(dog) for dog in self.objects]
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            objects,
+            hash_fields=('name', )
+            )
+        collection.merge(
+            (
+                {'id': '4', 'name': 'bud'},
+                {'id': '8', 'name': 'rex'},
+                {'id': '8', 'age': 1},
+                )
+            )
+        self.assertEqual(len(collection), 6)
+        self.assertEqual(objects[3].name, 'bud')
+        self.assertListEqual(
+            [obj.id_ for obj in collection.query(self.cls.name == 'rex')],
+            ['3', '8']
+            )
+        self.assertEqual(collection.query(self.cls.id_ == '8')[0].age, 1)
+
+    def test_16_merge_factory_defaults(self):
+        """Test merge resolves factory defaults as __init__ does."""
+
+        class Tagged(fgr.Object):
+
+            id_: fgr.Field[str] = lambda: 'new'
+            tags: fgr.Field[list[str]] = lambda: []
+
+        objects = [Tagged(id='1'), Tagged(id='2', tags=['a'])]
+        collection = fgr.core.indexes.IndexedCollection(Tagged, objects)
+        collection.merge(
+            (
+                {'id': '1', 'tags': ['b']},
+                {'id': '2', 'tags': ['b']},
+                {'tags': ['c']},
+                {'tags': ['d']},
+                ),
+            overwrite=False
+            )
+        self.assertListEqual(
+            [(obj.id_, obj.tags) for obj in collection],
+            [('1', ['b']), ('2', ['a']), ('new', ['c'])]
+            )
+
+    def test_17_remove_unordered(self):
+        """Test removed unordered rows are not returned after reordering."""
+
+        class Row(fgr.Object):
+
+            v: fgr.Field[typing.Any] = None
+
+        collection = fgr.core.indexes.IndexedCollection(
+            Row,
+            sorted_fields=('v', )
+            )
+        rows = [Row(v='x'), Row(v=5)]
+        collection.extend(rows)
+        collection.extend(rows)
+        self.assertEqual(len(collection), 2)
+        for row in rows:
+            collection.remove(row)
+        self.assertDictEqual(collection.sorted_indexes['v'].unordered, {})
+        q = fgr.core.query.GtQueryCondition(field='v', gt=1)
+        self.assertListEqual(collection.query(q), [])
+        collection.add(row := Row(v=2))
+        self.assertListEqual(collection.query(q), [row])
+
+    def test_18_merge_unhashable_keys(self):
+        """Test merge matches unhashable and self-unequal keys by scan."""
+
+        objects = [self.cls(dog) for dog in self.objects]
+        odd = self.cls(id=['7'], name='odd')
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            [*objects, odd],
+            hash_fields=('name', )
+            )
+        collection.merge(({'id': ['8'], 'age': 1}, {'id': ['7'], 'age': 2}))
+        self.assertEqual(len(collection), 7)
+        self.assertEqual(odd.age, 2)
+        self.assertListEqual(list(collection)[-1].id_, ['8'])
+        nan = self.cls(id=float('nan'), name='nan')
+        collection = fgr.core.indexes.IndexedCollection(
+            self.cls,
+            [*objects, nan]
+            )
+        collection.merge((nan, ))
+        self.assertEqual(len(collection), 6)
@@ -1,6 +1,9 @@
+import copy
 import json
+import pickle
 import typing
 import unittest
+import unittest.mock
 
 import fgr
 
@@ -128,6 +131,317 @@ class TestBase(unittest.TestCase):
             )
 
 
+    def test_15_compiled_init(self):
+        """Test Base __init__ is generated for derivatives."""
+
+        self.assertTrue(
+            self.cls.__init__.__compiled__
+            and not hasattr(fgr.Field.__init__, '__compiled__')
+            )
+
+    def test_16_compiled_init(self):
+        """Test generated __init__ matches generic Base __init__."""
+
+        object_ = mocking.NewDeriv.__new__(mocking.NewDeriv)
+        fgr.core.meta.Base.__init__(
+            object_,
+            {'antiField1': 'xyz'},
+            anti_field_2=True
+            )
+        self.assertEqual(
+            dict(object_),
+            dict(mocking.NewDeriv({'antiField1': 'xyz'}, anti_field_2=True))
+            )
+
+    def test_17_compiled_init(self):
+        """Test generated __init__ copies mutable defaults."""
+
+        self.assertIsNot(
+            self.trip.dict_field,
+            mocking.TripDeriv().dict_field
+            )
+
+    def test_18_compiled_init(self):
+        """Test generated __init__ raises on undefined fields."""
+
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: self.cls(field_that_does_not_exist=1)
+            )
+
+    def test_19_compiled_init(self):
+        """Test generated __init__ calls __post_init__."""
+
+        class PostInit(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+            def __post_init__(self) -> None:
+                self.value += 1
+
+        self.assertEqual(PostInit(value=2).value, 3)
+
+
+    def test_20_nested_getitem(self):
+        """Test Base __getitem__ returns nested objects as is."""
+
+        values = dict(new_deriv=self.trip['new_deriv'])
+        self.assertIsInstance(values['new_deriv'], mocking.NewDeriv)
+
+    def test_21_nested_dict(self):
+        """Test dict(Base) exports nested objects."""
+
+        self.assertDictEqual(
+            dict(self.trip)['new_deriv'],
+            self.trip.new_deriv.to_dict()
+            )
+
+    def test_22_nested_key(self):
+        """Test Base __getitem__ exports nested objects by Key."""
+
+        object_ = mocking.NewDeriv()
+        self.assertTupleEqual(
+            object_[fgr.core.meta.Key('generic_tuple_deriv_field')],
+            tuple(
+                obj.to_dict()
+                for obj
+                in object_.generic_tuple_deriv_field
+                )
+            )
+
+    def test_23_init_from_object(self):
+        """Test __init__ from another object keeps nested objects."""
+
+        self.assertIs(
+            mocking.TripDeriv(self.trip).new_deriv,
+            self.trip.new_deriv
+            )
+
+
+    def test_24_to_dict(self):
+        """Test Base to_dict nested camelCase export without nulls."""
+
+        object_ = mocking.TripDeriv(
+            dict_field={'_private': 1, 'snake_key': None, 'key_id': 2},
+            new_deriv=mocking.NewDeriv(anti_field_1=None)
+            )
+        d = object_.to_dict(camel_case=True, include_null=False)
+        self.assertTupleEqual(
+            (
+                d['dictField'],
+                d['newDeriv']['genericTupleDerivField'][0]['bob'],
+                'antiField1' in d['newDeriv'],
+                'nullField' in d,
+                ),
+            ({'keyId': 2}, 'Frank', False, False)
+            )
+
+    def test_25_to_dict(self):
+        """Test Base to_dict compiled once per options."""
+
+        self.trip.to_dict(camel_case=1)
+        self.assertIs(
+            self.trip.__cache__['to_dict'][(True, True)],
+            mocking.TripDeriv.__cache__['to_dict'][(True, True)]
+            )
+
+    def test_26_deferred_init(self):
+        """Test __init__ is generated on first instantiation."""
+
+        class Deferred(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+        deferred = Deferred.__init__
+        self.assertEqual(Deferred(value=2).value, 2)
+        self.assertIsNot(Deferred.__init__, deferred)
+        self.assertIn(Deferred, fgr.core.meta.COMPILED)
+
+    def test_27_deferred_init(self):
+        """Test deferred __init__ generated per derivative."""
+
+        class Deferred(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+        class SubDeferred(Deferred):
+
+            other_value: fgr.Field[int] = 2
+
+        self.assertEqual(SubDeferred(value=3).other_value, 2)
+        self.assertEqual(Deferred().value, 1)
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: Deferred(other_value=3)
+            )
+
+    def test_28_bool(self):
+        """Test truthiness against cached default instance."""
+
+        object_ = mocking.NewDeriv()
+        self.assertFalse(object_)
+        object_.anti_field_2 = True
+        self.assertTrue(object_)
+        self.assertIsInstance(
+            mocking.NewDeriv.__cache__['default'],
+            mocking.NewDeriv
+            )
+        self.assertTrue(mocking.Derivative())
+
+    def test_29_iter_diff(self):
+        """Test iter_diff lazily yields changed fields only."""
+
+        other = mocking.NewDeriv(anti_field_1='abc')
+        diff = mocking.NewDeriv().iter_diff(other)
+        self.assertIsInstance(diff, typing.Iterator)
+        self.assertListEqual(list(diff), [('anti_field_1', 'cba', 'abc')])
+        object_ = mocking.NewDeriv()
+        values = {
+            'anti_field_1': object_.anti_field_1,
+            'anti_field_2': True,
+            'generic_tuple_deriv_field': object_.generic_tuple_deriv_field,
+            }
+        self.assertDictEqual(object_ - values, {'anti_field_2': True})
+
+    def test_30_bool_redefined_default(self):
+        """Test truthiness after a field default is redefined."""
+
+        class Redefined(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+        object_ = Redefined(value=2)
+        self.assertTrue(object_)
+        Redefined['value'] = fgr.Field(name='value', type=int, default=2)
+        self.assertFalse(object_)
+
+    def test_31_ilshift(self):
+        """Test Base __ilshift__ interpolates in place."""
+
+        object_ = self.trip
+        object_ <<= self.anti
+        self.assertIs(object_, self.trip)
+        self.assertEqual(object_.str_field, '123')
+        self.assertEqual(object_.other_field, self.anti.other_field)
+
+    def test_32_irshift(self):
+        """Test Base __irshift__ overwrites in place."""
+
+        object_ = self.trip
+        object_ >>= self.anti
+        self.assertIs(object_, self.trip)
+        self.assertEqual(object_.str_field, self.anti.str_field)
+        object_ >>= mocking.TripDeriv()
+        self.assertEqual(object_.str_field, self.anti.str_field)
+
+    def test_33_field_inplace_shifts(self):
+        """Test Field <<= and >>= do not mutate shared fields."""
+
+        field = self.cls.str_field
+        field <<= 'abc'
+        self.assertIsInstance(field, fgr.core.query.ContainsQueryCondition)
+        self.assertIsNot(self.cls.str_field, field)
+        field = self.cls.str_field
+        default = field.default
+        field >>= fgr.Field(name='str_field', type=str, default='zzz')
+        self.assertIsInstance(field, fgr.Field)
+        self.assertIsNot(self.cls.str_field, field)
+        self.assertEqual(field.default, 'zzz')
+        self.assertEqual(self.cls.str_field.default, default)
+
+    def test_34_pickle(self):
+        """Test Base pickles as derivative and field values."""
+
+        dump = pickle.dumps(self.trip)
+        self.assertEqual(pickle.loads(dump), self.trip)
+        self.assertIsInstance(pickle.loads(dump).new_deriv, mocking.NewDeriv)
+        reduced = self.trip.__reduce__()
+        self.assertTupleEqual(
+            reduced[1],
+            (mocking.TripDeriv, *(self.trip[f] for f in self.trip.__fields__))
+            )
+        uncompiled = fgr.core.meta.Base.__reduce__(self.trip)
+        self.assertTupleEqual(uncompiled, reduced)
+        object_ = uncompiled[0](*uncompiled[1])
+        self.assertEqual(object_, self.trip)
+        self.assertEqual(copy.copy(object_), self.trip)
+
+    def test_35_deepcopy(self):
+        """Test Base deepcopy keeps nested objects."""
+
+        object_ = copy.deepcopy(self.trip)
+        self.assertEqual(object_, self.trip)
+        self.assertIsInstance(object_.new_deriv, mocking.NewDeriv)
+        self.assertIsNot(object_.new_deriv, self.trip.new_deriv)
+        self.assertIsNot(object_.dict_field, self.trip.dict_field)
+
+    def test_36_pickle_cached_hash(self):
+        """Test cached hash is reset when unpickled."""
+
+        object_ = mocking.CachedHashSubDeriv(record_id='abc')
+        hash(object_)
+        loaded = pickle.loads(pickle.dumps(object_))
+        self.assertEqual(hash(loaded), hash(object_))
+        loaded.record_id = 'def'
+        self.assertEqual(
+            hash(loaded),
+            hash(mocking.CachedHashSubDeriv(record_id='def'))
+            )
+
+    def test_37_unpickle_previous_version(self):
+        """Test pickles from previous versions (dict state) still load."""
+
+        trip = self.trip
+
+        class Previous:
+            def __reduce__(self):
+                return (
+                    object.__new__,
+                    (mocking.TripDeriv, ),
+                    {'__values__': dict(trip)}
+                    )
+
+        self.assertEqual(pickle.loads(pickle.dumps(Previous())), self.trip)
+
+    def test_38_merge_factory_defaults(self):
+        """Test merge operators resolve factory defaults as __init__ does."""
+
+        class Factory(fgr.Object):
+
+            name: fgr.Field[str] = None
+            label: fgr.Field[str] = None
+            tags: fgr.Field[list[str]] = lambda: []
+
+            def __post_init__(self) -> None:
+                self.label = self.name and self.name.upper()
+
+        object_ = Factory(name='a')
+        other = Factory(name='b', tags=['x'])
+        self.assertListEqual((object_ << other).tags, ['x'])
+        self.assertEqual((object_ << other).label, 'A')
+        self.assertEqual((object_ >> other).label, 'B')
+        self.assertEqual((Factory() << other).label, 'B')
+        object_ <<= other
+        self.assertListEqual(object_.tags, ['x'])
+
+    def test_39_custom_init_not_compiled(self):
+        """Test custom __init__ kept when fields are redefined."""
+
+        class Custom(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+        Custom()
+
+        def __init__(self, **kwargs):
+            self.value = 3
+
+        Custom.__init__ = __init__
+        Custom['value'] = fgr.Field(name='value', type=int, default=2)
+        self.assertIs(Custom.__init__, __init__)
+        self.assertEqual(Custom().value, 3)
+
+
 class TestMeta(unittest.TestCase):
     """Fixture for testing Meta."""
 
@@ -340,6 +654,123 @@ class TestMeta(unittest.TestCase):
             )
         self.assertTrue(True)
 
+    def test_19_class_field_access(self):
+        """Test Field returned on class access, value on instance access."""
+
+        self.assertIs(self.cls.str_field, self.cls.__fields__['str_field'])
+        self.assertEqual(self.cls().str_field, self.cls.str_field.default)
+        self.assertNotIn('str_field', vars(self.mcs))
+
+    def test_20_class_attribute_shared_name(self):
+        """Test non-field class attributes sharing a field name."""
+
+        cls = self.mcs(
+            'SharedNameTest',
+            (fgr.core.meta.Base, ),
+            {
+                '__annotations__': {
+                    self.field.name: typing.ClassVar[str],
+                    },
+                self.field.name: 'value',
+                '__module__': self.__module__
+                }
+            )
+        self.assertEqual(cls.str_field, 'value')
+        self.assertEqual(cls().str_field, 'value')
+        self.assertRaises(AttributeError, lambda: fgr.Object.str_field)
+
+    def test_21_class_field_set(self):
+        """Test fields cannot be replaced by class attribute assignment."""
+
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: setattr(self.cls, 'str_field', 'value')
+            )
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: delattr(self.cls, 'str_field')
+            )
+        self.assertIsInstance(self.cls.str_field, fgr.Field)
+
+    def test_22_class_creation_hook(self):
+        """Test class creation hooks receive timings per phase."""
+
+        created: dict[str, dict[str, float]] = {}
+
+        def hook(cls: fgr.core.meta.Meta, phases: dict[str, float]) -> None:
+            created[cls.__name__] = phases
+
+        fgr.core.meta.add_class_creation_hook(hook)
+        try:
+            class Hooked(fgr.Object):
+
+                value: fgr.Field[int] = 1
+
+        finally:
+            fgr.core.meta.remove_class_creation_hook(hook)
+
+        class Unhooked(fgr.Object):
+
+            value: fgr.Field[int] = 1
+
+        self.assertListEqual(list(created), ['Hooked'])
+        self.assertTrue(
+            {'annotations', 'fields', 'namespace', 'compile'}
+            <= set(created['Hooked'])
+            )
+        self.assertTrue(all(t >= 0 for t in created['Hooked'].values()))
+
+    def test_23_unresolved_annotations(self):
+        """Test annotations with forward references are resolved."""
+
+        self.assertIs(
+            fgr.core.dtypes.utils.resolve_type(
+                list[typing.ForwardRef('Derivative')],
+                mocking.__dict__
+                ).__args__[0],
+            mocking.Derivative
+            )
+
+    def test_24_class_attribute_set_shared_name(self):
+        """Test class attributes sharing a field name can be set."""
+
+        cls = self.mcs(
+            'SharedNameSetTest',
+            (fgr.core.meta.Base, ),
+            {
+                'str_field': lambda self: 'method',
+                '__module__': self.__module__
+                }
+            )
+        with unittest.mock.patch.object(cls, 'str_field', lambda self: 'mock'):
+            self.assertEqual(cls().str_field(), 'mock')
+        self.assertEqual(cls().str_field(), 'method')
+        cls.str_field = 'value'
+        cls.bool_field = False
+        self.assertEqual(cls.str_field, 'value')
+        self.assertIs(cls().bool_field, False)
+        del cls.bool_field
+        self.assertRaises(AttributeError, lambda: cls.bool_field)
+        self.assertIsInstance(self.cls.str_field, fgr.Field)
+        self.assertIsInstance(self.cls.bool_field, fgr.Field)
+
+    def test_25_class_field_meta_name(self):
+        """Test fields named like attributes of Meta itself."""
+
+        cls = self.mcs(
+            'MetaNameTest',
+            (fgr.core.meta.Base, ),
+            {
+                '__annotations__': {'mro': fgr.Field[int]},
+                'mro': 1,
+                '__module__': self.__module__
+                }
+            )
+        sub = self.mcs('MetaNameSubTest', (cls, ), {'__module__': self.__module__})
+        self.assertIs(cls.mro, cls.__fields__['mro'])
+        self.assertIs(sub.mro, cls.__fields__['mro'])
+        self.assertEqual(sub().mro, 1)
+
 
 class TestExceptions(unittest.TestCase):
     """Fixture for testing exceptions."""
@@ -453,3 +884,215 @@ class TestExceptions(unittest.TestCase):
                     }
                 ),
             )
+
+
+class TestValidateAssignment(unittest.TestCase):
+    """Fixture for testing validated assignment."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.ValidatedDeriv
+        self.object_ = self.cls()
+        return super().setUp()
+
+    def test_01_coerce(self):
+        """Test assigned values are coerced to field types."""
+
+        self.object_.int_field = '3'
+        self.object_['generic_tuple_field'] = ['1', 2]
+        self.object_.new_deriv = dict(mocking.NewDeriv())
+        self.assertEqual(self.object_.int_field, 3)
+        self.assertTupleEqual(self.object_.generic_tuple_field, (1, 2))
+        self.assertIsInstance(self.object_.new_deriv, mocking.NewDeriv)
+
+    def test_02_init(self):
+        """Test values are coerced on instantiation."""
+
+        self.assertEqual(self.cls(int_field='4').int_field, 4)
+        self.assertEqual(self.cls.from_records([{'int_field': '5'}])[0].int_field, 5)
+
+    def test_03_invalid(self):
+        """Test invalid values raise."""
+
+        for key, value in (('int_field', 'a'), ('non_nullable_field', None)):
+            with self.subTest(key=key):
+                self.assertRaises(
+                    fgr.core.exceptions.IncorrectTypeError,
+                    lambda: self.object_.__setitem__(key, value)  # noqa: B023
+                    )
+        self.assertRaises(
+            fgr.core.exceptions.IncorrectTypeError,
+            lambda: self.cls(int_field=[])
+            )
+
+    def test_04_inherited(self):
+        """Test validation inherited by derivatives."""
+
+        self.assertTrue(mocking.ValidatedSubDeriv.__validate_assignment__)
+        self.assertIs(mocking.ValidatedSubDeriv(bool_field='true').bool_field, True)
+        self.assertEqual(mocking.ValidatedSubDeriv(int_field='6').int_field, 6)
+
+    def test_05_off_by_default(self):
+        """Test values are assigned as is by default."""
+
+        object_ = mocking.Derivative(int_field='3')
+        self.assertEqual(object_.int_field, '3')
+        self.assertFalse(mocking.Derivative.__validate_assignment__)
+        self.assertIs(mocking.Derivative.__setattr__, object.__setattr__)
+
+    def test_06_falsy(self):
+        """Test valid falsy values are assigned to optional fields."""
+
+        for key, value in (
+            ('optional_int_field', 0),
+            ('optional_str_field', ''),
+            ('optional_bool_field', False),
+            ):
+            with self.subTest(key=key):
+                self.object_[key] = value
+                self.assertIs(self.object_[key], value)
+                self.object_[key] = None
+                self.assertIsNone(self.object_[key])
+        self.assertEqual(self.cls(optional_int_field='0').optional_int_field, 0)
+        self.assertIs(self.cls(optional_bool_field='false').optional_bool_field, False)
+
+    def test_07_invalid_number_str(self):
+        """Test invalid numeric str raise IncorrectTypeError."""
+
+        for key in ('int_field', 'optional_int_field'):
+            with self.subTest(key=key):
+                self.assertRaises(
+                    fgr.core.exceptions.IncorrectTypeError,
+                    lambda: self.object_.__setitem__(key, '1.5')  # noqa: B023
+                    )
+
+    def test_08_custom_setattr(self):
+        """Test derivatives defining __setattr__ are left untouched."""
+
+        class Custom(fgr.Object, validate_assignment=True):
+
+            value: fgr.Field[int] = 1
+
+            def __setattr__(self, name: str, value: typing.Any) -> None:
+                object.__setattr__(self, name, value)
+
+        object_ = Custom()
+        object_.value = '2'
+        self.assertEqual(object_.value, '2')
+        self.assertNotIn(Custom, fgr.core.meta.VALIDATED)
+
+    def test_09_redefined_field(self):
+        """Test validation follows redefined fields."""
+
+        class Redefined(fgr.Object, validate_assignment=True):
+
+            value: fgr.Field[int] = None
+
+        object_ = Redefined()
+        object_.value = None
+        Redefined['value'] = fgr.Field(
+            name='value',
+            type=int,
+            default=1,
+            nullable=False
+            )
+        self.assertRaises(
+            fgr.core.exceptions.IncorrectTypeError,
+            lambda: setattr(object_, 'value', None)
+            )
+        object_.value = '2'
+        self.assertEqual(object_.value, 2)
+
+
+class TestHash(unittest.TestCase):
+    """Fixture for testing hashing."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.CachedHashDeriv
+        self.object_ = self.cls(record_id='abc', int_field=3)
+        return super().setUp()
+
+    def test_01_hash_fields(self):
+        """Test objects hash and compare by hash_fields values."""
+
+        self.assertTupleEqual(self.cls.hash_fields, ('record_id', ))
+        self.assertEqual(self.object_, self.cls(record_id='abc', int_field=4))
+        self.assertNotEqual(self.object_, self.cls(record_id='def'))
+        self.assertEqual(self.cls(record_id=''), self.cls())
+        self.assertEqual(
+            fgr.core.meta.Base.__hash__(self.object_),
+            hash(self.object_)
+            )
+        self.assertEqual(
+            len({mocking.Derivative(secondary_key=i % 3) for i in range(9)}),
+            3
+            )
+
+    def test_02_unhashable(self):
+        """Test objects with unhashable hash_fields values hash."""
+
+        q = fgr.core.query.Query()
+        q.sorting.append(fgr.core.query.QuerySortBy(field='a'))
+        self.assertEqual(hash(q), fgr.core.meta._hash_str(q))
+
+    def test_03_cached(self):
+        """Test hash is cached until a hash field is assigned."""
+
+        h = hash(self.object_)
+        self.assertEqual(
+            getattr(self.object_, fgr.core.meta.Constants.HASH_SLOT),
+            h
+            )
+        self.object_.int_field = 5
+        self.assertEqual(
+            getattr(self.object_, fgr.core.meta.Constants.HASH_SLOT),
+            h
+            )
+        self.object_['record_id'] = 'def'
+        self.assertIsNone(
+            getattr(self.object_, fgr.core.meta.Constants.HASH_SLOT)
+            )
+        self.assertEqual(hash(self.object_), hash(self.cls(record_id='def')))
+
+    def test_04_inherited(self):
+        """Test hash caching inherited (and validated) by derivatives."""
+
+        object_ = mocking.CachedHashSubDeriv(record_id='abc')
+        hash(object_)
+        object_.record_id = 'def'
+        object_.int_field = '7'
+        self.assertTrue(mocking.CachedHashSubDeriv.__cache_hash__)
+        self.assertEqual(object_, self.cls(record_id='def'))
+        self.assertEqual(object_.int_field, 7)
+        self.assertNotIn(
+            fgr.core.meta.Constants.HASH_SLOT,
+            mocking.CachedHashSubDeriv.__slots__
+            )
+
+    def test_05_off_by_default(self):
+        """Test hash is not cached by default."""
+
+        self.assertFalse(mocking.Derivative.__cache_hash__)
+        self.assertFalse(
+            hasattr(mocking.Derivative, fgr.core.meta.Constants.HASH_SLOT)
+            )
+
+    def test_06_unhashable_uncompiled(self):
+        """Test uncompiled hash falls back to string form when unhashable."""
+
+        q = fgr.core.query.Query()
+        q.sorting.append(fgr.core.query.QuerySortBy(field='a'))
+        self.assertEqual(
+            fgr.core.meta.Base.__hash__(q),
+            fgr.core.meta._hash_str(q)
+            )
+
+    def test_07_slot_setter_fallback(self):
+        """Test slot setter falls back to object.__setattr__ for non-slots."""
+
+        class Plain:
+            value = None
+
+        object_ = Plain()
+        fgr.core.meta._slot_setter(Plain, 'value')(object_, 1)
+        fgr.core.meta._slot_setter(Plain, 'other')(object_, 2)
+        self.assertEqual((object_.value, vars(object_)['other']), (1, 2))
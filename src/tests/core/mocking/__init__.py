@@ -95,3 +95,34 @@ class AntiTripDeriv(DubDeriv, MixinDeriv):
     new_deriv: fgr.Field[NewDeriv] = NewDeriv()
     dict_field: fgr.Field[dict] = {'record_id': 321}
     generic_dict_field: fgr.Field[dict[str, str]] = {'record_id': '123'}
+
+
+class ValidatedDeriv(fgr.Object, validate_assignment=True):
+
+    int_field: fgr.Field[int] = 2
+    non_nullable_field: fgr.Field[str] = fgr.Field(
+        default='not_null',
+        nullable=False,
+        )
+    new_deriv: fgr.Field[NewDeriv] = None
+    generic_tuple_field: fgr.Field[tuple[int, ...]] = ()
+    optional_int_field: fgr.Field[typing.Optional[int]] = None
+    optional_str_field: fgr.Field[typing.Optional[str]] = None
+    optional_bool_field: fgr.Field[typing.Optional[bool]] = None
+
+
+class ValidatedSubDeriv(ValidatedDeriv):
+
+    bool_field: fgr.Field[bool] = False
+
+
+class CachedHashDeriv(fgr.Object, cache_hash=True):
+
+    record_id: fgr.Field[str] = None
+    int_field: fgr.Field[int] = 2
+    list_field: fgr.Field[list[str]] = []
+
+
+class CachedHashSubDeriv(CachedHashDeriv, validate_assignment=True):
+
+    bool_field: fgr.Field[bool] = False
@@ -11,3 +11,21 @@ class Pet(fgr.Object):
     type: fgr.Field[str]
     in_: fgr.Field[str]
     is_tail_wagging: fgr.Field[bool] = True
+
+
+class Dog(fgr.Object):
+    """A dog."""
+
+    id_: fgr.Field[str]
+    name: fgr.Field[str]
+    age: fgr.Field[int] = None
+    tags: fgr.Field[list] = []
+
+
+DOGS = [
+    Dog(id='1', name='fido', age=3, tags=['good']),
+    Dog(id='2', name='fidi', age=None),
+    Dog(id='3', name='rex', age=5, tags=['good', 'loud']),
+    Dog(id='4', name='buddy', age=2),
+    Dog(id='5', name='Fido', age=7, tags=['loud']),
+    ]
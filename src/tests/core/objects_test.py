@@ -1,4 +1,9 @@
+import datetime
+import decimal
+import io
+import json
 import unittest
+import unittest.mock
 
 import fgr
 
@@ -159,3 +164,213 @@ class TestObjectDocumentationExamples(unittest.TestCase):
                 self.new_name
                 )
             )
+
+
+class TestObjectRecords(unittest.TestCase):
+    """Fixture for testing batch record conversion."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Pet
+        self.records = [
+            {'id': 'abc123', 'name': 'Bob', 'isTailWagging': False},
+            {'id': 'abc124', 'name': 'Ted', 'isTailWagging': True},
+            {'id_': 'abc125', 'type': 'cat'},
+            ]
+        return super().setUp()
+
+    def test_01_from_records(self):
+        """Test from_records matches per record instantiation."""
+
+        self.assertListEqual(
+            [dict(obj) for obj in self.cls.from_records(self.records)],
+            [dict(self.cls(record)) for record in self.records]
+            )
+
+    def test_02_from_records_non_dict(self):
+        """Test from_records passes non dict records to constructor."""
+
+        object_ = self.cls(id='abc126')
+        self.assertEqual(self.cls.from_records([object_])[0], object_)
+
+    def test_03_from_records_key_error(self):
+        """Test from_records raises on undefined fields."""
+
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: self.cls.from_records([{'field_that_does_not_exist': 1}])
+            )
+
+    def test_04_from_records_mutable_defaults(self):
+        """Test from_records copies mutable defaults."""
+
+        objects = mocking.TripDeriv.from_records([{}, {}])
+        self.assertIsNot(objects[0].dict_field, objects[1].dict_field)
+
+    def test_05_to_records(self):
+        """Test to_records matches per object to_dict."""
+
+        objects = [*self.cls.from_records(self.records), mocking.TripDeriv()]
+        self.assertListEqual(
+            fgr.Object.to_records(objects, camel_case=True, include_null=False),
+            [obj.to_dict(True, False) for obj in objects]
+            )
+
+    def test_06_from_records_shapes_max(self):
+        """Test records of shapes beyond the cache max use __init__."""
+
+        class Shapes(fgr.Object):
+
+            id_: fgr.Field[str] = None
+            name: fgr.Field[str] = None
+
+        with unittest.mock.patch.object(
+            fgr.core.meta.Constants,
+            'RECORD_SHAPES_MAX',
+            1
+            ):
+            objects = Shapes.from_records(
+                [{'id': 'a'}, {'name': 'b'}, {'id': 'c', 'name': 'd'}]
+                )
+            self.assertListEqual(list(Shapes.__cache__['from_record']), [('id', )])
+            self.assertIs(
+                fgr.core.meta._compile_from_record(Shapes, ('name', )),
+                Shapes
+                )
+        self.assertListEqual(
+            objects,
+            [Shapes(id='a'), Shapes(name='b'), Shapes(id='c', name='d')]
+            )
+
+    def test_07_from_records_post_init(self):
+        """Test from_records calls __post_init__."""
+
+        class PostInit(fgr.Object):
+
+            name: fgr.Field[str] = None
+            label: fgr.Field[str] = None
+
+            def __post_init__(self) -> None:
+                self.label = self.name and self.name.upper()
+
+        self.assertEqual(PostInit.from_records([{'name': 'a'}])[0].label, 'A')
+
+    def test_08_from_records_redefined_default(self):
+        """Test from_records uses redefined defaults before __init__."""
+
+        class Redefined(fgr.Object):
+
+            id_: fgr.Field[str] = None
+            value: fgr.Field[int] = 1
+
+        self.assertEqual(Redefined.from_records([{'id': 'a'}])[0].value, 1)
+        self.assertNotIn(Redefined, fgr.core.meta.COMPILED)
+        Redefined['value'] = fgr.Field(name='value', type=int, default=2)
+        self.assertEqual(Redefined.from_records([{'id': 'a'}])[0].value, 2)
+        self.assertEqual(
+            Redefined.from_json('{"id": "a"}').value,
+            Redefined().value
+            )
+
+
+class TestObjectJson(unittest.TestCase):
+    """Fixture for testing JSON decoding."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.TripDeriv
+        self.object_ = self.cls(required_field=3, tuple_field=(3, 4))
+        self.data = ''.join(fgr.core.codec.iterencode(self.object_))
+        return super().setUp()
+
+    def test_01_from_json_round_trip(self):
+        """Test from_json restores field types, including nested objects."""
+
+        object_ = self.cls.from_json(self.data)
+        for name in self.cls.__fields__:
+            with self.subTest(name=name):
+                if name == 'decimal_field':
+                    self.assertIsInstance(object_[name], decimal.Decimal)
+                else:
+                    self.assertEqual(object_[name], self.object_[name])
+        self.assertIsInstance(object_.new_deriv, mocking.NewDeriv)
+        self.assertIsInstance(
+            object_.new_deriv.generic_tuple_deriv_field[0],
+            mocking.MixinDeriv
+            )
+        self.assertIsInstance(object_.datetime_field, datetime.datetime)
+
+    def test_02_from_json_coercion(self):
+        """Test from_json coerces strings and nested JSON."""
+
+        object_ = mocking.Derivative.from_json(
+            json.dumps(
+                {
+                    'intField': '7',
+                    'boolField': 'false',
+                    'forwardRefField': json.dumps([{'strField': 'nested'}]),
+                    'nullField': None,
+                    'dateField': 'not a date',
+                    }
+                )
+            )
+        self.assertEqual(object_.int_field, 7)
+        self.assertIs(object_.bool_field, False)
+        self.assertIsInstance(object_.forward_ref_field[0], mocking.Derivative)
+        self.assertEqual(object_.forward_ref_field[0].str_field, 'nested')
+        self.assertEqual(object_.date_field, 'not a date')
+
+    def test_03_from_json_errors(self):
+        """Test from_json raises on invalid documents."""
+
+        for data in ('[1, 2]', '"a"', 'null'):
+            with self.subTest(data=data):
+                self.assertRaises(
+                    fgr.core.exceptions.InvalidJSONDocumentError,
+                    lambda: self.cls.from_json(data)  # noqa: B023
+                    )
+        self.assertRaises(ValueError, lambda: self.cls.from_json('1'))
+        self.assertRaises(
+            fgr.core.exceptions.InvalidFieldRedefinitionError,
+            lambda: self.cls.from_json('{"fieldThatDoesNotExist": 1}')
+            )
+
+    def test_04_from_json_lines(self):
+        """Test from_json_lines decodes one object per non-blank line."""
+
+        lines = io.BytesIO(
+            b'\n'.join(
+                (
+                    b'{"id": "a1", "name": "fido"}',
+                    b'',
+                    b'{"id": "a2", "isTailWagging": "false"}',
+                    )
+                )
+            )
+        pets = mocking.examples.Pet.from_json_lines(lines)
+        self.assertListEqual(
+            pets,
+            [
+                mocking.examples.Pet(id='a1', name='fido'),
+                mocking.examples.Pet(id='a2', is_tail_wagging=False),
+                ]
+            )
+
+    def test_05_from_json_shapes_max(self):
+        """Test documents of shapes beyond the cache max are decoded."""
+
+        class Shapes(fgr.Object):
+
+            id_: fgr.Field[str] = None
+            count: fgr.Field[int] = None
+
+        with unittest.mock.patch.object(
+            fgr.core.meta.Constants,
+            'RECORD_SHAPES_MAX',
+            1
+            ):
+            objects = [
+                Shapes.from_json(data)
+                for data
+                in ('{"id": "a"}', '{"count": "2", "id": null}')
+                ]
+        self.assertEqual(len(Shapes.__cache__['from_json']), 1)
+        self.assertListEqual(objects, [Shapes(id='a'), Shapes(count=2)])
@@ -0,0 +1,201 @@
+import itertools
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestOptimizer(unittest.TestCase):
+    """Fixture for testing query optimization."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Dog
+        self.objects = mocking.examples.DOGS
+        return super().setUp()
+
+    def optimize(self, q: fgr.core.query.Query) -> fgr.core.query.Query:
+        return fgr.core.optimizer.optimize(q, self.cls)
+
+    def unoptimized(self, q: fgr.core.query.Query) -> list:
+        namespace = {'_similarity': fgr.core.similarity.score}
+        expression = fgr.core.engine._expression(q, self.cls, namespace)
+        exec(f'def predicate(o):\n    return {expression}', namespace)
+        return [o for o in self.objects if namespace['predicate'](o)]
+
+    def test_01_merge_ranges(self):
+        """Test range conditions on a field merge to the tightest bounds."""
+
+        q = (
+            (self.cls.age > 1)
+            & (self.cls.age >= 3)
+            & (self.cls.age < 9)
+            & (self.cls.age <= 5)
+            & (self.cls.age <= 5)
+            )
+        self.assertEqual(
+            self.optimize(q),
+            fgr.core.query.and_(self.cls.age >= 3, self.cls.age <= 5)
+            )
+        self.assertEqual(
+            self.optimize((self.cls.age >= 3) & (self.cls.age > 3)),
+            self.cls.age > 3
+            )
+        self.assertEqual(
+            self.optimize((self.cls.age > 3) | (self.cls.age >= 3)),
+            self.cls.age >= 3
+            )
+        self.assertEqual(
+            self.optimize((self.cls.age < 2) | (self.cls.age < 4)),
+            self.cls.age < 4
+            )
+
+    def test_02_eq_implies(self):
+        """Test conditions implied by == are removed."""
+
+        q = (self.cls.age == 3) & (self.cls.age > 1) & (self.cls.age >= 3) & (self.cls.age != 4)
+        self.assertEqual(self.optimize(q), self.cls.age == 3)
+
+    def test_03_always_false(self):
+        """Test contradictions fold to an empty OrQuery."""
+
+        false = fgr.core.query.OrQuery(or_=[])
+        for q in (
+            (self.cls.age == 3) & (self.cls.age == 5),
+            (self.cls.age > 5) & (self.cls.age < 1),
+            (self.cls.age > 3) & (self.cls.age <= 3),
+            (self.cls.age == 3) & (self.cls.age != 3),
+            (self.cls.age == 7) & (self.cls.age < 5),
+            fgr.core.query.EqQueryCondition(field='age', eq=None)
+            & (self.cls.age > 1),
+            fgr.core.query.GtQueryCondition(field='age', gt=None),
+            fgr.core.query.GtQueryCondition(field='age', gt=None)
+            & (self.cls.name == 'rex'),
+            (self.cls.name % 'fido') & ~(self.cls.name % 'fido'),
+            ((self.cls.age == 3) & (self.cls.age == 5)) & (self.cls.name == 'rex'),
+            ):
+            with self.subTest(q=q):
+                self.assertEqual(self.optimize(q), false)
+                self.assertListEqual(fgr.core.engine.execute(q, self.objects), [])
+        self.assertEqual(
+            self.optimize(
+                ((self.cls.age == 3) & (self.cls.age == 5))
+                | (self.cls.name == 'rex')
+                ),
+            self.cls.name == 'rex'
+            )
+
+    def test_04_always_true(self):
+        """Test tautologies fold to an empty AndQuery."""
+
+        true = fgr.core.query.AndQuery(and_=[])
+        for q in (
+            (self.cls.age > 3) | ~(self.cls.age > 3),
+            (self.cls.name == 'rex') | (self.cls.name != 'rex'),
+            ~fgr.core.query.GtQueryCondition(field='age', gt=None),
+            ~fgr.core.query.GtQueryCondition(field='age', gt=None)
+            | (self.cls.name == 'rex'),
+            ((self.cls.age > 3) | ~(self.cls.age > 3)) | (self.cls.age == 1),
+            ):
+            with self.subTest(q=q):
+                self.assertEqual(self.optimize(q), true)
+        self.assertEqual(
+            self.optimize(
+                ((self.cls.age > 3) | ~(self.cls.age > 3))
+                & (self.cls.name == 'rex')
+                ),
+            self.cls.name == 'rex'
+            )
+
+    def test_05_selectivity_order(self):
+        """Test operands are reordered by estimated selectivity and cost."""
+
+        similar = self.cls.name % 'fido'
+        ne = self.cls.age != 3
+        contains = self.cls.tags << 'good'
+        eq = self.cls.name == 'rex'
+        self.assertListEqual(
+            self.optimize(similar & ne & contains & eq).and_,
+            [eq, contains, ne, similar]
+            )
+        self.assertListEqual(
+            self.optimize(eq | ne).or_,
+            [ne, eq]
+            )
+        self.assertListEqual(
+            fgr.core.optimizer.optimize(
+                ne & eq,
+                self.cls,
+                selectivity=lambda c: 0.01 if c.field == 'age' else None
+                ).and_,
+            [ne, eq]
+            )
+
+    def test_06_estimate(self):
+        """Test selectivity estimates."""
+
+        eq = self.cls.name == 'rex'
+        self.assertAlmostEqual(fgr.core.optimizer.estimate(eq & eq), 0.0025)
+        self.assertAlmostEqual(fgr.core.optimizer.estimate(eq | eq), 0.0975)
+        self.assertAlmostEqual(fgr.core.optimizer.estimate(~eq), 0.95)
+        self.assertEqual(fgr.core.optimizer.estimate(fgr.core.query.Query()), 1.0)
+
+    def test_07_sorting_and_limit(self):
+        """Test sorting and limit are kept."""
+
+        q = (self.cls.age > 1) & (self.cls.age > 2)
+        q -= self.cls.age.name
+        q.limit = 2
+        optimized = self.optimize(q)
+        self.assertEqual(optimized.limit, 2)
+        self.assertListEqual(
+            [s.field for s in optimized.sorting],
+            [self.cls.age.name]
+            )
+        self.assertListEqual(
+            fgr.core.engine.execute(q, self.objects),
+            [self.objects[4], self.objects[2]]
+            )
+
+    def test_08_incomparable_values(self):
+        """Test conditions with incomparable values are not merged."""
+
+        a = self.cls.age > 1
+        b = fgr.core.query.GtQueryCondition(field='age', gt='1')
+        c = fgr.core.query.EqQueryCondition(field='age', eq='1')
+        self.assertCountEqual(self.optimize(a & b).and_, [a, b])
+        self.assertCountEqual(self.optimize(a | b).or_, [a, b])
+        self.assertCountEqual(self.optimize(a & c).and_, [a, c])
+
+    def test_09_equivalent_results(self):
+        """Test optimized queries match the same objects."""
+
+        conditions = [
+            self.cls.age > 2,
+            self.cls.age <= 5,
+            self.cls.age == 3,
+            self.cls.age != 5,
+            fgr.core.query.EqQueryCondition(field='age', eq=None),
+            fgr.core.query.GtQueryCondition(field='age', gt=None),
+            fgr.core.query.Query(),
+            self.cls.name == 'rex',
+            self.cls.name % 'fido',
+            self.cls.tags << 'good',
+            ]
+        for a, b, c in itertools.combinations(conditions, 3):
+            for q in (a & b & ~c, (a | ~b) & c, ~(a & b) | c, (a | b) & (a | ~c)):
+                with self.subTest(q=q):
+                    self.assertListEqual(
+                        fgr.core.engine.execute(q, self.objects),
+                        self.unoptimized(q)
+                        )
+
+    def test_10_sql(self):
+        """Test optimized SQL compilation."""
+
+        sql, params = fgr.core.sql.to_sql(
+            (self.cls.age > 1) & (self.cls.age > 2),
+            self.cls,
+            optimize=True
+            )
+        self.assertTupleEqual(params, (2, ))
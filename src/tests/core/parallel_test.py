@@ -0,0 +1,134 @@
+import concurrent.futures
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+def _birthday(dog: mocking.examples.Dog) -> mocking.examples.Dog:
+    dog.age = (dog.age or 0) + 1
+    return dog
+
+
+def _name(dog: mocking.examples.Dog) -> str:
+    return dog.name
+
+
+class TestParallel(unittest.TestCase):
+    """Fixture for testing parallel processing of Objects."""
+
+    def setUp(self) -> None:
+        self.objects = [
+            mocking.examples.Dog(id=str(i), name=f'dog {i}', age=i)
+            for i
+            in range(25)
+            ]
+        self.executor = concurrent.futures.ThreadPoolExecutor(2)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+        return super().tearDown()
+
+    def test_01_process_pool(self):
+        """Test results from a process pool, in order."""
+
+        results = list(
+            fgr.core.parallel.map_objects(
+                _birthday,
+                self.objects,
+                chunk_size=4,
+                max_workers=2
+                )
+            )
+        self.assertListEqual(
+            [dog.age for dog in results],
+            list(range(1, 26))
+            )
+        self.assertEqual(self.objects[0].age, 0)
+
+    def test_02_ordered(self):
+        """Test non-Object results are yielded in order."""
+
+        self.assertListEqual(
+            list(
+                fgr.core.parallel.map_objects(
+                    _name,
+                    self.objects,
+                    chunk_size=3,
+                    executor=self.executor
+                    )
+                ),
+            [dog.name for dog in self.objects]
+            )
+
+    def test_03_unordered(self):
+        """Test unordered results include every result."""
+
+        self.assertCountEqual(
+            fgr.core.parallel.map_objects(
+                _name,
+                self.objects,
+                chunk_size=3,
+                ordered=False,
+                max_pending=2,
+                executor=self.executor
+                ),
+            [dog.name for dog in self.objects]
+            )
+
+    def test_04_backpressure(self):
+        """Test objects are consumed only as fast as results."""
+
+        consumed: list[mocking.examples.Dog] = []
+
+        def objects():
+            for object_ in self.objects:
+                consumed.append(object_)
+                yield object_
+
+        results = fgr.core.parallel.map_objects(
+            _name,
+            objects(),
+            chunk_size=2,
+            max_pending=3,
+            executor=self.executor
+            )
+        self.assertEqual(next(results), 'dog 0')
+        self.assertEqual(len(consumed), 6)
+        results.close()
+
+    def test_05_mixed_derivatives(self):
+        """Test chunks are split by derivative."""
+
+        objects = [*self.objects[:3], mocking.examples.Pet(), *self.objects[3:5]]
+        chunks = list(fgr.core.parallel._chunks(objects, 2))
+        self.assertListEqual(
+            [len(chunk) for chunk in chunks],
+            [2, 1, 1, 2]
+            )
+        self.assertIsInstance(chunks[0], fgr.core.frames.ObjectFrame)
+
+    def test_06_invalid_chunk_size(self):
+        """Test chunk_size must be positive."""
+
+        self.assertRaises(
+            ValueError,
+            lambda: fgr.core.parallel.map_objects(_name, self.objects, chunk_size=0)
+            )
+
+    def test_07_unordered_tail(self):
+        """Test unordered results still pending after submission are yielded."""
+
+        self.assertCountEqual(
+            fgr.core.parallel.map_objects(
+                _name,
+                self.objects,
+                chunk_size=10,
+                ordered=False,
+                max_pending=4,
+                executor=self.executor
+                ),
+            [dog.name for dog in self.objects]
+            )
@@ -161,3 +161,129 @@ class TestQuery(unittest.TestCase):
                 direction='desc'
                 )
             )
+
+    def test_16_flattened_chain(self):
+        """Test chained operators produce one n-ary query."""
+
+        a = self.cls.int_field >= 1
+        b = self.cls.int_field < 10
+        c = self.cls.str_field == 'abc'
+        ab = a | b
+        abc = ab | c
+        self.assertListEqual(abc.or_, [a, b, c])
+        self.assertListEqual(ab.or_, [a, b])
+        self.assertListEqual((c & ab & c).and_, [c, ab, c])
+        self.assertListEqual((a & (b & c)).and_, [a, b, c])
+
+    def test_17_sorted_not_flattened(self):
+        """Test sorted or limited queries are kept as operands."""
+
+        ab = (self.cls.int_field >= 1) | (self.cls.int_field < 10)
+        ab += self.cls.int_field.name
+        c = self.cls.str_field == 'abc'
+        self.assertListEqual((ab | c).or_, [ab, c])
+        ab.sorting.clear()
+        ab.limit = 1
+        self.assertListEqual((ab | c).or_, [ab, c])
+
+    def test_18_builders(self):
+        """Test n-ary and_ / or_ builders."""
+
+        qs = [self.cls.int_field == i for i in range(5)]
+        self.assertListEqual(fgr.core.query.or_(*qs).or_, qs)
+        self.assertListEqual(
+            fgr.core.query.and_(qs[0] & qs[1], *qs[2:]).and_,
+            qs
+            )
+        self.assertEqual(
+            fgr.core.query.or_(*qs),
+            fgr.core.query.OrQuery(or_=qs)
+            )
+        self.assertListEqual(fgr.core.query.and_().and_, [])
+
+    def test_19_canonical_order_insensitive(self):
+        """Test canonical key ignores operand order and duplicates."""
+
+        a = self.cls.int_field >= 1
+        b = self.cls.str_field == 'abc'
+        c = self.cls.bool_field != True
+        self.assertEqual(
+            fgr.core.query.canonical(a & (b | c)),
+            fgr.core.query.canonical((c | b | c) & a)
+            )
+        self.assertEqual(
+            fgr.core.query.canonical(a & a),
+            fgr.core.query.canonical(a)
+            )
+        self.assertNotEqual(
+            fgr.core.query.canonical(a & b),
+            fgr.core.query.canonical(a | b)
+            )
+
+    def test_20_canonical_invert_push_down(self):
+        """Test inversions are pushed down to conditions."""
+
+        a = self.cls.int_field >= 1
+        b = self.cls.str_field == 'abc'
+        self.assertEqual(
+            fgr.core.query.canonical(~(a | b)),
+            fgr.core.query.canonical(~a & (self.cls.str_field != 'abc'))
+            )
+        self.assertEqual(
+            fgr.core.query.canonical(~~a),
+            fgr.core.query.canonical(a)
+            )
+        self.assertNotEqual(
+            fgr.core.query.canonical(~a),
+            fgr.core.query.canonical(self.cls.int_field < 1)
+            )
+        self.assertEqual(
+            fgr.core.query.canonical(~fgr.core.query.Query()),
+            fgr.core.query.canonical(fgr.core.query.OrQuery(or_=[]))
+            )
+
+    def test_21_canonical_values(self):
+        """Test canonical key distinguishes values by type."""
+
+        eq = fgr.core.query.EqQueryCondition
+        self.assertNotEqual(
+            fgr.core.query.canonical(eq(field='x', eq=1)),
+            fgr.core.query.canonical(eq(field='x', eq=True))
+            )
+        for value in ([1, {2}], {'a': [1]}, fgr.core.query.QuerySortBy(field='y')):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    fgr.core.query.canonical(eq(field='x', eq=value)),
+                    fgr.core.query.canonical(eq(field='x', eq=value))
+                    )
+        self.assertEqual(
+            fgr.core.query.canonical(self.cls.str_field % 'a'),
+            fgr.core.query.canonical(
+                fgr.core.query.SimilarQueryCondition(field='str_field', like='a')
+                )
+            )
+        self.assertIsInstance(
+            hash(fgr.core.query.canonical(eq(field='x', eq=bytearray(b'a')))),
+            int
+            )
+
+    def test_22_normalize(self):
+        """Test normal form, aliases, sorting and limit."""
+
+        a = self.cls.int_field >= 1
+        b = self.cls.str_field == 'abc'
+        q = ~(a | b)
+        q -= 'strField'
+        q.limit = 3
+        normal = fgr.core.query.normalize(q, self.cls)
+        self.assertIsInstance(normal, fgr.core.query.AndQuery)
+        self.assertEqual(normal.sorting[0].field, 'str_field')
+        self.assertEqual(normal.limit, 3)
+        self.assertListEqual(q.invert.or_, [a, b])
+        self.assertEqual(
+            fgr.core.query.canonical(
+                fgr.core.query.EqQueryCondition(field='strField', eq='abc'),
+                self.cls
+                ),
+            fgr.core.query.canonical(b, self.cls)
+            )
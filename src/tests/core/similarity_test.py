@@ -0,0 +1,152 @@
+import random
+import unittest
+import unittest.mock
+
+import fgr
+
+
+class TestSimilarity(unittest.TestCase):
+    """Fixture for testing similarity scoring and indexing."""
+
+    def setUp(self) -> None:
+        rng = random.Random(42)
+        self.values = [
+            ''.join(rng.choice('abcdef ') for _ in range(rng.randint(0, 12)))
+            for _
+            in range(500)
+            ]
+        self.values[7] = None
+        self.values[11] = 123
+        self.index = fgr.core.similarity.TrigramIndex()
+        self.index.extend(enumerate(self.values))
+        return super().setUp()
+
+    def brute_force(self, like: str, threshold: float) -> list[int]:
+        return [
+            i
+            for i, value
+            in enumerate(self.values)
+            if (
+                value is not None
+                and fgr.core.similarity.score(value, like) >= threshold
+                )
+            ]
+
+    def test_01_score(self):
+        """Test score semantics."""
+
+        self.assertTupleEqual(
+            (
+                fgr.core.similarity.score('', ''),
+                fgr.core.similarity.score('fido', 'FIDO'),
+                fgr.core.similarity.score('abc', 'xyz'),
+                fgr.core.similarity.score('fido', 'fidi'),
+                ),
+            (1.0, 1.0, 0.0, 3 / 7)
+            )
+        self.assertSetEqual(
+            fgr.core.similarity.trigrams('Ab'),
+            {'  a', ' ab', 'ab '}
+            )
+
+    def test_02_search_matches_brute_force(self):
+        """Test search results are identical to scoring every value."""
+
+        for cost in (0, 10, 10 ** 9):
+            for like in ('abc', 'fed cab', 'a', '', '123', 'abcdefabcdef'):
+                for threshold in (0.2, 0.5, 0.85, 1.0):
+                    with (
+                        self.subTest(cost=cost, like=like, threshold=threshold),
+                        unittest.mock.patch.object(
+                            fgr.core.similarity.Constants,
+                            'RESCORE_COST',
+                            cost
+                            )
+                        ):
+                        self.assertListEqual(
+                            self.index.search(like, threshold),
+                            self.brute_force(like, threshold)
+                            )
+
+    def test_03_default_threshold(self):
+        """Test default threshold."""
+
+        self.assertListEqual(
+            self.index.search('abc'),
+            self.brute_force('abc', fgr.core.enums.MatchThreshold.default.value)
+            )
+
+    def test_04_threshold_bounds(self):
+        """Test non-positive and unsatisfiable thresholds."""
+
+        self.assertListEqual(
+            self.index.search('abc', 0),
+            [i for i, v in enumerate(self.values) if v is not None]
+            )
+        self.assertListEqual(self.index.search('abc', 1.5), [])
+        self.assertEqual(self.index.estimate('abc', 0), len(self.index.values))
+        self.assertEqual(self.index.estimate('abc', 1.5), 0)
+
+    def test_05_estimate(self):
+        """Test estimate bounds the number of values scored."""
+
+        self.assertGreaterEqual(
+            self.index.estimate('abc'),
+            len(set(map(str, self.index.search('abc'))))
+            )
+
+    def test_06_remove(self):
+        """Test removing rows."""
+
+        index = fgr.core.similarity.TrigramIndex()
+        index.extend(enumerate(['fido', 'fido', 'rex', None]))
+        self.assertEqual(len(index), 3)
+        index.remove(0, 'fido')
+        index.remove(2, 'rex')
+        index.remove(3, None)
+        index.remove(4, 'max')
+        self.assertEqual(len(index), 1)
+        self.assertListEqual(index.search('fido'), [1])
+        self.assertListEqual(index.search('rex'), [])
+
+    def test_07_remove_drops_postings(self):
+        """Test removing the last row for a value drops its postings."""
+
+        index = fgr.core.similarity.TrigramIndex()
+        index.extend(enumerate(['fido', 'fido', 'rex']))
+        postings = {
+            gram: {size: dict(value_ids) for size, value_ids in by_size.items()}
+            for gram, by_size
+            in index.postings.items()
+            }
+        for _ in range(100):
+            index.remove(0, 'fido')
+            index.remove(1, 'fido')
+            self.assertListEqual(index.search('fido'), [])
+            self.assertTrue(
+                fgr.core.similarity.trigrams('fido').isdisjoint(index.postings)
+                )
+            index.extend(((0, 'fido'), (1, 'fido')))
+        self.assertDictEqual(index.postings, postings)
+        self.assertEqual(len(index.values), 2)
+        self.assertListEqual(index.search('fido'), [0, 1])
+
+    def test_08_churn_matches_brute_force(self):
+        """Test search after removing and re-adding rows."""
+
+        for i, value in enumerate(self.values[:250]):
+            self.index.remove(i, value)
+        for i, value in enumerate(self.values[:100]):
+            self.values[i] = value = f'{value} x'
+            self.index.add(i, value)
+        self.values[100:250] = [None] * 150
+        self.assertEqual(
+            self.index.estimate('abc', 0),
+            len({str(v) for v in self.values if v is not None})
+            )
+        for threshold in (0.2, 0.5):
+            with self.subTest(threshold=threshold):
+                self.assertListEqual(
+                    self.index.search('abc def', threshold),
+                    self.brute_force('abc def', threshold)
+                    )
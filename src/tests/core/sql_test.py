@@ -0,0 +1,195 @@
+import json
+import sqlite3
+import unittest
+
+import fgr
+
+from . import mocking
+
+
+class TestSql(unittest.TestCase):
+    """Fixture for testing query to SQL compilation."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.examples.Dog
+        self.objects = mocking.examples.DOGS
+        self.connection = sqlite3.connect(':memory:')
+        fgr.core.sql.register_functions(self.connection)
+        self.connection.execute(
+            'CREATE TABLE dog (id TEXT, name TEXT, age INTEGER, tags TEXT)'
+            )
+        self.connection.executemany(
+            'INSERT INTO dog VALUES (?, ?, ?, ?)',
+            [
+                (obj.id_, obj.name, obj.age, json.dumps(obj.tags))
+                for obj
+                in self.objects
+                ]
+            )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.connection.close()
+        return super().tearDown()
+
+    def ids(self, q: fgr.core.query.Query) -> list[str]:
+        sql, params = fgr.core.sql.to_sql(q, self.cls)
+        return [row[0] for row in self.connection.execute(sql, params)]
+
+    def expected(self, q: fgr.core.query.Query) -> list[str]:
+        return [obj.id_ for obj in fgr.core.engine.execute(q, self.objects)]
+
+    def test_01_statement(self):
+        """Test statement and parameters."""
+
+        self.assertTupleEqual(
+            fgr.core.sql.to_sql(self.cls.name == 'rex', self.cls),
+            (
+                'SELECT "id", "name", "age", "tags" FROM "dog"'
+                ' WHERE ("name" IS ?)',
+                ('rex', )
+                )
+            )
+
+    def test_02_postgresql(self):
+        """Test postgresql dialect."""
+
+        q = (self.cls.age != 3) & (self.cls.tags << 'good')
+        self.assertTupleEqual(
+            fgr.core.sql.to_sql(
+                q,
+                self.cls,
+                table='dogs',
+                dialect='postgresql'
+                ),
+            (
+                'SELECT "id", "name", "age", "tags" FROM "dogs"'
+                ' WHERE (("age" IS DISTINCT FROM %s)'
+                ' AND COALESCE(%s = ANY("tags"), FALSE))',
+                (3, 'good')
+                )
+            )
+        self.assertIn(
+            'strpos("name", %s) > 0',
+            fgr.core.sql.to_sql(
+                self.cls.name << 'ex',
+                self.cls,
+                dialect=fgr.core.enums.SqlDialect.postgresql
+                )[0]
+            )
+
+    def test_03_results_match_engine(self):
+        """Test SQLite results match in-memory execution."""
+
+        for q in (
+            self.cls.name == 'rex',
+            self.cls.age != None,
+            self.cls.age == None,
+            self.cls.age != 3,
+            (self.cls.age > 2) & (self.cls.age <= 5),
+            self.cls.age < None,
+            ~(self.cls.age > 2),
+            self.cls.tags << 'loud',
+            ~(self.cls.tags << 'loud'),
+            self.cls.name << 'id',
+            self.cls.name % 'FIDO',
+            self.cls.name % ('fido', 0.1),
+            (self.cls.name == 'rex') | (self.cls.tags << 'good'),
+            fgr.core.query.OrQuery(
+                or_=[
+                    self.cls.name == 'rex',
+                    fgr.core.query.OrQuery(
+                        or_=[self.cls.name == 'fidi', self.cls.age > 6]
+                        ),
+                    ]
+                ),
+            fgr.core.query.AndQuery(and_=[]),
+            fgr.core.query.OrQuery(or_=[]),
+            fgr.core.query.Query(),
+            ):
+            with self.subTest(q=q):
+                self.assertListEqual(sorted(self.ids(q)), sorted(self.expected(q)))
+
+    def test_04_sort_limit(self):
+        """Test sorting and limit."""
+
+        q = (self.cls.age >= 5) | (self.cls.age < 3) | (self.cls.age == None)
+        q -= 'age'
+        q += 'name'
+        q.limit = 3
+        self.assertListEqual(self.ids(q), self.expected(q))
+        self.assertTrue(
+            fgr.core.sql.to_sql(q, self.cls)[0].endswith(
+                ' ORDER BY "age" DESC NULLS FIRST, "name" ASC NULLS LAST'
+                ' LIMIT ?'
+                )
+            )
+
+    def test_05_shape_cache(self):
+        """Test SQL text is cached per query shape."""
+
+        sql_a, params_a = fgr.core.sql.to_sql(self.cls.age > 1, self.cls)
+        sql_b, params_b = fgr.core.sql.to_sql(self.cls.age > 2, self.cls)
+        self.assertIs(sql_a, sql_b)
+        self.assertTupleEqual((params_a, params_b), ((1, ), (2, )))
+        self.assertIsNot(
+            sql_a,
+            fgr.core.sql.to_sql(self.cls.age >= 2, self.cls)[0]
+            )
+
+    def test_06_cache_bound(self):
+        """Test cache is bounded."""
+
+        class Cat(fgr.Object):
+            """A cat."""
+
+            name: fgr.Field[str]
+
+        for i in range(fgr.core.sql.Constants.SQL_SHAPES_MAX + 1):
+            fgr.core.sql.to_sql(Cat.name == 'a', Cat, table=f't{i}')
+        self.assertEqual(
+            len(Cat.__cache__['sql']),
+            fgr.core.sql.Constants.SQL_SHAPES_MAX
+            )
+
+    def test_07_camel_case(self):
+        """Test camel case columns and aliases."""
+
+        class Cat(fgr.Object):
+            """A cat."""
+
+            id_: fgr.Field[str]
+            is_tail_wagging: fgr.Field[bool]
+
+        self.assertEqual(
+            fgr.core.sql.to_sql(
+                Cat.is_tail_wagging == True,
+                Cat,
+                camel_case=True
+                )[0],
+            'SELECT "id", "isTailWagging" FROM "cat"'
+            ' WHERE ("isTailWagging" IS ?)'
+            )
+        q = fgr.core.query.EqQueryCondition(field='isTailWagging', eq=True)
+        self.assertIn(
+            '"is_tail_wagging" IS ?',
+            fgr.core.sql.to_sql(q, Cat)[0]
+            )
+
+    def test_08_invalid(self):
+        """Test invalid field and dialect raise."""
+
+        q = fgr.core.query.EqQueryCondition(field='nope', eq=1)
+        self.assertRaises(
+            fgr.core.exceptions.InvalidQueryFieldError,
+            fgr.core.sql.to_sql,
+            q,
+            self.cls
+            )
+        self.assertRaises(
+            ValueError,
+            fgr.core.sql.to_sql,
+            self.cls.age == 1,
+            self.cls,
+            dialect='mysql'
+            )
@@ -1,3 +1,4 @@
+import types
 import unittest
 
 import fgr
@@ -131,3 +132,101 @@ class TestUtils(unittest.TestCase):
         """Test utils key_for functions."""
 
         self.assertIsNone(fgr.core.utils.key_for(mocking.DubDeriv, 24))
+
+    def test_15_key_for_aliases(self):
+        """Test utils key_for resolves aliases from frozen table."""
+
+        cls = mocking.Derivative
+        for key in (
+            'secondary_key',
+            '_secondary_key',
+            'secondaryKey',
+            '_secondaryKey_',
+            'str_field_',
+            ):
+            with self.subTest(key=key):
+                self.assertIn(key, cls.__aliases__)
+                self.assertEqual(
+                    fgr.core.utils.key_for(cls, key),
+                    cls.__aliases__[key]
+                    )
+        self.assertIsInstance(cls.__aliases__, types.MappingProxyType)
+
+    def test_16_key_for_unknown(self):
+        """Test utils key_for does not cache arbitrary keys."""
+
+        cls = mocking.examples.Dog
+        aliases = len(cls.__aliases__)
+        for i in range(1000):
+            self.assertIsNone(fgr.core.utils.key_for(cls, f'unknownKey{i}'))
+        self.assertEqual(fgr.core.utils.key_for(cls, '__id__'), 'id_')
+        self.assertEqual(len(cls.__aliases__), aliases)
+        self.assertNotIn('key_mappings', cls.__cache__)
+
+    def test_17_casing_memoized(self):
+        """Test casing conversions are memoized with statistics."""
+
+        for fn in (
+            fgr.core.utils.to_camel_case,
+            fgr.core.utils.camel_case_to_snake_case,
+            ):
+            with self.subTest(fn=fn.__name__):
+                fn('memoized_keyName')
+                hits = fn.cache_info().hits
+                fn('memoized_keyName')
+                self.assertEqual(fn.cache_info().hits, hits + 1)
+                self.assertEqual(
+                    fn.cache_info().maxsize,
+                    fgr.core.utils.Constants.CASING_CACHE_MAXSIZE
+                    )
+
+    def test_18_casing_ascii(self):
+        """Test ASCII casing conversions match general conversions."""
+
+        for s in (
+            'userID',
+            'HTTPServer',
+            'api_key2',
+            'x1Y2',
+            '_id_',
+            'a--b',
+            '1abc',
+            'created-at',
+            ):
+            with self.subTest(s=s):
+                self.assertEqual(
+                    fgr.core.utils.to_camel_case.__wrapped__(s),
+                    fgr.core.utils._to_camel_case(s)
+                    )
+                self.assertEqual(
+                    fgr.core.utils.camel_case_to_snake_case.__wrapped__(s),
+                    fgr.core.utils._camel_case_to_snake_case(s)
+                    )
+
+    def test_19_casing_non_ascii(self):
+        """Test non-ASCII strings fall back to general conversions."""
+
+        for s, camel_case, snake_case in (
+            ('größe_wert', 'größeWert', 'größe_wert'),
+            ('Über_daten', 'überDaten', 'über_daten'),
+            ('naïveValue', 'naïveValue', 'naïve_value'),
+            ('éclairID', 'éclairID', 'éclair_ID'),
+            ):
+            with self.subTest(s=s):
+                self.assertEqual(fgr.core.utils.to_camel_case(s), camel_case)
+                self.assertEqual(
+                    fgr.core.utils.camel_case_to_snake_case(s),
+                    snake_case
+                    )
+
+    def test_20_aliases_underscore_names(self):
+        """Test alias tables resolve field names of only underscores."""
+
+        fields = frozenset(('_', '__', 'value'))
+        aliases = fgr.core.utils.get_aliases(fields, True)
+        for key in ('_', '__', 'value', '_value_'):
+            with self.subTest(key=key):
+                self.assertEqual(
+                    aliases[key],
+                    fgr.core.utils._resolve_key(fields, True, key)
+                    )